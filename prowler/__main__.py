@@ -26,6 +26,8 @@ from prowler.lib.check.compliance import update_checks_metadata_with_compliance
 from prowler.lib.cli.parser import ProwlerArgumentParser
 from prowler.lib.logger import logger, set_logging_config
 from prowler.lib.outputs.compliance import display_compliance_table
+from prowler.lib.outputs.file_descriptors import Output_Session
+from prowler.lib.outputs.findings_aggregator import Findings_Aggregator
 from prowler.lib.outputs.html import add_html_footer, fill_html_overview_statistics
 from prowler.lib.outputs.json import close_json
 from prowler.lib.outputs.outputs import extract_findings_statistics, send_to_s3_bucket
@@ -157,18 +159,40 @@ def prowler():
         sys.exit()
 
     # Execute checks
-    findings = []
+    # The findings are streamed to the outputs and only their counters are kept
+    findings_aggregator = Findings_Aggregator()
+    audit_output_options.findings_aggregator = findings_aggregator
     if len(checks_to_execute):
-        findings = execute_checks(
-            checks_to_execute, provider, audit_info, audit_output_options
-        )
+        # Open the output files once for the whole execution
+        if audit_output_options.output_modes:
+            audit_output_options.output_session = Output_Session(
+                audit_output_options.output_modes,
+                audit_output_options.output_directory,
+                audit_output_options.output_filename,
+                audit_info,
+            )
+        try:
+            execute_checks(
+                checks_to_execute,
+                provider,
+                audit_info,
+                audit_output_options,
+                # Parallel execution and prefetch are only supported by the AWS provider
+                args.parallel_checks if provider == "aws" else 1,
+                args.prefetch_workers if provider == "aws" else 0,
+            )
+        finally:
+            # Flush the output files before closing the JSON and HTML formats
+            if audit_output_options.output_session:
+                audit_output_options.output_session.close()
+                audit_output_options.output_session = None
     else:
         logger.error(
             "There are no checks to execute. Please, check your input arguments"
         )
 
     # Extract findings stats
-    stats = extract_findings_statistics(findings)
+    stats = extract_findings_statistics(findings_aggregator)
 
     if args.slack:
         if "SLACK_API_TOKEN" in os.environ and "SLACK_CHANNEL_ID" in os.environ:
@@ -224,17 +248,17 @@ def prowler():
     # Display summary table
     if not args.only_logs:
         display_summary_table(
-            findings,
+            findings_aggregator,
             audit_info,
             audit_output_options,
             provider,
         )
 
-        if compliance_framework and findings:
+        if compliance_framework and findings_aggregator.total_findings:
             for compliance in compliance_framework:
                 # Display compliance table
                 display_compliance_table(
-                    findings,
+                    findings_aggregator,
                     bulk_checks_metadata,
                     compliance,
                     audit_output_options.output_filename,
@@ -38,6 +38,8 @@ for provider in ["aws", "gcp"]:
 aws_services_json_file = "aws_regions_by_service.json"
 
 # gcp_zones_json_file = "gcp_zones.json"
+# GCP discovery documents not bundled with googleapiclient, kept across the executions
+gcp_discovery_cache_directory = f"{pathlib.Path.home()}/.prowler/gcp_discovery_cache"
 
 default_output_directory = getcwd() + "/output"
 
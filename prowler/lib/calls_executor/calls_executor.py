@@ -0,0 +1,60 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from prowler.lib.logger import logger
+
+
+class Calls_Executor:
+    """
+    Calls_Executor runs the calls of the services of a provider, one per item like a region, a project
+    or a subscription, in one shared thread pool. A call made from one of its workers runs inline in the
+    worker, to not wait on its own pool. The providers extend run_call to retry the calls, and
+    run_worker_call to limit the calls running in the pool.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "prowler"):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self.worker_context = threading.local()
+
+    def run_call(self, call, item):
+        """Run the call for the item, in a worker or inline"""
+        return call(item)
+
+    def run_worker_call(self, call, item):
+        """Run the call for the item in a worker of the pool"""
+        self.worker_context.running = True
+        try:
+            return self.run_call(call, item)
+        finally:
+            self.worker_context.running = False
+
+    def log_call_error(self, call, item, error: Exception):
+        logger.error(
+            f"{call.__qualname__} -- {item} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+    def run_calls(self, call, items) -> list:
+        """Run the call for every item and return the (item, result) of the calls that succeed, in the items order"""
+        items = list(items)
+        if getattr(self.worker_context, "running", False):
+            futures = None
+        else:
+            futures = [
+                self.executor.submit(self.run_worker_call, call, item) for item in items
+            ]
+        results = []
+        for index, item in enumerate(items):
+            try:
+                results.append(
+                    (
+                        item,
+                        futures[index].result()
+                        if futures is not None
+                        else self.run_call(call, item),
+                    )
+                )
+            except Exception as error:
+                self.log_call_error(call, item, error)
+        return results
@@ -1,10 +1,13 @@
+import ast
 import functools
 import importlib
+import importlib.util
 import os
 import re
 import shutil
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pkgutil import walk_packages
 from types import ModuleType
 from typing import Any
@@ -14,7 +17,7 @@ from colorama import Fore, Style
 
 from prowler.config.config import orange_color
 from prowler.lib.check.compliance_models import load_compliance_framework
-from prowler.lib.check.models import Check, load_check_metadata
+from prowler.lib.check.models import Check, Check_Metadata_Model, load_check_metadata
 from prowler.lib.logger import logger
 
 try:
@@ -403,11 +406,26 @@ def run_check(check: Check, output_options: Provider_Output_Options) -> list:
         return findings
 
 
+def collect_findings(
+    all_findings: list,
+    check_findings: list,
+    audit_output_options: Provider_Output_Options,
+):
+    """Add the reported findings to the running aggregator if set, otherwise keep them in all_findings"""
+    findings_aggregator = getattr(audit_output_options, "findings_aggregator", None)
+    if findings_aggregator:
+        findings_aggregator.add_findings(check_findings)
+    else:
+        all_findings.extend(check_findings)
+
+
 def execute_checks(
     checks_to_execute: list,
     provider: str,
     audit_info: Any,
     audit_output_options: Provider_Output_Options,
+    parallel_checks: int = 1,
+    prefetch_workers: int = 0,
 ) -> list:
     # List to store all the check's findings
     all_findings = []
@@ -439,8 +457,23 @@ def execute_checks(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    # Build the service clients before the checks execution with the --prefetch-workers flag
+    if prefetch_workers > 0:
+        prefetch_service_clients(checks_to_execute, provider, prefetch_workers)
+
+    # Execution with the --parallel-checks flag
+    if parallel_checks > 1:
+        all_findings = execute_checks_in_parallel(
+            checks_to_execute,
+            provider,
+            audit_info,
+            audit_output_options,
+            services_executed,
+            checks_executed,
+            parallel_checks,
+        )
     # Execution with the --only-logs flag
-    if audit_output_options.only_logs:
+    elif audit_output_options.only_logs:
         for check_name in checks_to_execute:
             # Recover service from check name
             service = check_name.split("_")[0]
@@ -454,7 +487,7 @@ def execute_checks(
                     services_executed,
                     checks_executed,
                 )
-                all_findings.extend(check_findings)
+                collect_findings(all_findings, check_findings, audit_output_options)
 
             # If check does not exists in the provider or is from another provider
             except ModuleNotFoundError:
@@ -500,7 +533,7 @@ def execute_checks(
                         services_executed,
                         checks_executed,
                     )
-                    all_findings.extend(check_findings)
+                    collect_findings(all_findings, check_findings, audit_output_options)
                     bar()
 
                 # If check does not exists in the provider or is from another provider
@@ -518,6 +551,302 @@ def execute_checks(
     return all_findings
 
 
+def recover_imported_service_clients(
+    module_path: str, provider: str, visited_modules: set
+) -> list:
+    """recover_imported_service_clients returns the service client modules imported by the given module
+
+    The module is not imported, its source is parsed to avoid building any service client. The provider's
+    service modules imported by it (e.g. services' lib modules) are parsed recursively, but service clients
+    loaded dynamically (e.g. with importlib) are not detected, so they are built during the checks execution.
+    """
+    service_clients = []
+    visited_modules.add(module_path)
+    module_spec = importlib.util.find_spec(module_path)
+    if not module_spec or not module_spec.origin:
+        return service_clients
+    with open_file(module_spec.origin) as module_file:
+        module_tree = ast.parse(module_file.read())
+
+    imported_modules = []
+    for node in ast.walk(module_tree):
+        if isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            imported_modules.append(node.module)
+        elif isinstance(node, ast.Import):
+            imported_modules.extend(alias.name for alias in node.names)
+
+    services_module_path = f"prowler.providers.{provider}.services."
+    for imported_module in imported_modules:
+        if (
+            not imported_module.startswith(services_module_path)
+            or imported_module in visited_modules
+        ):
+            continue
+        # Format: "prowler.providers.{provider}.services.{service}.{service}_client"
+        if imported_module.endswith("_client"):
+            visited_modules.add(imported_module)
+            service_clients.append(imported_module)
+        else:
+            try:
+                service_clients.extend(
+                    recover_imported_service_clients(
+                        imported_module, provider, visited_modules
+                    )
+                )
+            except ModuleNotFoundError:
+                continue
+    return service_clients
+
+
+def recover_service_clients_from_checks(checks_to_execute: list, provider: str) -> list:
+    """recover_service_clients_from_checks returns the service client modules imported by the checks to execute"""
+    service_clients = []
+    visited_modules = set()
+    for check_name in checks_to_execute:
+        # Recover service from check name
+        service = check_name.split("_")[0]
+        check_module_path = (
+            f"prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+        )
+        try:
+            check_service_clients = recover_imported_service_clients(
+                check_module_path, provider, visited_modules
+            )
+            if not check_service_clients:
+                logger.debug(f"{check_name} - No new service clients found to prefetch")
+            service_clients.extend(check_service_clients)
+        # If check does not exists, it will be reported during its execution
+        except ModuleNotFoundError:
+            continue
+        except Exception as error:
+            logger.error(
+                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+    return service_clients
+
+
+@functools.lru_cache(maxsize=None)
+def recover_check_service_attributes(check_name: str, provider: str) -> dict:
+    """recover_check_service_attributes returns the optional attributes read by the check of every service client it imports
+
+    The attributes are declared per service client in the ServiceAttributes of the check's metadata, like
+    {"ec2": ["user_data"]}. The service clients whose attributes are not declared are returned with None,
+    so their services gather all their optional attributes for the check.
+    """
+    # Recover service from check name
+    service = check_name.split("_")[0]
+    check_module_path = (
+        f"prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+    )
+    try:
+        service_clients = recover_imported_service_clients(
+            check_module_path, provider, set()
+        )
+    # If check does not exists, it will be reported during its execution
+    except ModuleNotFoundError:
+        return {}
+    # Format: "prowler.providers.{provider}.services.{service}.{client}_client"
+    check_attributes = {
+        service_client.rsplit(".", 1)[1][: -len("_client")]: None
+        for service_client in service_clients
+    }
+    if not check_attributes:
+        return check_attributes
+    try:
+        metadata_file = (
+            importlib.util.find_spec(check_module_path).origin[:-3] + ".metadata.json"
+        )
+        service_attributes = (
+            Check_Metadata_Model.parse_file(metadata_file).ServiceAttributes or {}
+        )
+    except Exception as error:
+        logger.error(
+            f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return check_attributes
+    for client in check_attributes:
+        check_attributes[client] = service_attributes.get(client)
+    return check_attributes
+
+
+def prefetch_service_clients(
+    checks_to_execute: list, provider: str, prefetch_workers: int
+):
+    """prefetch_service_clients builds concurrently all the service clients required by the checks to execute
+
+    Every service client is built importing its module, so the checks reuse it once they import it.
+    """
+    service_clients = recover_service_clients_from_checks(checks_to_execute, provider)
+    logger.info(
+        f"Prefetching {len(service_clients)} service clients with {prefetch_workers} workers ..."
+    )
+    with ThreadPoolExecutor(
+        max_workers=prefetch_workers, thread_name_prefix="prowler-prefetch"
+    ) as executor:
+        futures = {
+            executor.submit(import_check, client_module_path): client_module_path
+            for client_module_path in service_clients
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            # Errors building the service clients will be reported again by the checks
+            except Exception as error:
+                logger.error(
+                    f"{futures[future]} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+    logger.info("Service clients prefetched")
+
+
+def execute_checks_in_parallel(
+    checks_to_execute: list,
+    provider: str,
+    audit_info: Any,
+    audit_output_options: Provider_Output_Options,
+    services_executed: set,
+    checks_executed: set,
+    parallel_checks: int,
+) -> list:
+    """execute_checks_in_parallel runs the checks of each service in a pool of parallel_checks workers
+
+    The checks are grouped by service, so every service client is built once by the first check of its
+    group, and the groups are executed concurrently. The findings are reported, and the Audit Metadata
+    updated, from the calling thread following the order of checks_to_execute.
+    """
+    all_findings = []
+    # Check that all the checks exist before starting the execution
+    for check_name in checks_to_execute:
+        service = check_name.split("_")[0]
+        check_module_path = (
+            f"prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+        )
+        try:
+            check_spec = importlib.util.find_spec(check_module_path)
+        except ModuleNotFoundError:
+            check_spec = None
+        if not check_spec:
+            logger.critical(
+                f"Check '{check_name}' was not found for the {provider.upper()} provider"
+            )
+            sys.exit(1)
+
+    # Group the checks by service keeping the input order
+    checks_by_service = {}
+    for check_name in checks_to_execute:
+        service = check_name.split("_")[0]
+        checks_by_service.setdefault(service, []).append(check_name)
+
+    # Store the checks' results as they complete: check_name -> (findings, error)
+    completed_checks = {}
+    next_check = 0
+
+    def report_completed_checks(executor, bar=None):
+        nonlocal next_check
+        # Report only the checks whose predecessors have been reported to keep the findings order
+        while (
+            next_check < len(checks_to_execute)
+            and checks_to_execute[next_check] in completed_checks
+        ):
+            check_name = checks_to_execute[next_check]
+            service = check_name.split("_")[0]
+            check_findings, error = completed_checks.pop(check_name)
+            next_check += 1
+            if bar:
+                bar.title = (
+                    f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
+                )
+            try:
+                if error:
+                    raise error
+
+                # Update Audit Status
+                services_executed.add(service)
+                checks_executed.add(check_name)
+                audit_info.audit_metadata = update_audit_metadata(
+                    audit_info.audit_metadata, services_executed, checks_executed
+                )
+
+                # Report the check's findings
+                report(check_findings, audit_output_options, audit_info)
+                collect_findings(all_findings, check_findings, audit_output_options)
+                if bar:
+                    bar()
+
+            # If check does not exists in the provider or is from another provider
+            except ModuleNotFoundError:
+                logger.critical(
+                    f"Check '{check_name}' was not found for the {provider.upper()} provider"
+                )
+                if bar:
+                    bar.title = f"-> {Fore.RED}Scan was aborted!{Style.RESET_ALL}"
+                # Cancel the pending services, only the running ones are awaited
+                executor.shutdown(wait=False, cancel_futures=True)
+                sys.exit(1)
+            except Exception as error:
+                logger.error(
+                    f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+
+    def run_parallel_checks(bar=None):
+        with ThreadPoolExecutor(max_workers=parallel_checks) as executor:
+            futures = [
+                executor.submit(
+                    execute_service_checks,
+                    service,
+                    service_checks,
+                    provider,
+                    audit_output_options,
+                )
+                for service, service_checks in checks_by_service.items()
+            ]
+            for future in as_completed(futures):
+                completed_checks.update(future.result())
+                report_completed_checks(executor, bar)
+
+    if audit_output_options.only_logs:
+        run_parallel_checks()
+    else:
+        checks_num = len(checks_to_execute)
+        check_noun = "checks" if checks_num > 1 else "check"
+        print(
+            f"{Style.BRIGHT}Executing {checks_num} {check_noun} with {parallel_checks} parallel workers, please wait...{Style.RESET_ALL}\n"
+        )
+        with alive_bar(
+            total=checks_num,
+            ctrl_c=False,
+            bar="blocks",
+            spinner="classic",
+            stats=False,
+            enrich_print=False,
+        ) as bar:
+            run_parallel_checks(bar)
+            bar.title = f"-> {Fore.GREEN}Scan completed!{Style.RESET_ALL}"
+    return all_findings
+
+
+def execute_service_checks(
+    service: str,
+    service_checks: list,
+    provider: str,
+    audit_output_options: Provider_Output_Options,
+) -> dict:
+    """execute_service_checks runs sequentially the checks of a service and returns a dict with check_name -> (findings, error)"""
+    results = {}
+    for check_name in service_checks:
+        try:
+            # Import check module
+            check_module_path = f"prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+            lib = import_check(check_module_path)
+            # Recover functions from check
+            check_to_execute = getattr(lib, check_name)
+            c = check_to_execute()
+            # Run check
+            results[check_name] = (run_check(c, audit_output_options), None)
+        except Exception as error:
+            results[check_name] = ([], error)
+    return results
+
+
 def execute(
     service: str,
     check_name: str,
@@ -3,7 +3,7 @@ import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, PrivateAttr, ValidationError
 
 from prowler.lib.logger import logger
 
@@ -51,14 +51,31 @@ class Check_Metadata_Model(BaseModel):
     DependsOn: list[str]
     RelatedTo: list[str]
     Notes: str
+    # Optional attributes read by the check of the service clients it imports, like {"ec2": ["user_data"]},
+    # the services gather all of them for the checks not declaring them
+    ServiceAttributes: dict[str, list[str]] = None
     # We set the compliance to None to
     # store the compliance later if supplied
     Compliance: list = None
 
 
+class Check_Report_Metadata(Check_Metadata_Model):
+    """Check Metadata Model shared by all the findings of a check
+
+    Its fields cannot be reassigned, but the list fields (e.g. CheckType, Categories, DependsOn or
+    Compliance) are shared by all the findings of the check, so they must not be modified in place.
+    """
+
+    class Config:
+        allow_mutation = False
+
+
 class Check(ABC, Check_Metadata_Model):
     """Prowler Check"""
 
+    # Check's metadata shared by its findings, it is built once per check
+    _report_metadata: Check_Report_Metadata = PrivateAttr(default=None)
+
     def __init__(self, **data):
         """Check's init function. Calls the CheckMetadataModel init."""
         # Parse the Check's metadata file
@@ -71,9 +88,11 @@ class Check(ABC, Check_Metadata_Model):
         # Calls parents init function
         super().__init__(**data)
 
-    def metadata(self) -> dict:
-        """Return the JSON representation of the check's metadata"""
-        return self.json()
+    def metadata(self) -> Check_Report_Metadata:
+        """Return the check's metadata validated once and shared by all the check's findings"""
+        if self._report_metadata is None:
+            self._report_metadata = Check_Report_Metadata(**self.dict())
+        return self._report_metadata
 
     @abstractmethod
     def execute(self):
@@ -92,7 +111,11 @@ class Check_Report:
 
     def __init__(self, metadata):
         self.status = ""
-        self.check_metadata = Check_Metadata_Model.parse_raw(metadata)
+        # Reuse the already validated check's metadata instead of parsing it for every finding
+        if isinstance(metadata, Check_Metadata_Model):
+            self.check_metadata = metadata
+        else:
+            self.check_metadata = Check_Metadata_Model.parse_raw(metadata)
         self.status_extended = ""
         self.resource_details = ""
         self.resource_tags = []
@@ -18,6 +18,23 @@ def arn_type(arn: str) -> bool:
     return arn
 
 
+def int_type(minimum: int):
+    """int_type returns an argparse type that returns the integer value if it is not lower than minimum and raises an argparse.ArgumentTypeError if not."""
+
+    def validate_int(value: str) -> int:
+        try:
+            integer = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"{value} is not a valid integer")
+        if integer < minimum:
+            raise argparse.ArgumentTypeError(
+                f"{value} must be greater than or equal to {minimum}"
+            )
+        return integer
+
+    return validate_int
+
+
 class ProwlerArgumentParser:
     # Set the default parser
     def __init__(self):
@@ -414,6 +431,21 @@ Detailed documentation at https://docs.prowler.cloud
             help="Set the maximum attemps for the Boto3 standard retrier config (Default: 3)",
         )
 
+        # Execution
+        aws_execution_subparser = aws_parser.add_argument_group("Execution")
+        aws_execution_subparser.add_argument(
+            "--parallel-checks",
+            default=1,
+            type=int_type(minimum=1),
+            help="Number of services whose checks are executed in parallel. Default: 1 (sequential execution)",
+        )
+        aws_execution_subparser.add_argument(
+            "--prefetch-workers",
+            default=0,
+            type=int_type(minimum=0),
+            help="Number of workers to build concurrently the service clients required by the checks before executing them. Default: 0 (no prefetch)",
+        )
+
     def __init_azure_parser__(self):
         """Init the Azure Provider CLI parser"""
         azure_parser = self.subparsers.add_parser(
@@ -7,6 +7,7 @@ from tabulate import tabulate
 from prowler.config.config import orange_color, timestamp
 from prowler.lib.check.models import Check_Report
 from prowler.lib.logger import logger
+from prowler.lib.outputs.findings_aggregator import aggregate_findings
 from prowler.lib.outputs.models import (
     Check_Output_CSV_AWS_CIS,
     Check_Output_CSV_AWS_ISO27001_2013,
@@ -340,13 +341,15 @@ def fill_compliance(output_options, finding, audit_info, file_descriptors):
 
 
 def display_compliance_table(
-    findings: list,
+    findings,
     bulk_checks_metadata: dict,
     compliance_framework: str,
     output_filename: str,
     output_directory: str,
 ):
     try:
+        # The tables only depend on the number of findings by check and status
+        check_status_counts = aggregate_findings(findings).check_status_counts
         if "ens_rd2022_aws" == compliance_framework:
             marcos = {}
             ens_compliance_table = {
@@ -359,8 +362,8 @@ def display_compliance_table(
                 "Opcional": [],
             }
             pass_count = fail_count = 0
-            for finding in findings:
-                check = bulk_checks_metadata[finding.check_metadata.CheckID]
+            for (check_id, status), count in check_status_counts.items():
+                check = bulk_checks_metadata[check_id]
                 check_compliances = check.Compliance
                 for compliance in check_compliances:
                     if (
@@ -385,21 +388,21 @@ def display_compliance_table(
                                         "Medio": 0,
                                         "Bajo": 0,
                                     }
-                                if finding.status == "FAIL":
-                                    fail_count += 1
+                                if status == "FAIL":
+                                    fail_count += count
                                     marcos[marco_categoria][
                                         "Estado"
                                     ] = f"{Fore.RED}NO CUMPLE{Style.RESET_ALL}"
-                                elif finding.status == "PASS":
-                                    pass_count += 1
+                                elif status == "PASS":
+                                    pass_count += count
                                 if attribute.Nivel == "opcional":
-                                    marcos[marco_categoria]["Opcional"] += 1
+                                    marcos[marco_categoria]["Opcional"] += count
                                 elif attribute.Nivel == "alto":
-                                    marcos[marco_categoria]["Alto"] += 1
+                                    marcos[marco_categoria]["Alto"] += count
                                 elif attribute.Nivel == "medio":
-                                    marcos[marco_categoria]["Medio"] += 1
+                                    marcos[marco_categoria]["Medio"] += count
                                 elif attribute.Nivel == "bajo":
-                                    marcos[marco_categoria]["Bajo"] += 1
+                                    marcos[marco_categoria]["Bajo"] += count
 
             # Add results to table
             for marco in sorted(marcos):
@@ -457,8 +460,8 @@ def display_compliance_table(
                 "Level 2": [],
             }
             pass_count = fail_count = 0
-            for finding in findings:
-                check = bulk_checks_metadata[finding.check_metadata.CheckID]
+            for (check_id, status), count in check_status_counts.items():
+                check = bulk_checks_metadata[check_id]
                 check_compliances = check.Compliance
                 for compliance in check_compliances:
                     if (
@@ -477,20 +480,20 @@ def display_compliance_table(
                                         "Level 1": {"FAIL": 0, "PASS": 0},
                                         "Level 2": {"FAIL": 0, "PASS": 0},
                                     }
-                                if finding.status == "FAIL":
-                                    fail_count += 1
-                                elif finding.status == "PASS":
-                                    pass_count += 1
+                                if status == "FAIL":
+                                    fail_count += count
+                                elif status == "PASS":
+                                    pass_count += count
                                 if attribute.Profile == "Level 1":
-                                    if finding.status == "FAIL":
-                                        sections[section]["Level 1"]["FAIL"] += 1
+                                    if status == "FAIL":
+                                        sections[section]["Level 1"]["FAIL"] += count
                                     else:
-                                        sections[section]["Level 1"]["PASS"] += 1
+                                        sections[section]["Level 1"]["PASS"] += count
                                 elif attribute.Profile == "Level 2":
-                                    if finding.status == "FAIL":
-                                        sections[section]["Level 2"]["FAIL"] += 1
+                                    if status == "FAIL":
+                                        sections[section]["Level 2"]["FAIL"] += count
                                     else:
-                                        sections[section]["Level 2"]["PASS"] += 1
+                                        sections[section]["Level 2"]["PASS"] += count
 
             # Add results to table
             sections = dict(sorted(sections.items()))
@@ -551,8 +554,8 @@ def display_compliance_table(
                 "Status": [],
             }
             pass_count = fail_count = 0
-            for finding in findings:
-                check = bulk_checks_metadata[finding.check_metadata.CheckID]
+            for (check_id, status), count in check_status_counts.items():
+                check = bulk_checks_metadata[check_id]
                 check_compliances = check.Compliance
                 for compliance in check_compliances:
                     if (
@@ -564,12 +567,12 @@ def display_compliance_table(
                             for tactic in requirement.Tactics:
                                 if tactic not in tactics:
                                     tactics[tactic] = {"FAIL": 0, "PASS": 0}
-                                if finding.status == "FAIL":
-                                    fail_count += 1
-                                    tactics[tactic]["FAIL"] += 1
-                                elif finding.status == "PASS":
-                                    pass_count += 1
-                                    tactics[tactic]["PASS"] += 1
+                                if status == "FAIL":
+                                    fail_count += count
+                                    tactics[tactic]["FAIL"] += count
+                                elif status == "PASS":
+                                    pass_count += count
+                                    tactics[tactic]["PASS"] += count
 
             # Add results to table
             tactics = dict(sorted(tactics.items()))
@@ -29,25 +29,47 @@ from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.azure.lib.audit_info.models import Azure_Audit_Info
 from prowler.providers.gcp.lib.audit_info.models import GCP_Audit_Info
 
+# Buffer size of the output files kept open during the whole scan
+output_file_buffer_size = 1024 * 1024
+
+
+class Output_Session:
+    """Output files opened once and shared by all the checks' reports until the end of the scan"""
+
+    def __init__(self, output_modes, output_directory, output_filename, audit_info):
+        self.file_descriptors = fill_file_descriptors(
+            output_modes,
+            output_directory,
+            output_filename,
+            audit_info,
+            buffering=output_file_buffer_size,
+        )
+
+    def close(self):
+        """Flush and close all the output files"""
+        for output_mode, file_descriptor in self.file_descriptors.items():
+            try:
+                file_descriptor.close()
+            except Exception as error:
+                logger.error(
+                    f"{output_mode} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        self.file_descriptors = {}
+
 
 def initialize_file_descriptor(
     filename: str,
     output_mode: str,
     audit_info: AWS_Audit_Info,
     format: Any = None,
+    buffering: int = -1,
 ) -> TextIOWrapper:
     """Open/Create the output file. If needed include headers or the required format"""
     try:
         if file_exists(filename):
-            file_descriptor = open_file(
-                filename,
-                "a",
-            )
+            file_descriptor = open_file(filename, "a", buffering)
         else:
-            file_descriptor = open_file(
-                filename,
-                "a",
-            )
+            file_descriptor = open_file(filename, "a", buffering)
 
             if output_mode in ("json", "json-asff", "json-ocsf"):
                 file_descriptor.write("[")
@@ -68,7 +90,9 @@ def initialize_file_descriptor(
     return file_descriptor
 
 
-def fill_file_descriptors(output_modes, output_directory, output_filename, audit_info):
+def fill_file_descriptors(
+    output_modes, output_directory, output_filename, audit_info, buffering=-1
+):
     try:
         file_descriptors = {}
         if output_modes:
@@ -81,6 +105,7 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                             output_mode,
                             audit_info,
                             Aws_Check_Output_CSV,
+                            buffering=buffering,
                         )
                     if isinstance(audit_info, Azure_Audit_Info):
                         file_descriptor = initialize_file_descriptor(
@@ -88,6 +113,7 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                             output_mode,
                             audit_info,
                             Azure_Check_Output_CSV,
+                            buffering=buffering,
                         )
                     if isinstance(audit_info, GCP_Audit_Info):
                         file_descriptor = initialize_file_descriptor(
@@ -95,13 +121,14 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                             output_mode,
                             audit_info,
                             Gcp_Check_Output_CSV,
+                            buffering=buffering,
                         )
                     file_descriptors.update({output_mode: file_descriptor})
 
                 elif output_mode == "json":
                     filename = f"{output_directory}/{output_filename}{json_file_suffix}"
                     file_descriptor = initialize_file_descriptor(
-                        filename, output_mode, audit_info
+                        filename, output_mode, audit_info, buffering=buffering
                     )
                     file_descriptors.update({output_mode: file_descriptor})
 
@@ -110,14 +137,14 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                         f"{output_directory}/{output_filename}{json_ocsf_file_suffix}"
                     )
                     file_descriptor = initialize_file_descriptor(
-                        filename, output_mode, audit_info
+                        filename, output_mode, audit_info, buffering=buffering
                     )
                     file_descriptors.update({output_mode: file_descriptor})
 
                 elif output_mode == "html":
                     filename = f"{output_directory}/{output_filename}{html_file_suffix}"
                     file_descriptor = initialize_file_descriptor(
-                        filename, output_mode, audit_info
+                        filename, output_mode, audit_info, buffering=buffering
                     )
                     file_descriptors.update({output_mode: file_descriptor})
 
@@ -125,7 +152,11 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                     if output_mode == "cis_2.0_gcp":
                         filename = f"{output_directory}/{output_filename}_cis_2.0_gcp{csv_file_suffix}"
                         file_descriptor = initialize_file_descriptor(
-                            filename, output_mode, audit_info, Check_Output_CSV_GCP_CIS
+                            filename,
+                            output_mode,
+                            audit_info,
+                            Check_Output_CSV_GCP_CIS,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -133,7 +164,7 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                     if output_mode == "json-asff":
                         filename = f"{output_directory}/{output_filename}{json_asff_file_suffix}"
                         file_descriptor = initialize_file_descriptor(
-                            filename, output_mode, audit_info
+                            filename, output_mode, audit_info, buffering=buffering
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -144,20 +175,29 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                             output_mode,
                             audit_info,
                             Check_Output_CSV_ENS_RD2022,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
                     elif output_mode == "cis_1.5_aws":
                         filename = f"{output_directory}/{output_filename}_cis_1.5_aws{csv_file_suffix}"
                         file_descriptor = initialize_file_descriptor(
-                            filename, output_mode, audit_info, Check_Output_CSV_AWS_CIS
+                            filename,
+                            output_mode,
+                            audit_info,
+                            Check_Output_CSV_AWS_CIS,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
                     elif output_mode == "cis_1.4_aws":
                         filename = f"{output_directory}/{output_filename}_cis_1.4_aws{csv_file_suffix}"
                         file_descriptor = initialize_file_descriptor(
-                            filename, output_mode, audit_info, Check_Output_CSV_AWS_CIS
+                            filename,
+                            output_mode,
+                            audit_info,
+                            Check_Output_CSV_AWS_CIS,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -171,6 +211,7 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                             output_mode,
                             audit_info,
                             Check_Output_CSV_AWS_Well_Architected,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -184,6 +225,7 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                             output_mode,
                             audit_info,
                             Check_Output_CSV_AWS_Well_Architected,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -194,6 +236,7 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                             output_mode,
                             audit_info,
                             Check_Output_CSV_AWS_ISO27001_2013,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -204,6 +247,7 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                             output_mode,
                             audit_info,
                             Check_Output_MITRE_ATTACK,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -215,6 +259,7 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                             output_mode,
                             audit_info,
                             Check_Output_CSV_Generic_Compliance,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -0,0 +1,77 @@
+class Findings_Aggregator:
+    """
+    Findings_Aggregator keeps the running counters needed for the statistics, the summary table
+    and the compliance tables, so the findings do not have to be kept until the end of the scan
+    """
+
+    def __init__(self):
+        self.total_findings = 0
+        self.total_pass = 0
+        self.total_fail = 0
+        self.resources = set()
+        # One row per consecutive group of findings of the same service
+        self.services = []
+        # Number of findings by (CheckID, status)
+        self.check_status_counts = {}
+
+    def add_findings(self, findings: list):
+        for finding in findings:
+            self.add_finding(finding)
+
+    def add_finding(self, finding):
+        self.total_findings += 1
+        self.resources.add(finding.resource_id)
+        if finding.status == "PASS":
+            self.total_pass += 1
+        elif finding.status == "FAIL":
+            self.total_fail += 1
+
+        check_status = (finding.check_metadata.CheckID, finding.status)
+        self.check_status_counts[check_status] = (
+            self.check_status_counts.get(check_status, 0) + 1
+        )
+
+        if (
+            not self.services
+            or self.services[-1]["Service"] != finding.check_metadata.ServiceName
+        ):
+            self.services.append(
+                {
+                    "Service": finding.check_metadata.ServiceName,
+                    "Provider": "",
+                    "Total": 0,
+                    "Critical": 0,
+                    "High": 0,
+                    "Medium": 0,
+                    "Low": 0,
+                }
+            )
+        service = self.services[-1]
+        service["Provider"] = finding.check_metadata.Provider
+        service["Total"] += 1
+        if finding.status == "FAIL":
+            if finding.check_metadata.Severity == "critical":
+                service["Critical"] += 1
+            elif finding.check_metadata.Severity == "high":
+                service["High"] += 1
+            elif finding.check_metadata.Severity == "medium":
+                service["Medium"] += 1
+            elif finding.check_metadata.Severity == "low":
+                service["Low"] += 1
+
+    def get_statistics(self) -> dict:
+        return {
+            "total_pass": self.total_pass,
+            "total_fail": self.total_fail,
+            "resources_count": len(self.resources),
+            "findings_count": self.total_pass + self.total_fail,
+        }
+
+
+def aggregate_findings(findings) -> Findings_Aggregator:
+    """Return the Findings_Aggregator of a findings list, or the input if it is already aggregated"""
+    if isinstance(findings, Findings_Aggregator):
+        return findings
+    findings_aggregator = Findings_Aggregator()
+    findings_aggregator.add_findings(findings)
+    return findings_aggregator
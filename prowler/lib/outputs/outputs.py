@@ -15,15 +15,14 @@ from prowler.config.config import (
 from prowler.lib.logger import logger
 from prowler.lib.outputs.compliance import add_manual_controls, fill_compliance
 from prowler.lib.outputs.file_descriptors import fill_file_descriptors
+from prowler.lib.outputs.findings_aggregator import aggregate_findings
 from prowler.lib.outputs.html import fill_html
 from prowler.lib.outputs.json import fill_json_asff, fill_json_ocsf
 from prowler.lib.outputs.models import (
     Check_Output_JSON_ASFF,
     generate_provider_output_csv,
     generate_provider_output_json,
-    unroll_tags,
 )
-from prowler.providers.aws.lib.allowlist.allowlist import is_allowlisted
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.aws.lib.security_hub.security_hub import send_to_security_hub
 from prowler.providers.azure.lib.audit_info.models import Azure_Audit_Info
@@ -54,7 +53,11 @@ def report(check_findings, output_options, audit_info):
 
         # Generate the required output files
         file_descriptors = {}
-        if output_options.output_modes:
+        # Reuse the output files kept open for the whole scan if available
+        output_session = getattr(output_options, "output_session", None)
+        if output_session:
+            file_descriptors = output_session.file_descriptors
+        elif output_options.output_modes:
             # if isinstance(audit_info, AWS_Audit_Info):
             # We have to create the required output files
             file_descriptors = fill_file_descriptors(
@@ -68,14 +71,7 @@ def report(check_findings, output_options, audit_info):
             for finding in check_findings:
                 # Check if finding is allowlisted
                 if output_options.allowlist_file:
-                    if is_allowlisted(
-                        output_options.allowlist_file,
-                        audit_info.audited_account,
-                        finding.check_metadata.CheckID,
-                        finding.region,
-                        finding.resource_id,
-                        unroll_tags(finding.resource_tags),
-                    ):
+                    if output_options.allowlist_file.match(finding):
                         finding.status = "WARNING"
                 # Print findings by stdout
                 color = set_report_color(finding.status)
@@ -181,7 +177,7 @@ def report(check_findings, output_options, audit_info):
         # Separator between findings and bar
         if output_options.verbose:
             print()
-        if file_descriptors:
+        if file_descriptors and not output_session:
             # Close all file descriptors
             for file_descriptor in file_descriptors:
                 file_descriptors.get(file_descriptor).close()
@@ -244,9 +240,9 @@ def send_to_s3_bucket(
         sys.exit(1)
 
 
-def extract_findings_statistics(findings: list) -> dict:
+def extract_findings_statistics(findings) -> dict:
     """
-    extract_findings_statistics takes a list of findings and returns the following dict with the aggregated statistics
+    extract_findings_statistics takes a list of findings or a Findings_Aggregator and returns the following dict with the aggregated statistics
     {
         "total_pass": 0,
         "total_fail": 0,
@@ -255,25 +251,4 @@ def extract_findings_statistics(findings: list) -> dict:
     }
     """
     logger.info("Extracting audit statistics...")
-    stats = {}
-    total_pass = 0
-    total_fail = 0
-    resources = set()
-    findings_count = 0
-
-    for finding in findings:
-        # Save the resource_id
-        resources.add(finding.resource_id)
-        if finding.status == "PASS":
-            total_pass += 1
-            findings_count += 1
-        if finding.status == "FAIL":
-            total_fail += 1
-            findings_count += 1
-
-    stats["total_pass"] = total_pass
-    stats["total_fail"] = total_fail
-    stats["resources_count"] = len(resources)
-    stats["findings_count"] = findings_count
-
-    return stats
+    return aggregate_findings(findings).get_statistics()
@@ -11,11 +11,12 @@ from prowler.config.config import (
     json_ocsf_file_suffix,
 )
 from prowler.lib.logger import logger
+from prowler.lib.outputs.findings_aggregator import aggregate_findings
 from prowler.providers.common.outputs import Provider_Output_Options
 
 
 def display_summary_table(
-    findings: list,
+    findings,
     audit_info,
     output_options: Provider_Output_Options,
     provider: str,
@@ -40,16 +41,8 @@ def display_summary_table(
             entity_type = "Project ID/s"
             audited_entities = ", ".join(audit_info.project_ids)
 
-        if findings:
-            current = {
-                "Service": "",
-                "Provider": "",
-                "Total": 0,
-                "Critical": 0,
-                "High": 0,
-                "Medium": 0,
-                "Low": 0,
-            }
+        findings_aggregator = aggregate_findings(findings)
+        if findings_aggregator.total_findings:
             findings_table = {
                 "Provider": [],
                 "Service": [],
@@ -59,45 +52,17 @@ def display_summary_table(
                 "Medium": [],
                 "Low": [],
             }
-            pass_count = fail_count = 0
-            for finding in findings:
-                # If new service and not first, add previous row
-                if (
-                    current["Service"] != finding.check_metadata.ServiceName
-                    and current["Service"]
-                ):
-                    add_service_to_table(findings_table, current)
-
-                    current["Total"] = current["Critical"] = current["High"] = current[
-                        "Medium"
-                    ] = current["Low"] = 0
-
-                current["Service"] = finding.check_metadata.ServiceName
-                current["Provider"] = finding.check_metadata.Provider
-
-                current["Total"] += 1
-                if finding.status == "PASS":
-                    pass_count += 1
-                elif finding.status == "FAIL":
-                    fail_count += 1
-                    if finding.check_metadata.Severity == "critical":
-                        current["Critical"] += 1
-                    elif finding.check_metadata.Severity == "high":
-                        current["High"] += 1
-                    elif finding.check_metadata.Severity == "medium":
-                        current["Medium"] += 1
-                    elif finding.check_metadata.Severity == "low":
-                        current["Low"] += 1
-
-            # Add final service
-
-            add_service_to_table(findings_table, current)
+            pass_count = findings_aggregator.total_pass
+            fail_count = findings_aggregator.total_fail
+            total_findings = findings_aggregator.total_findings
+            for service in findings_aggregator.services:
+                add_service_to_table(findings_table, dict(service))
 
             print("\nOverview Results:")
             overview_table = [
                 [
-                    f"{Fore.RED}{round(fail_count/len(findings)*100, 2)}% ({fail_count}) Failed{Style.RESET_ALL}",
-                    f"{Fore.GREEN}{round(pass_count/len(findings)*100, 2)}% ({pass_count}) Passed{Style.RESET_ALL}",
+                    f"{Fore.RED}{round(fail_count/total_findings*100, 2)}% ({fail_count}) Failed{Style.RESET_ALL}",
+                    f"{Fore.GREEN}{round(pass_count/total_findings*100, 2)}% ({pass_count}) Passed{Style.RESET_ALL}",
                 ]
             ]
             print(tabulate(overview_table, tablefmt="rounded_grid"))
@@ -1,16 +1,52 @@
+import re
+
 from prowler.lib.logger import logger
 
+# Separators of the parts of an ARN, like arn:aws:ec2:eu-west-1:123456789012:instance/i-1234
+arn_separators = re.compile(r"[:/]")
+
+
+class Resource_Filter:
+    """
+    Resource_Filter indexes once the resources to audit, passed with --resource-arn or found with --resource-tags,
+    so every resource gathered by the services is checked against them in constant time.
+    A resource is filtered if it is one of the ARNs or one of their trailing parts after a ":" or a "/",
+    like the name of a bucket or the id of an instance, but not any other substring of them.
+    The filter can be iterated and measured like the list of ARNs it was built from.
+    """
+
+    def __init__(self, audit_resources: list):
+        self.audit_resources = list(audit_resources or [])
+        self.arns = set(self.audit_resources)
+        self.arn_suffixes = set()
+        for arn in self.arns:
+            for separator in arn_separators.finditer(arn):
+                self.arn_suffixes.add(arn[separator.end() :])
+
+    def __contains__(self, resource: str) -> bool:
+        return resource in self.arns or resource in self.arn_suffixes
+
+    def __iter__(self):
+        return iter(self.audit_resources)
+
+    def __len__(self) -> int:
+        return len(self.audit_resources)
+
+    def __repr__(self) -> str:
+        return repr(self.audit_resources)
+
 
-def is_resource_filtered(resource: str, audit_resources: list) -> bool:
+def is_resource_filtered(resource: str, audit_resources) -> bool:
     """
-    Check if the resource passed as argument is present in the audit_resources.
+    Check if the resource passed as argument is present in the audit_resources,
+    a Resource_Filter or a list of ARNs indexed in every call.
 
     Returns True if it is filtered and False if it does not match the input filters
     """
     try:
-        if resource in str(audit_resources):
-            return True
-        return False
+        if not isinstance(audit_resources, Resource_Filter):
+            audit_resources = Resource_Filter(audit_resources)
+        return resource in audit_resources
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error} ({resource})"
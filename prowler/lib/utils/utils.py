@@ -1,22 +1,31 @@
 import json
 import os
 import sys
-import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from hashlib import sha512
-from io import TextIOWrapper
+from io import StringIO, TextIOWrapper
 from ipaddress import ip_address
+from multiprocessing import get_context
 from os.path import exists
 from typing import Any
 
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
+# The private helpers of detect-secrets used to scan in memory are pinned with its version in pyproject.toml
+from detect_secrets.core.scan import _is_filtered_out, _process_line_based_plugins
+from detect_secrets.settings import default_settings, get_filters
+from detect_secrets.transformers import get_transformed_file
 
+from prowler.config.config import get_config_var
 from prowler.lib.logger import logger
 
+# Minimum number of payloads of a batch worth sending to the secrets scan processes
+secrets_scan_pool_min_batch_size = 32
 
-def open_file(input_file: str, mode: str = "r") -> TextIOWrapper:
+
+def open_file(input_file: str, mode: str = "r", buffering: int = -1) -> TextIOWrapper:
     try:
-        f = open(input_file, mode)
+        f = open(input_file, mode, buffering)
     except OSError as ose:
         if ose.strerror == "Too many open files":
             logger.critical(
@@ -65,19 +74,167 @@ def hash_sha512(string: str) -> str:
     return sha512(string.encode("utf-8")).hexdigest()[0:9]
 
 
-def detect_secrets_scan(data):
-    temp_data_file = tempfile.NamedTemporaryFile(delete=False)
-    temp_data_file.write(bytes(data, encoding="raw_unicode_escape"))
-    temp_data_file.close()
+class Secrets_Scanner:
+    """
+    Secrets_Scanner runs the detect-secrets plugins over in-memory strings, so the data does not have
+    to be written to a temporary file. Every scan enables all the plugins and the default filters with
+    the detect-secrets default_settings, which are restored when the scan ends.
+    """
+
+    # The detect-secrets settings are global to the process, so the scans of its threads are serialized
+    settings_lock = threading.RLock()
+
+    @contextmanager
+    def __settings__(self):
+        with self.settings_lock, default_settings() as settings:
+            # The scanned data is not read from a file
+            settings.disable_filters("detect_secrets.filters.common.is_invalid_file")
+            get_filters.cache_clear()
+            yield settings
+
+    def scan(self, data: str, filename: str = "") -> list:
+        """
+        scan returns the secrets found in data, with the same format and order as SecretsCollection.json().
+        The filename, if given, is used to apply the filename filters and transformers of detect-secrets.
+        """
+        with self.__settings__():
+            return self.__scan__(data, filename)
+
+    def __scan__(self, data: str, filename: str) -> list:
+        if filename and _is_filtered_out(
+            required_filter_parameters=["filename"], filename=filename
+        ):
+            return []
+
+        data_file = StringIO(data, newline=None)
+        data_file.name = filename
+        # Keep the first occurrence of every secret like SecretsCollection does
+        secrets = {}
+        for use_eager_transformers in (False, True):
+            lines = get_transformed_file(data_file, use_eager_transformers)
+            if not lines:
+                if use_eager_transformers:
+                    break
+                lines = data_file.readlines()
+                data_file.seek(0)
+            for secret in _process_line_based_plugins(
+                lines=list(enumerate(lines, start=1)), filename=filename
+            ):
+                secrets.setdefault(secret, secret)
+            if secrets:
+                break
+
+        return [
+            secret.json()
+            for secret in sorted(
+                secrets,
+                key=lambda secret: (
+                    getattr(secret, "line_number", 0),
+                    secret.secret_hash,
+                    secret.type,
+                ),
+            )
+        ]
+
+    def scan_batch(self, payloads: list, filenames: list = None) -> list:
+        """scan_batch returns the secrets found in every payload, in the same order"""
+        if not filenames:
+            filenames = [""] * len(payloads)
+        with self.__settings__():
+            return [
+                self.__scan__(data, filename)
+                for data, filename in zip(payloads, filenames)
+            ]
+
+
+secrets_scanner = None
+secrets_scanner_lock = threading.Lock()
+
+
+def get_secrets_scanner() -> Secrets_Scanner:
+    """Return the Secrets_Scanner of this process, creating it the first time"""
+    global secrets_scanner
+    with secrets_scanner_lock:
+        if not secrets_scanner:
+            secrets_scanner = Secrets_Scanner()
+    return secrets_scanner
 
-    secrets = SecretsCollection()
-    with default_settings():
-        secrets.scan_file(temp_data_file.name)
-    os.remove(temp_data_file.name)
 
-    detect_secrets_output = secrets.json()
+secrets_scan_workers = None
+secrets_scan_workers_lock = threading.Lock()
+secrets_scan_pool = None
+secrets_scan_pool_lock = threading.Lock()
+
+
+def get_secrets_scan_workers() -> int:
+    """Return the number of processes scanning for secrets, read once from the config file, all the CPUs by default"""
+    global secrets_scan_workers
+    with secrets_scan_workers_lock:
+        if not secrets_scan_workers:
+            secrets_scan_workers = (
+                get_config_var("max_secrets_scan_workers") or os.cpu_count() or 1
+            )
+    return secrets_scan_workers
+
+
+def get_secrets_scan_pool() -> ProcessPoolExecutor:
+    """Return the pool of processes scanning for secrets, creating it the first time"""
+    global secrets_scan_pool
+    workers = get_secrets_scan_workers()
+    with secrets_scan_pool_lock:
+        if not secrets_scan_pool:
+            # Spawn the workers since forking a multithreaded process is not safe
+            secrets_scan_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=get_context("spawn"),
+            )
+    return secrets_scan_pool
+
+
+def scan_secrets_chunk(payloads: list, filenames: list) -> list:
+    """Scan a chunk of payloads in a secrets scan process"""
+    return get_secrets_scanner().scan_batch(payloads, filenames)
+
+
+def detect_secrets_scan_batch(
+    payloads: list,
+    filenames: list = None,
+    min_batch_size: int = secrets_scan_pool_min_batch_size,
+) -> list:
+    """
+    detect_secrets_scan_batch returns the secrets found in every payload, in the same order.
+    The batches of at least min_batch_size payloads are spread across the secrets scan processes since the scan is CPU bound.
+    """
+    if not filenames:
+        filenames = [""] * len(payloads)
+    workers = get_secrets_scan_workers()
+    if workers > 1 and len(payloads) >= min_batch_size:
+        try:
+            chunk_size = -(-len(payloads) // workers)
+            chunks = [
+                (
+                    payloads[index : index + chunk_size],
+                    filenames[index : index + chunk_size],
+                )
+                for index in range(0, len(payloads), chunk_size)
+            ]
+            secrets = []
+            for chunk_secrets in get_secrets_scan_pool().map(
+                scan_secrets_chunk, *zip(*chunks)
+            ):
+                secrets.extend(chunk_secrets)
+            return secrets
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+    return get_secrets_scanner().scan_batch(payloads, filenames)
+
+
+def detect_secrets_scan(data):
+    detect_secrets_output = get_secrets_scanner().scan(data)
     if detect_secrets_output:
-        return detect_secrets_output[temp_data_file.name]
+        return detect_secrets_output
     else:
         return None
 
@@ -1,17 +1,276 @@
 import os
 import pathlib
+import random
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from boto3 import client, session
+from botocore.client import ClientError
 from botocore.credentials import RefreshableCredentials
 from botocore.session import get_session
 
-from prowler.config.config import aws_services_json_file
-from prowler.lib.check.check import list_modules, recover_checks_from_service
+from prowler.config.config import aws_services_json_file, get_config_var
+from prowler.lib.calls_executor.calls_executor import Calls_Executor
+from prowler.lib.check.check import (
+    list_modules,
+    recover_check_service_attributes,
+    recover_checks_from_service,
+)
 from prowler.lib.logger import logger
 from prowler.lib.utils.utils import open_file, parse_json_file
 from prowler.providers.aws.lib.audit_info.models import AWS_Assume_Role, AWS_Audit_Info
 
+# boto3 sessions are not thread-safe, so the clients creation must be serialized
+# because the services can be instantiated concurrently (--parallel-checks)
+session_client_lock = threading.Lock()
+
+# Default concurrency limits of the regional calls of the AWS services
+default_max_workers = 32
+default_max_workers_per_region = 10
+default_max_workers_per_api = 16
+
+# Error codes returned by the AWS APIs when the requests are throttled
+throttling_error_codes = (
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestLimitExceeded",
+    "RequestThrottled",
+    "TooManyRequestsException",
+)
+
+
+class Regional_Calls_Executor(Calls_Executor):
+    """
+    Regional_Calls_Executor runs the regional calls of all the AWS services,
+    limiting the concurrent calls per region and per API.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = default_max_workers,
+        max_workers_per_region: int = default_max_workers_per_region,
+        max_workers_per_api: int = default_max_workers_per_api,
+    ):
+        super().__init__(max_workers, thread_name_prefix="prowler-aws")
+        self.max_workers_per_region = max_workers_per_region
+        self.max_workers_per_api = max_workers_per_api
+        self.semaphores = {}
+        self.semaphores_lock = threading.Lock()
+
+    def get_semaphore(self, key, limit) -> threading.BoundedSemaphore:
+        with self.semaphores_lock:
+            if key not in self.semaphores:
+                self.semaphores[key] = threading.BoundedSemaphore(limit)
+            return self.semaphores[key]
+
+    def run_worker_call(self, call, regional_client):
+        # Both semaphores are always acquired in the same order
+        with self.get_semaphore(
+            ("region", getattr(regional_client, "region", None)),
+            self.max_workers_per_region,
+        ), self.get_semaphore(("api", call.__qualname__), self.max_workers_per_api):
+            return super().run_worker_call(call, regional_client)
+
+    def log_call_error(self, call, regional_client, error: Exception):
+        logger.error(
+            f"{getattr(regional_client, 'region', None)} -- {call.__qualname__} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+    def threading_call(self, call, regional_clients):
+        """Run the call for every regional client and wait until all of them finish"""
+        self.run_calls(call, regional_clients)
+
+
+regional_calls_executor = None
+regional_calls_executor_lock = threading.Lock()
+
+
+def get_regional_calls_executor() -> Regional_Calls_Executor:
+    """Return the executor shared by all the AWS services, creating it on first use"""
+    global regional_calls_executor
+    with regional_calls_executor_lock:
+        if not regional_calls_executor:
+            regional_calls_executor = Regional_Calls_Executor(
+                get_config_var("max_aws_workers") or default_max_workers,
+                get_config_var("max_aws_workers_per_region")
+                or default_max_workers_per_region,
+                get_config_var("max_aws_workers_per_api")
+                or default_max_workers_per_api,
+            )
+        return regional_calls_executor
+
+
+def threading_call(call, regional_clients):
+    """Run the call for every regional client in the shared executor"""
+    get_regional_calls_executor().threading_call(call, regional_clients)
+
+
+def is_throttling_error(error: Exception) -> bool:
+    """Return whether the error is a throttling error of the AWS APIs"""
+    return (
+        isinstance(error, ClientError)
+        and error.response.get("Error", {}).get("Code") in throttling_error_codes
+    )
+
+
+class Throttled_Calls_Executor:
+    """
+    Throttled_Calls_Executor runs a call for every resource of a service in a bounded thread pool.
+    The concurrent calls are halved every time the API throttles and grow back one by one
+    with the successful calls, while the throttled calls are retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_attempts: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 20,
+    ):
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.concurrency_limit = max_workers
+        self.running_calls = 0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        with self.condition:
+            while self.running_calls >= self.concurrency_limit:
+                self.condition.wait()
+            self.running_calls += 1
+
+    def release(self, throttled: bool, succeeded: bool):
+        with self.condition:
+            self.running_calls -= 1
+            if throttled:
+                self.concurrency_limit = max(1, self.concurrency_limit // 2)
+            elif succeeded and self.concurrency_limit < self.max_workers:
+                self.concurrency_limit += 1
+            self.condition.notify_all()
+
+    def run_call(self, call, resource):
+        attempt = 1
+        while True:
+            self.acquire()
+            throttled = succeeded = False
+            try:
+                result = call(resource)
+                succeeded = True
+                return result
+            except Exception as error:
+                throttled = is_throttling_error(error)
+                if not throttled or attempt >= self.max_attempts:
+                    raise
+            finally:
+                self.release(throttled, succeeded)
+            # Full jitter to not retry all the throttled calls at the same time
+            time.sleep(
+                random.uniform(
+                    0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+                )
+            )
+            attempt += 1
+
+    def threading_call(self, call, resources):
+        """Run the call for every resource and wait until all of them finish"""
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="prowler-aws-throttled"
+        ) as executor:
+            futures = [
+                executor.submit(self.run_call, call, resource) for resource in resources
+            ]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as error:
+                    logger.error(
+                        f"{call.__qualname__} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+
+
+class Resource_Index:
+    """
+    Resource_Index is a lazily built dictionary index of a service resources collection by one of their attributes,
+    declared in the service class like buckets_by_name = Resource_Index("buckets", "name"), so the checks joining
+    resources across services can look them up instead of scanning the whole collection.
+    With grouped=True every value maps to the list of resources sharing it, otherwise to the first resource found.
+    The index is built on first access and rebuilt if the collection is replaced or changes its size.
+    """
+
+    def __init__(self, collection: str, attribute: str, grouped: bool = False):
+        self.collection = collection
+        self.attribute = attribute
+        self.grouped = grouped
+
+    def __set_name__(self, owner, name):
+        self.cache_attribute = f"_{name}_index"
+
+    def __get__(self, service, owner=None):
+        if service is None:
+            return self
+        resources = getattr(service, self.collection) or []
+        version = (id(resources), len(resources))
+        cached_index = service.__dict__.get(self.cache_attribute)
+        if cached_index and cached_index[0] == version:
+            return cached_index[1]
+
+        index = build_resource_index(resources, self.attribute, self.grouped)
+        service.__dict__[self.cache_attribute] = (version, index)
+        return index
+
+
+class Checks_Attributes:
+    """
+    Checks_Attributes declares the optional attributes of a service client, like
+    checks_attributes = Checks_Attributes(client="ec2", attributes=["user_data"]), so the service only
+    gathers the attributes read by the checks to execute. The checks declare the attributes they read in
+    the ServiceAttributes of their metadata, like {"ec2": ["user_data"]}.
+    All the attributes are gathered when the checks to execute are unknown or when any of them imports
+    the service client without declaring its attributes.
+    """
+
+    def __init__(self, client: str, attributes: list):
+        self.client = client
+        self.attributes = set(attributes)
+
+    def get_audited_attributes(self, audit_info) -> set:
+        """Return the attributes read by any of the checks to execute"""
+        audit_metadata = getattr(audit_info, "audit_metadata", None)
+        expected_checks = getattr(audit_metadata, "expected_checks", None)
+        if not expected_checks:
+            return set(self.attributes)
+        audited_attributes = set()
+        for check_name in expected_checks:
+            check_attributes = recover_check_service_attributes(check_name, "aws").get(
+                self.client, []
+            )
+            if check_attributes is None:
+                return set(self.attributes)
+            audited_attributes.update(check_attributes)
+        return audited_attributes & self.attributes
+
+
+def build_resource_index(resources, attribute: str, grouped: bool = False) -> dict:
+    """Return a dictionary of the resources, a list or the values of a dict, by the given attribute"""
+    if isinstance(resources, dict):
+        resources = resources.values()
+    index = {}
+    for resource in resources:
+        value = getattr(resource, attribute, None)
+        if value is None:
+            continue
+        if grouped:
+            index.setdefault(value, []).append(resource)
+        else:
+            index.setdefault(value, resource)
+    return index
+
 
 ################## AWS PROVIDER
 class AWS_Provider:
@@ -154,9 +413,10 @@ def generate_regional_clients(
                     service_regions = [audit_info.profile_region]
                 service_regions = service_regions[:1]
         for region in service_regions:
-            regional_client = audit_info.audit_session.client(
-                service, region_name=region, config=audit_info.session_config
-            )
+            with session_client_lock:
+                regional_client = audit_info.audit_session.client(
+                    service, region_name=region, config=audit_info.session_config
+                )
             regional_client.region = region
             regional_clients[region] = regional_client
         return regional_clients
@@ -166,17 +426,25 @@ def generate_regional_clients(
         )
 
 
+@lru_cache(maxsize=None)
+def get_aws_regions_by_service() -> dict:
+    """get_aws_regions_by_service loads the regions of every service and partition once"""
+    actual_directory = pathlib.Path(os.path.dirname(os.path.realpath(__file__)))
+    with open_file(f"{actual_directory}/{aws_services_json_file}") as f:
+        data = parse_json_file(f)
+
+    regions_by_service = {}
+    for service, service_info in data["services"].items():
+        for partition, regions in service_info["regions"].items():
+            regions_by_service[(service, partition)] = tuple(regions)
+    return regions_by_service
+
+
 def get_aws_available_regions():
     try:
-        actual_directory = pathlib.Path(os.path.dirname(os.path.realpath(__file__)))
-        with open_file(f"{actual_directory}/{aws_services_json_file}") as f:
-            data = parse_json_file(f)
-
         regions = set()
-        for service in data["services"].values():
-            for partition in service["regions"]:
-                for item in service["regions"][partition]:
-                    regions.add(item)
+        for service_regions in get_aws_regions_by_service().values():
+            regions.update(service_regions)
         return list(regions)
     except Exception as error:
         logger.error(f"{error.__class__.__name__}: {error}")
@@ -254,20 +522,26 @@ def get_regions_from_audit_resources(audit_resources: list) -> list:
     return None
 
 
+@lru_cache(maxsize=None)
+def get_audited_service_regions(
+    service: str, partition: str, audited_regions: tuple
+) -> tuple:
+    json_regions = get_aws_regions_by_service()[(service, partition)]
+    if audited_regions:  # Check for input aws audit_info.audited_regions
+        # Get common regions between input and json
+        return tuple(set(json_regions).intersection(audited_regions))
+    # Get all regions from json of the service and partition
+    return json_regions
+
+
 def get_available_aws_service_regions(service: str, audit_info: AWS_Audit_Info) -> list:
-    # Get json locally
-    actual_directory = pathlib.Path(os.path.dirname(os.path.realpath(__file__)))
-    with open_file(f"{actual_directory}/{aws_services_json_file}") as f:
-        data = parse_json_file(f)
-    # Check if it is a subservice
-    json_regions = data["services"][service]["regions"][audit_info.audited_partition]
-    if audit_info.audited_regions:  # Check for input aws audit_info.audited_regions
-        regions = list(
-            set(json_regions).intersection(audit_info.audited_regions)
-        )  # Get common regions between input and json
-    else:  # Get all regions from json of the service and partition
-        regions = json_regions
-    return regions
+    return list(
+        get_audited_service_regions(
+            service,
+            audit_info.audited_partition,
+            tuple(audit_info.audited_regions or ()),
+        )
+    )
 
 
 def get_default_region(service: str, audit_info: AWS_Audit_Info) -> str:
@@ -1,11 +1,13 @@
 import re
 import sys
+from dataclasses import dataclass, field
 
 import yaml
 from boto3.dynamodb.conditions import Attr
 from schema import Optional, Schema
 
 from prowler.lib.logger import logger
+from prowler.lib.outputs.models import unroll_tags
 
 allowlist_schema = Schema(
     {
@@ -105,7 +107,7 @@ def parse_allowlist_file(audit_info, allowlist_file):
                 f"{error.__class__.__name__} -- Allowlist YAML is malformed - {error}[{error.__traceback__.tb_lineno}]"
             )
             sys.exit(1)
-        return allowlist
+        return Allowlist_Matcher(allowlist, audit_info.audited_account)
     except Exception as error:
         logger.critical(
             f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
@@ -113,8 +115,165 @@ def parse_allowlist_file(audit_info, allowlist_file):
         sys.exit(1)
 
 
+@dataclass
+class Allowlisted_Exceptions:
+    """Exceptions of an allowlisted check with their patterns compiled"""
+
+    accounts: list
+    regions: list
+    resources: list
+    tags: list
+
+    def is_excepted(self, audited_account, region, resource, tags) -> bool:
+        # Every exception list that is set must match, like is_excepted
+        return (
+            (not self.accounts or audited_account in self.accounts)
+            and (not self.regions or region in self.regions)
+            and (
+                not self.resources
+                or any(pattern.search(resource) for pattern in self.resources)
+            )
+            and (not self.tags or any(tag in tags for tag in self.tags))
+        )
+
+
+@dataclass
+class Allowlisted_Check:
+    """Allowlisted check entry with its patterns compiled"""
+
+    index: int
+    name: str
+    regions: list
+    resources: list
+    tags: list
+    exceptions: Allowlisted_Exceptions = None
+
+    def matches_check(self, check) -> bool:
+        return "*" == self.name or check == self.name or re.search(self.name, check)
+
+    def is_allowlisted(self, region, resource, tags) -> bool:
+        # Same logic as is_allowlisted_in_region and is_allowlisted_in_tags
+        if "*" not in self.regions and region not in self.regions:
+            return False
+        # Without resources nothing is allowlisted, even if there are tags
+        if not self.resources:
+            return False
+        if self.tags:
+            return any(pattern.search(tags) for pattern in self.tags)
+        return any(pattern.search(resource) for pattern in self.resources)
+
+
+@dataclass
+class Allowlist_Matcher:
+    """
+    Allowlist_Matcher holds the parsed allowlist with every pattern compiled once.
+
+    The allowlisted checks that match a check ID are looked up once and kept in an
+    index, so each finding only evaluates the entries of its own check instead of
+    walking the whole allowlist.
+    """
+
+    allowlist: dict
+    audited_account: str = None
+    accounts: dict = field(init=False, repr=False)
+    excepted_checks: dict = field(init=False, repr=False)
+    checks_index: dict = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.accounts = {}
+        self.excepted_checks = {}
+        for account, account_allowlist in self.allowlist["Accounts"].items():
+            self.accounts[account] = [
+                compile_allowlisted_check(index, allowlisted_check, check_info)
+                for index, (allowlisted_check, check_info) in enumerate(
+                    account_allowlist["Checks"].items()
+                )
+            ]
+            self.excepted_checks[account] = [
+                allowlisted_check
+                for allowlisted_check in self.accounts[account]
+                if allowlisted_check.exceptions
+            ]
+        self.checks_index = {}
+
+    def match(self, finding) -> bool:
+        """Return True if the finding is allowlisted"""
+        return self.is_allowlisted(
+            self.audited_account,
+            finding.check_metadata.CheckID,
+            finding.region,
+            finding.resource_id,
+            unroll_tags(finding.resource_tags),
+        )
+
+    def is_allowlisted(self, audited_account, check, region, resource, tags) -> bool:
+        # First set account key from allowlist dict
+        if audited_account in self.accounts:
+            account = audited_account
+        # If there is a *, it affects to all accounts
+        elif "*" in self.accounts:
+            account = "*"
+        else:
+            return False
+
+        allowlisted_checks = self.checks_index.get((account, check))
+        if allowlisted_checks is None:
+            allowlisted_checks = [
+                allowlisted_check
+                for allowlisted_check in self.accounts[account]
+                if allowlisted_check.matches_check(check)
+            ]
+            self.checks_index[(account, check)] = allowlisted_checks
+
+        for allowlisted_check in allowlisted_checks:
+            if allowlisted_check.is_allowlisted(region, resource, tags):
+                # Like is_allowlisted_in_check, the allowlist stops at the first
+                # excepted entry, so only the previous entries can allowlist it
+                for excepted_check in self.excepted_checks[account]:
+                    if excepted_check.index > allowlisted_check.index:
+                        break
+                    if excepted_check.exceptions.is_excepted(
+                        audited_account, region, resource, tags
+                    ):
+                        return False
+                return True
+        return False
+
+
+def compile_allowlisted_check(index, allowlisted_check, allowlisted_check_info):
+    """Compile the patterns of an allowlisted check entry"""
+    exceptions = allowlisted_check_info.get("Exceptions")
+    if exceptions:
+        exceptions = Allowlisted_Exceptions(
+            accounts=exceptions.get("Accounts", []),
+            regions=exceptions.get("Regions", []),
+            resources=[
+                re.compile(excepted_resource)
+                for excepted_resource in exceptions.get("Resources", [])
+            ],
+            tags=exceptions.get("Tags", []),
+        )
+    return Allowlisted_Check(
+        index=index,
+        # map lambda to awslambda
+        name=re.sub("^lambda", "awslambda", allowlisted_check),
+        regions=allowlisted_check_info.get("Regions"),
+        resources=[
+            re.compile(".*" if resource == "*" else resource)
+            for resource in allowlisted_check_info.get("Resources")
+        ],
+        tags=[re.compile(tag) for tag in allowlisted_check_info.get("Tags") or []],
+        exceptions=exceptions or None,
+    )
+
+
 def is_allowlisted(allowlist, audited_account, check, region, resource, tags):
     try:
+        # Use the compiled allowlist when available
+        if isinstance(allowlist, Allowlist_Matcher):
+            return allowlist.is_allowlisted(
+                audited_account, check, region, resource, tags
+            )
         # By default is not allowlisted
         is_finding_allowlisted = False
         # First set account key from allowlist dict
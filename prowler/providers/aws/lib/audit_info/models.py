@@ -48,6 +48,7 @@ class AWS_Audit_Info:
     mfa_enabled: bool
     assumed_role_info: AWS_Assume_Role
     audited_regions: list
-    audit_resources: list
+    # Resource_Filter of the ARNs to audit
+    audit_resources: Optional[Any]
     organizations_metadata: AWS_Organizations_Info
     audit_metadata: Optional[Any] = None
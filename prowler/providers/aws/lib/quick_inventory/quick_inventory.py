@@ -1,6 +1,8 @@
 import csv
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from copy import deepcopy
+from textwrap import indent
 
 from alive_progress import alive_bar
 from botocore.client import ClientError
@@ -9,21 +11,23 @@ from tabulate import tabulate
 
 from prowler.config.config import (
     csv_file_suffix,
+    get_config_var,
     json_file_suffix,
     orange_color,
     output_file_timestamp,
 )
 from prowler.lib.logger import logger
 from prowler.lib.outputs.outputs import send_to_s3_bucket
+from prowler.providers.aws.aws_provider import default_max_workers
 from prowler.providers.aws.lib.arn.models import get_arn_resource_type
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.services.s3.s3_service import default_s3_max_workers
 
 
 def quick_inventory(audit_info: AWS_Audit_Info, args):
     resources = []
     global_resources = []
     total_resources_per_region = {}
-    iam_was_scanned = False
     # If not inputed regions, check all of them
     if not audit_info.audited_regions:
         # EC2 client for describing all regions
@@ -34,76 +38,61 @@ def quick_inventory(audit_info: AWS_Audit_Info, args):
         audit_info.audited_regions = [
             region["RegionName"] for region in ec2_client.describe_regions()["Regions"]
         ]
+    audited_regions = sorted(audit_info.audited_regions)
 
     with alive_bar(
-        total=len(audit_info.audited_regions),
+        total=len(audited_regions),
         ctrl_c=False,
         bar="blocks",
         spinner="classic",
         stats=False,
         enrich_print=False,
     ) as bar:
-        for region in sorted(audit_info.audited_regions):
-            bar.title = f"Inventorying AWS Account {orange_color}{audit_info.audited_account}{Style.RESET_ALL}"
-            resources_in_region = []
-            # {
-            #   eu-west-1: 100,...
-            # }
-
-            try:
-                # Scan IAM only once
-                if not iam_was_scanned:
-                    global_resources.extend(get_iam_resources(audit_info.audit_session))
-                    iam_was_scanned = True
-
-                # Get regional S3 buckets since none-tagged buckets are not supported by the resourcegroupstaggingapi
-                resources_in_region.extend(get_regional_buckets(audit_info, region))
-
-                client = audit_info.audit_session.client(
-                    "resourcegroupstaggingapi", region_name=region
-                )
-                # Get all the resources
-                resources_count = 0
+        bar.title = f"Inventorying AWS Account {orange_color}{audit_info.audited_account}{Style.RESET_ALL}"
+        # Scan IAM only once
+        global_resources.extend(get_iam_resources(audit_info.audit_session))
+        # Get S3 buckets since none-tagged buckets are not supported by the resourcegroupstaggingapi,
+        # locating every bucket once for all the regions
+        buckets_per_region = get_buckets_per_region(audit_info, audited_regions)
+
+        # The clients are created before starting the threads since the session is not thread safe
+        tagging_clients = {
+            region: audit_info.audit_session.client(
+                "resourcegroupstaggingapi", region_name=region
+            )
+            for region in audited_regions
+        }
+        resources_per_region = {}
+        with ThreadPoolExecutor(
+            max_workers=get_config_var("max_aws_workers") or default_max_workers,
+            thread_name_prefix="prowler-inventory",
+        ) as executor:
+            futures = {
+                executor.submit(get_tagged_resources, tagging_clients[region]): region
+                for region in audited_regions
+            }
+            # The progress is updated from the main thread as the regions finish
+            for future in as_completed(futures):
+                region = futures[future]
+                resources_in_region = buckets_per_region.get(region, [])
                 try:
-                    get_resources_paginator = client.get_paginator("get_resources")
-                    for page in get_resources_paginator.paginate():
-                        resources_count += len(page["ResourceTagMappingList"])
-                        for resource in page["ResourceTagMappingList"]:
-                            # Avoid adding S3 buckets again:
-                            if resource["ResourceARN"].split(":")[2] != "s3":
-                                # Check if region is not in ARN --> Global service
-                                if not resource["ResourceARN"].split(":")[3]:
-                                    global_resources.append(
-                                        {
-                                            "arn": resource["ResourceARN"],
-                                            "tags": resource["Tags"],
-                                        }
-                                    )
-                                else:
-                                    resources_in_region.append(
-                                        {
-                                            "arn": resource["ResourceARN"],
-                                            "tags": resource["Tags"],
-                                        }
-                                    )
+                    regional_resources, regional_global_resources = future.result()
+                    resources_in_region.extend(regional_resources)
+                    global_resources.extend(regional_global_resources)
                 except Exception as error:
                     logger.error(
-                        f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                     )
+                resources_per_region[region] = resources_in_region
                 bar()
-                if len(resources_in_region) > 0:
-                    total_resources_per_region[region] = len(resources_in_region)
                 bar.text = f"-> Found {Fore.GREEN}{len(resources_in_region)}{Style.RESET_ALL} resources in {region}"
-
-            except Exception as error:
-                logger.error(
-                    f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
-                bar()
-
-            resources.extend(resources_in_region)
         bar.title = f"-> {Fore.GREEN}Quick Inventory completed!{Style.RESET_ALL}"
 
+    for region in audited_regions:
+        resources_in_region = resources_per_region.get(region, [])
+        if len(resources_in_region) > 0:
+            total_resources_per_region[region] = len(resources_in_region)
+        resources.extend(resources_in_region)
     resources.extend(global_resources)
     total_resources_per_region["global"] = len(global_resources)
     inventory_table = create_inventory_table(resources, total_resources_per_region)
@@ -122,6 +111,33 @@ def quick_inventory(audit_info: AWS_Audit_Info, args):
     create_output(resources, audit_info, args)
 
 
+def get_tagged_resources(client) -> tuple[list, list]:
+    """Return the regional and the global resources found by the resourcegroupstaggingapi in the client region"""
+    regional_resources = []
+    global_resources = []
+    get_resources_paginator = client.get_paginator("get_resources")
+    for page in get_resources_paginator.paginate():
+        for resource in page["ResourceTagMappingList"]:
+            # Avoid adding S3 buckets again:
+            if resource["ResourceARN"].split(":")[2] != "s3":
+                # Check if region is not in ARN --> Global service
+                if not resource["ResourceARN"].split(":")[3]:
+                    global_resources.append(
+                        {
+                            "arn": resource["ResourceARN"],
+                            "tags": resource["Tags"],
+                        }
+                    )
+                else:
+                    regional_resources.append(
+                        {
+                            "arn": resource["ResourceARN"],
+                            "tags": resource["Tags"],
+                        }
+                    )
+    return regional_resources, global_resources
+
+
 def create_inventory_table(resources: list, resources_in_region: dict) -> dict:
     regions_with_resources = list(resources_in_region.keys())
     services = {}
@@ -209,68 +225,60 @@ def create_inventory_table(resources: list, resources_in_region: dict) -> dict:
     return inventory_table
 
 
+def get_inventory_resource(item: dict, audit_info: AWS_Audit_Info) -> dict:
+    resource = {}
+    resource["AWS_AccountID"] = audit_info.audited_account
+    resource["AWS_Region"] = item["arn"].split(":")[3]
+    resource["AWS_Partition"] = item["arn"].split(":")[1]
+    resource["AWS_Service"] = item["arn"].split(":")[2]
+    resource["AWS_ResourceType"] = item["arn"].split(":")[5].split("/")[0]
+    resource["AWS_ResourceID"] = ""
+    if len(item["arn"].split("/")) > 1:
+        resource["AWS_ResourceID"] = item["arn"].split("/")[-1]
+    elif len(item["arn"].split(":")) > 6:
+        resource["AWS_ResourceID"] = item["arn"].split(":")[-1]
+    resource["AWS_ResourceARN"] = item["arn"]
+    # Cover S3 case
+    if resource["AWS_Service"] == "s3":
+        resource["AWS_ResourceType"] = "bucket"
+        resource["AWS_ResourceID"] = item["arn"].split(":")[-1]
+    # Cover WAFv2 case
+    if resource["AWS_Service"] == "wafv2":
+        resource["AWS_ResourceType"] = "/".join(
+            item["arn"].split(":")[-1].split("/")[:-2]
+        )
+        resource["AWS_ResourceID"] = "/".join(item["arn"].split(":")[-1].split("/")[2:])
+    # Cover Config case
+    if resource["AWS_Service"] == "config":
+        resource["AWS_ResourceID"] = "/".join(item["arn"].split(":")[-1].split("/")[1:])
+    resource["AWS_Tags"] = item["tags"]
+    return resource
+
+
 def create_output(resources: list, audit_info: AWS_Audit_Info, args):
-    json_output = []
     output_file = (
         f"prowler-inventory-{audit_info.audited_account}-{output_file_timestamp}"
     )
 
-    for item in sorted(resources, key=lambda d: d["arn"]):
-        resource = {}
-        resource["AWS_AccountID"] = audit_info.audited_account
-        resource["AWS_Region"] = item["arn"].split(":")[3]
-        resource["AWS_Partition"] = item["arn"].split(":")[1]
-        resource["AWS_Service"] = item["arn"].split(":")[2]
-        resource["AWS_ResourceType"] = item["arn"].split(":")[5].split("/")[0]
-        resource["AWS_ResourceID"] = ""
-        if len(item["arn"].split("/")) > 1:
-            resource["AWS_ResourceID"] = item["arn"].split("/")[-1]
-        elif len(item["arn"].split(":")) > 6:
-            resource["AWS_ResourceID"] = item["arn"].split(":")[-1]
-        resource["AWS_ResourceARN"] = item["arn"]
-        # Cover S3 case
-        if resource["AWS_Service"] == "s3":
-            resource["AWS_ResourceType"] = "bucket"
-            resource["AWS_ResourceID"] = item["arn"].split(":")[-1]
-        # Cover WAFv2 case
-        if resource["AWS_Service"] == "wafv2":
-            resource["AWS_ResourceType"] = "/".join(
-                item["arn"].split(":")[-1].split("/")[:-2]
-            )
-            resource["AWS_ResourceID"] = "/".join(
-                item["arn"].split(":")[-1].split("/")[2:]
-            )
-        # Cover Config case
-        if resource["AWS_Service"] == "config":
-            resource["AWS_ResourceID"] = "/".join(
-                item["arn"].split(":")[-1].split("/")[1:]
-            )
-        resource["AWS_Tags"] = item["tags"]
-        json_output.append(resource)
-
-    # Serializing json
-    json_object = json.dumps(json_output, indent=4)
-
-    # Writing to sample.json
+    # Every resource is written to both files as soon as it is built
     with open(
         args.output_directory + "/" + output_file + json_file_suffix, "w"
-    ) as outfile:
-        outfile.write(json_object)
-
-    csv_file = open(
+    ) as json_file, open(
         args.output_directory + "/" + output_file + csv_file_suffix, "w", newline=""
-    )
-    csv_writer = csv.writer(csv_file)
-
-    count = 0
-    for data in json_output:
-        if count == 0:
-            header = data.keys()
-            csv_writer.writerow(header)
-            count += 1
-        csv_writer.writerow(data.values())
+    ) as csv_file:
+        csv_writer = csv.writer(csv_file)
+        json_file.write("[")
+        for count, item in enumerate(sorted(resources, key=lambda d: d["arn"])):
+            resource = get_inventory_resource(item, audit_info)
+            if count == 0:
+                csv_writer.writerow(resource.keys())
+            else:
+                json_file.write(",")
+            csv_writer.writerow(resource.values())
+            # Same layout than dumping the whole list with an indent of 4
+            json_file.write("\n" + indent(json.dumps(resource, indent=4), "    "))
+        json_file.write("\n]" if resources else "]")
 
-    csv_file.close()
     print(
         f"\n{Fore.YELLOW}WARNING: Only resources that have or have had tags will appear (except for IAM and S3).\nSee more in https://docs.prowler.cloud/en/latest/tutorials/quick-inventory/#objections{Style.RESET_ALL}"
     )
@@ -298,39 +306,71 @@ def create_output(resources: list, audit_info: AWS_Audit_Info, args):
             )
 
 
-def get_regional_buckets(audit_info: AWS_Audit_Info, region: str) -> list:
-    regional_buckets = []
-    s3_client = audit_info.audit_session.client("s3", region_name=region)
+def get_buckets_per_region(audit_info: AWS_Audit_Info, regions: list) -> dict:
+    """Return the S3 buckets with their tags by region, only for the given regions"""
+    buckets_per_region = {}
+    # The clients are created before starting the threads since the session is not thread safe
+    s3_clients = {
+        region: audit_info.audit_session.client("s3", region_name=region)
+        for region in regions
+    }
+    s3_client = audit_info.audit_session.client(
+        "s3", region_name=audit_info.profile_region
+    )
     try:
-        buckets = s3_client.list_buckets()
-        for bucket in buckets["Buckets"]:
-            bucket_region = s3_client.get_bucket_location(Bucket=bucket["Name"])[
-                "LocationConstraint"
-            ]
-            if bucket_region == "EU":  # If EU, bucket_region is eu-west-1
-                bucket_region = "eu-west-1"
-            if not bucket_region:  # If None, bucket_region is us-east-1
-                bucket_region = "us-east-1"
-            if bucket_region == region:  # Only add bucket if is in current region
-                try:
-                    bucket_tags = s3_client.get_bucket_tagging(Bucket=bucket["Name"])[
-                        "TagSet"
-                    ]
-                except ClientError as error:
-                    bucket_tags = []
-                    if error.response["Error"]["Code"] != "NoSuchTagSet":
-                        logger.error(
-                            f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                bucket_arn = (
-                    f"arn:{audit_info.audited_partition}:s3:{region}::{bucket['Name']}"
-                )
-                regional_buckets.append({"arn": bucket_arn, "tags": bucket_tags})
+        buckets = s3_client.list_buckets()["Buckets"]
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
         )
-    return regional_buckets
+        return buckets_per_region
+
+    def get_bucket(bucket_name):
+        bucket_region = s3_client.get_bucket_location(Bucket=bucket_name)[
+            "LocationConstraint"
+        ]
+        if bucket_region == "EU":  # If EU, bucket_region is eu-west-1
+            bucket_region = "eu-west-1"
+        if not bucket_region:  # If None, bucket_region is us-east-1
+            bucket_region = "us-east-1"
+        if bucket_region not in s3_clients:  # Only add buckets in the audited regions
+            return None
+        try:
+            bucket_tags = s3_clients[bucket_region].get_bucket_tagging(
+                Bucket=bucket_name
+            )["TagSet"]
+        except ClientError as error:
+            bucket_tags = []
+            if error.response["Error"]["Code"] != "NoSuchTagSet":
+                logger.error(
+                    f"{bucket_region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        bucket_arn = (
+            f"arn:{audit_info.audited_partition}:s3:{bucket_region}::{bucket_name}"
+        )
+        return bucket_region, {"arn": bucket_arn, "tags": bucket_tags}
+
+    with ThreadPoolExecutor(
+        max_workers=get_config_var("max_s3_workers") or default_s3_max_workers,
+        thread_name_prefix="prowler-inventory-s3",
+    ) as executor:
+        futures = {
+            executor.submit(get_bucket, bucket["Name"]): bucket["Name"]
+            for bucket in buckets
+        }
+        for future in as_completed(futures):
+            try:
+                bucket = future.result()
+                if bucket:
+                    buckets_per_region.setdefault(bucket[0], []).append(bucket[1])
+            except Exception as error:
+                logger.error(
+                    f"{futures[future]} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+    # Keep the buckets order regardless of the order the threads finish
+    for regional_buckets in buckets_per_region.values():
+        regional_buckets.sort(key=lambda bucket: bucket["arn"])
+    return buckets_per_region
 
 
 def get_iam_resources(session) -> list:
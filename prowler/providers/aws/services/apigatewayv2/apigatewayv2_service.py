@@ -1,11 +1,10 @@
-import threading
 from typing import Optional
 
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import generate_regional_clients, threading_call
 
 
 ################## ApiGatewayV2
@@ -26,13 +25,7 @@ class ApiGatewayV2:
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        threading_call(call, self.regional_clients.values())
 
     def __get_apis__(self, regional_client):
         logger.info("APIGatewayv2 - Getting APIs...")
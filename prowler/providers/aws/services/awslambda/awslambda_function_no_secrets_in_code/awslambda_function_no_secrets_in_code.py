@@ -1,67 +1,163 @@
-import os
-import tempfile
-
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
+from prowler.config.config import get_config_var
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.logger import logger
+from prowler.lib.utils.utils import detect_secrets_scan_batch
 from prowler.providers.aws.services.awslambda.awslambda_client import awslambda_client
 
+# Default limits of the Lambda code scan
+default_max_lambda_code_workers = 4
+default_max_lambda_code_memory_mb = 512
+default_max_lambda_code_file_size_kb = 1024
+
 
 class awslambda_function_no_secrets_in_code(Check):
     def execute(self):
         findings = []
-        for function in awslambda_client.functions.values():
-            if function.code:
-                report = Check_Report_AWS(self.metadata())
-                report.region = function.region
-                report.resource_id = function.name
-                report.resource_arn = function.arn
-                report.resource_tags = function.tags
-
-                report.status = "PASS"
-                report.status_extended = (
-                    f"No secrets found in Lambda function {function.name} code"
+        functions = [
+            function
+            for function in awslambda_client.functions.values()
+            if function.code
+        ]
+        max_file_size = (
+            get_config_var("max_lambda_code_file_size_kb")
+            or default_max_lambda_code_file_size_kb
+        ) * 1024
+        memory_budget = Memory_Budget(
+            (
+                get_config_var("max_lambda_code_memory_mb")
+                or default_max_lambda_code_memory_mb
+            )
+            * 1024
+            * 1024
+        )
+        # The code packages are downloaded and scanned by a bounded number of workers
+        with ThreadPoolExecutor(
+            max_workers=get_config_var("max_lambda_code_workers")
+            or default_max_lambda_code_workers
+        ) as executor:
+            functions_secrets_findings = list(
+                executor.map(
+                    lambda function: scan_function_code(
+                        function, memory_budget, max_file_size
+                    ),
+                    functions,
                 )
-                with tempfile.TemporaryDirectory() as tmp_dir_name:
-                    function.code.code_zip.extractall(tmp_dir_name)
-                    # List all files
-                    files_in_zip = next(os.walk(tmp_dir_name))[2]
-                    secrets_findings = []
-                    for file in files_in_zip:
-                        secrets = SecretsCollection()
-                        with default_settings():
-                            secrets.scan_file(f"{tmp_dir_name}/{file}")
-                        detect_secrets_output = secrets.json()
-                        if detect_secrets_output:
-                            for (
-                                file_name
-                            ) in (
-                                detect_secrets_output.keys()
-                            ):  # Appears that only 1 file is being scanned at a time, so could rework this
-                                output_file_name = file_name.replace(
-                                    f"{tmp_dir_name}/", ""
-                                )
-                                secrets_string = ", ".join(
-                                    [
-                                        f"{secret['type']} on line {secret['line_number']}"
-                                        for secret in detect_secrets_output[file_name]
-                                    ]
-                                )
-                                secrets_findings.append(
-                                    f"{output_file_name}: {secrets_string}"
-                                )
-
-                    if secrets_findings:
-                        final_output_string = "; ".join(secrets_findings)
-                        report.status = "FAIL"
-                        # report.status_extended = f"Potential {'secrets' if len(secrets_findings)>1 else 'secret'} found in Lambda function {function.name} code. {final_output_string}"
-                        if len(secrets_findings) > 1:
-                            report.status_extended = f"Potential secrets found in Lambda function {function.name} code -> {final_output_string}"
-                        else:
-                            report.status_extended = f"Potential secret found in Lambda function {function.name} code -> {final_output_string}"
-                        # break // Don't break as there may be additional findings
-
-                findings.append(report)
+            )
+
+        for function, secrets_findings in zip(functions, functions_secrets_findings):
+            # The functions whose code package could not be read are not reported
+            if secrets_findings is None:
+                continue
+            report = Check_Report_AWS(self.metadata())
+            report.region = function.region
+            report.resource_id = function.name
+            report.resource_arn = function.arn
+            report.resource_tags = function.tags
+
+            report.status = "PASS"
+            report.status_extended = (
+                f"No secrets found in Lambda function {function.name} code"
+            )
+            if secrets_findings:
+                final_output_string = "; ".join(secrets_findings)
+                report.status = "FAIL"
+                if len(secrets_findings) > 1:
+                    report.status_extended = f"Potential secrets found in Lambda function {function.name} code -> {final_output_string}"
+                else:
+                    report.status_extended = f"Potential secret found in Lambda function {function.name} code -> {final_output_string}"
+
+            findings.append(report)
 
         return findings
+
+
+def scan_function_code(function, memory_budget, max_file_size: int) -> Optional[list]:
+    """
+    scan_function_code reads the files at the root of the code package of the function without writing them to disk,
+    the package is read with range requests so only its central directory and these files are downloaded.
+    Binary files and files bigger than max_file_size are skipped, and the files of the package are scanned in one batch.
+    Returns None if the code package cannot be read.
+    """
+    code_zip = function.code.code_zip or awslambda_client.get_function_code(function)
+    if not code_zip:
+        return None
+    code_package = code_zip.fp
+    try:
+        code_files = []
+        for code_file in code_zip.infolist():
+            # Only the files at the root of the package are scanned
+            if code_file.is_dir() or "/" in code_file.filename:
+                continue
+            if code_file.file_size > max_file_size:
+                logger.info(
+                    f"Lambda function {function.name} file {code_file.filename} is too big to be scanned"
+                )
+                continue
+            code_files.append(code_file)
+        # The files of the package are held in memory until their batch is scanned
+        code_files_size = sum(code_file.file_size for code_file in code_files)
+        memory_budget.reserve(code_files_size)
+        try:
+            codes = []
+            filenames = []
+            for code_file in code_files:
+                with code_zip.open(code_file) as code_file_data:
+                    code = code_file_data.read(max_file_size + 1)
+                if len(code) > max_file_size:
+                    continue
+                try:
+                    codes.append(code.decode("utf-8"))
+                except UnicodeDecodeError:
+                    # Binary files are not scanned
+                    continue
+                filenames.append(code_file.filename)
+
+            secrets_findings = []
+            for filename, detect_secrets_output in zip(
+                filenames, detect_secrets_scan_batch(codes, filenames)
+            ):
+                if detect_secrets_output:
+                    secrets_string = ", ".join(
+                        [
+                            f"{secret['type']} on line {secret['line_number']}"
+                            for secret in detect_secrets_output
+                        ]
+                    )
+                    secrets_findings.append(f"{filename}: {secrets_string}")
+            return secrets_findings
+        finally:
+            memory_budget.release(code_files_size)
+    except Exception as error:
+        logger.error(
+            f"{function.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return None
+    finally:
+        code_zip.close()
+        code_package.close()
+
+
+class Memory_Budget:
+    """Memory_Budget blocks the workers until the bytes they reserve fit in the budget"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+        self.condition = threading.Condition()
+
+    def reserve(self, size: int):
+        with self.condition:
+            # A package bigger than the budget is scanned alone
+            self.condition.wait_for(
+                lambda: not self.used or self.used + size <= self.limit
+            )
+            self.used += size
+
+    def release(self, size: int):
+        with self.condition:
+            self.used -= size
+            self.condition.notify_all()
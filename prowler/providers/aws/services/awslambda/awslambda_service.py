@@ -1,6 +1,5 @@
 import io
 import json
-import threading
 import zipfile
 from enum import Enum
 from typing import Any, Optional
@@ -11,11 +10,26 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    Checks_Attributes,
+    generate_regional_clients,
+    threading_call,
+)
+
+# Bytes of the code packages downloaded with every range request
+lambda_code_package_read_size = 1024 * 1024
 
 
 ################## Lambda
 class Lambda:
+    # Attributes fetched one call per function, only gathered for the checks reading them
+    checks_attributes = Checks_Attributes(
+        client="awslambda",
+        attributes=[
+            "code",
+        ],
+    )
+
     def __init__(self, audit_info):
         self.service = "lambda"
         self.session = audit_info.audit_session
@@ -26,12 +40,10 @@ class Lambda:
         self.__threading_call__(self.__list_functions__)
         self.__list_tags_for_resource__()
 
-        # We only want to retrieve the Lambda code if the
-        # awslambda_function_no_secrets_in_code check is set
-        if (
-            "awslambda_function_no_secrets_in_code"
-            in audit_info.audit_metadata.expected_checks
-        ):
+        self.audited_attributes = self.checks_attributes.get_audited_attributes(
+            audit_info
+        )
+        if "code" in self.audited_attributes:
             self.__threading_call__(self.__get_function__)
 
         self.__threading_call__(self.__get_policy__)
@@ -41,13 +53,7 @@ class Lambda:
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        threading_call(call, self.regional_clients.values())
 
     def __list_functions__(self, regional_client):
         logger.info("Lambda - Listing Functions...")
@@ -92,11 +98,13 @@ class Lambda:
                         FunctionName=function.name
                     )
                     if "Location" in function_information["Code"]:
-                        code_location_uri = function_information["Code"]["Location"]
-                        raw_code_zip = requests.get(code_location_uri).content
+                        # The code package is downloaded when it is scanned,
+                        # so they are not all kept in memory at the same time
                         self.functions[function.arn].code = LambdaCode(
-                            location=code_location_uri,
-                            code_zip=zipfile.ZipFile(io.BytesIO(raw_code_zip)),
+                            location=function_information["Code"]["Location"],
+                            size=function_information["Configuration"].get(
+                                "CodeSize", 0
+                            ),
                         )
 
         except Exception as error:
@@ -106,6 +114,39 @@ class Lambda:
                 f" {error}"
             )
 
+    def get_function_code(self, function) -> Optional[zipfile.ZipFile]:
+        """
+        Open the code package of the function, its central directory and files are downloaded when they are read.
+        Return None if the package cannot be read.
+        """
+        try:
+            regional_client = self.regional_clients[function.region]
+
+            def get_code_location():
+                # The pre-signed location expires, so it is requested again
+                function.code.location = regional_client.get_function(
+                    FunctionName=function.name
+                )["Code"]["Location"]
+                return function.code.location
+
+            return zipfile.ZipFile(
+                io.BufferedReader(
+                    Lambda_Code_Package(
+                        function.code.location,
+                        function.code.size,
+                        get_code_location,
+                    ),
+                    buffer_size=lambda_code_package_read_size,
+                )
+            )
+        except Exception as error:
+            logger.error(
+                f"{function.region} --"
+                f" {error.__class__.__name__}[{error.__traceback__.tb_lineno}]:"
+                f" {error}"
+            )
+            return None
+
     def __get_policy__(self, regional_client):
         logger.info("Lambda - Getting Policy...")
         try:
@@ -176,9 +217,66 @@ class Lambda:
             )
 
 
+class Lambda_Code_Package(io.RawIOBase):
+    """
+    Lambda_Code_Package reads the code package of a function from its pre-signed location with HTTP range requests,
+    so zipfile only downloads the central directory and the files it reads instead of the whole package.
+    """
+
+    def __init__(self, location: str, size: int, get_location):
+        self.location = location
+        self.size = size
+        self.get_location = get_location
+        self.position = 0
+        self.session = requests.Session()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        self.position = max(offset, 0)
+        return self.position
+
+    def readinto(self, buffer) -> int:
+        if self.position >= self.size:
+            return 0
+        end = min(self.position + len(buffer), self.size) - 1
+        data = self.__get_range__(self.position, end)
+        buffer[: len(data)] = data
+        self.position += len(data)
+        return len(data)
+
+    def __get_range__(self, start: int, end: int) -> bytes:
+        headers = {"Range": f"bytes={start}-{end}"}
+        response = self.session.get(self.location, headers=headers)
+        if response.status_code == 403:
+            self.location = self.get_location()
+            response = self.session.get(self.location, headers=headers)
+        if response.status_code != 206:
+            raise requests.HTTPError(
+                f"Range request of the code package failed with status {response.status_code}"
+            )
+        return response.content
+
+    def close(self):
+        self.session.close()
+        super().close()
+
+
 class LambdaCode(BaseModel):
     location: str
-    code_zip: Any
+    size: int = 0
+    code_zip: Any = None
 
 
 class AuthType(Enum):
@@ -1,4 +1,3 @@
-import threading
 from datetime import datetime
 from typing import Optional
 
@@ -9,6 +8,7 @@ from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import (
     generate_regional_clients,
     get_default_region,
+    threading_call,
 )
 
 
@@ -31,13 +31,7 @@ class Backup:
         self.__threading_call__(self.__list_backup_report_plans__)
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        threading_call(call, self.regional_clients.values())
 
     def __list_backup_vaults__(self, regional_client):
         logger.info("Backup - Listing Backup Vaults...")
@@ -1,10 +1,5 @@
-import os
-import tempfile
-
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
-
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.utils.utils import detect_secrets_scan_batch
 from prowler.providers.aws.services.cloudformation.cloudformation_client import (
     cloudformation_client,
 )
@@ -16,6 +11,8 @@ class cloudformation_stack_outputs_find_secrets(Check):
     def execute(self):
         """Execute the cloudformation_stack_outputs_find_secrets check"""
         findings = []
+        scanned_stacks = []
+        stack_outputs_payloads = []
         for stack in cloudformation_client.stacks:
             report = Check_Report_AWS(self.metadata())
             report.region = stack.region
@@ -25,30 +22,24 @@ class cloudformation_stack_outputs_find_secrets(Check):
             report.status = "PASS"
             report.status_extended = f"No secrets found in Stack {stack.name} Outputs."
             if stack.outputs:
-                temp_output_file = tempfile.NamedTemporaryFile(delete=False)
-
-                # Store the CloudFormation Stack Outputs into a file
-                for output in stack.outputs:
-                    temp_output_file.write(f"{output}".encode())
-                temp_output_file.close()
-
-                # Init detect_secrets
-                secrets = SecretsCollection()
-                # Scan file for secrets
-                with default_settings():
-                    secrets.scan_file(temp_output_file.name)
-
-                if secrets.json():
-                    report.status = "FAIL"
-                    report.status_extended = (
-                        f"Potential secret found in Stack {stack.name} Outputs."
-                    )
-
-                os.remove(temp_output_file.name)
+                scanned_stacks.append((report, stack))
+                stack_outputs_payloads.append(
+                    "".join(f"{output}" for output in stack.outputs)
+                )
             else:
                 report.status = "PASS"
                 report.status_extended = f"CloudFormation {stack.name} has no Outputs."
 
             findings.append(report)
 
+        # Scan the CloudFormation Stack Outputs of all the stacks for secrets in one batch
+        for (report, stack), detect_secrets_output in zip(
+            scanned_stacks, detect_secrets_scan_batch(stack_outputs_payloads)
+        ):
+            if detect_secrets_output:
+                report.status = "FAIL"
+                report.status_extended = (
+                    f"Potential secret found in Stack {stack.name} Outputs."
+                )
+
         return findings
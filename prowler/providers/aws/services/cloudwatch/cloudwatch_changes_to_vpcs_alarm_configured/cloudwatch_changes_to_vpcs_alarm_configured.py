@@ -28,8 +28,10 @@ class cloudwatch_changes_to_vpcs_alarm_configured(Check):
             if trail.log_group_arn:
                 log_groups.append(trail.log_group_arn.split(":")[6])
         # 2. Describe metric filters for previous log groups
-        for metric_filter in logs_client.metric_filters:
-            if metric_filter.log_group in log_groups:
+        for log_group in dict.fromkeys(log_groups):
+            for metric_filter in logs_client.metric_filters_by_log_group.get(
+                log_group, []
+            ):
                 if re.search(pattern, metric_filter.pattern):
                     report.resource_id = metric_filter.log_group
                     report.resource_arn = metric_filter.arn
@@ -37,11 +39,11 @@ class cloudwatch_changes_to_vpcs_alarm_configured(Check):
                     report.status = "FAIL"
                     report.status_extended = f"CloudWatch log group {metric_filter.log_group} found with metric filter {metric_filter.name} but no alarms associated."
                     # 3. Check if there is an alarm for the metric
-                    for alarm in cloudwatch_client.metric_alarms:
-                        if alarm.metric == metric_filter.metric:
-                            report.status = "PASS"
-                            report.status_extended = f"CloudWatch log group {metric_filter.log_group} found with metric filter {metric_filter.name} and alarms set."
-                            break
+                    if cloudwatch_client.metric_alarms_by_metric.get(
+                        metric_filter.metric
+                    ):
+                        report.status = "PASS"
+                        report.status_extended = f"CloudWatch log group {metric_filter.log_group} found with metric filter {metric_filter.name} and alarms set."
 
         findings.append(report)
         return findings
@@ -1,7 +1,7 @@
 from json import dumps, loads
 
 from prowler.lib.check.models import Check, Check_Report_AWS
-from prowler.lib.utils.utils import detect_secrets_scan
+from prowler.lib.utils.utils import detect_secrets_scan, detect_secrets_scan_batch
 from prowler.providers.aws.services.cloudwatch.cloudwatch_service import (
     convert_to_cloudwatch_timestamp_format,
 )
@@ -11,6 +11,17 @@ from prowler.providers.aws.services.cloudwatch.logs_client import logs_client
 class cloudwatch_log_group_no_secrets_in_logs(Check):
     def execute(self):
         findings = []
+        # Scan the log streams of all the log groups in one batch
+        log_streams_secrets_output = iter(
+            detect_secrets_scan_batch(
+                [
+                    "\n".join([dumps(event["message"]) for event in log_stream])
+                    for log_group in logs_client.log_groups
+                    if log_group.log_streams
+                    for log_stream in log_group.log_streams.values()
+                ]
+            )
+        )
         for log_group in logs_client.log_groups:
             report = Check_Report_AWS(self.metadata())
             report.status = "PASS"
@@ -22,14 +33,7 @@ class cloudwatch_log_group_no_secrets_in_logs(Check):
             if log_group.log_streams:
                 for log_stream_name in log_group.log_streams:
                     log_stream_secrets = {}
-                    log_stream_data = "\n".join(
-                        [
-                            dumps(event["message"])
-                            for event in log_group.log_streams[log_stream_name]
-                        ]
-                    )
-                    log_stream_secrets_output = detect_secrets_scan(log_stream_data)
-
+                    log_stream_secrets_output = next(log_streams_secrets_output)
                     if log_stream_secrets_output:
                         for secret in log_stream_secrets_output:
                             flagged_event = log_group.log_streams[log_stream_name][
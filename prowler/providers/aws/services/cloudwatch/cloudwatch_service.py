@@ -1,4 +1,3 @@
-import threading
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -7,11 +6,19 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    Checks_Attributes,
+    Resource_Index,
+    generate_regional_clients,
+    threading_call,
+)
 
 
 ################## CloudWatch
 class CloudWatch:
+    # Lookup indexes for the checks joining resources across services
+    metric_alarms_by_metric = Resource_Index("metric_alarms", "metric", grouped=True)
+
     def __init__(self, audit_info):
         self.service = "cloudwatch"
         self.session = audit_info.audit_session
@@ -32,13 +39,7 @@ class CloudWatch:
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        threading_call(call, self.regional_clients.values())
 
     def __describe_alarms__(self, regional_client):
         logger.info("CloudWatch - Describing alarms...")
@@ -86,6 +87,18 @@ class CloudWatch:
 
 ################## CloudWatch Logs
 class Logs:
+    # Lookup indexes for the checks joining resources across services
+    metric_filters_by_log_group = Resource_Index(
+        "metric_filters", "log_group", grouped=True
+    )
+    # Attributes fetched one call per log group, only gathered for the checks reading them
+    checks_attributes = Checks_Attributes(
+        client="logs",
+        attributes=[
+            "log_events",
+        ],
+    )
+
     def __init__(self, audit_info):
         self.service = "logs"
         self.session = audit_info.audit_session
@@ -97,10 +110,10 @@ class Logs:
         self.log_groups = []
         self.__threading_call__(self.__describe_metric_filters__)
         self.__threading_call__(self.__describe_log_groups__)
-        if (
-            "cloudwatch_log_group_no_secrets_in_logs"
-            in audit_info.audit_metadata.expected_checks
-        ):
+        self.audited_attributes = self.checks_attributes.get_audited_attributes(
+            audit_info
+        )
+        if "log_events" in self.audited_attributes:
             self.events_per_log_group_threshold = (
                 1000  # The threshold for number of events to return per log group.
             )
@@ -111,13 +124,7 @@ class Logs:
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        threading_call(call, self.regional_clients.values())
 
     def __describe_metric_filters__(self, regional_client):
         logger.info("CloudWatch Logs - Describing metric filters...")
@@ -1,4 +1,3 @@
-import threading
 from datetime import datetime
 from enum import Enum
 from typing import Optional, Union
@@ -8,7 +7,7 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import generate_regional_clients, threading_call
 
 
 ################## DirectoryService
@@ -31,13 +30,7 @@ class DirectoryService:
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        threading_call(call, self.regional_clients.values())
 
     def __describe_directories__(self, regional_client):
         logger.info("DirectoryService - Describing Directories...")
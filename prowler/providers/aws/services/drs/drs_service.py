@@ -1,5 +1,3 @@
-import threading
-
 from botocore.client import ClientError
 from pydantic import BaseModel
 
@@ -8,6 +6,7 @@ from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import (
     generate_regional_clients,
     get_default_region,
+    threading_call,
 )
 
 ################## DRS (Elastic Disaster Recovery Service)
@@ -30,13 +29,7 @@ class DRS:
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        threading_call(call, self.regional_clients.values())
 
     def __describe_jobs__(self, regional_client):
         logger.info("DRS - Describe Jobs...")
@@ -1,18 +1,16 @@
-import os
-import tempfile
 import zlib
 from base64 import b64decode
 
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
-
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.utils.utils import detect_secrets_scan_batch
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
 
 
 class ec2_instance_secrets_user_data(Check):
     def execute(self):
         findings = []
+        scanned_instances = []
+        user_data_payloads = []
         for instance in ec2_client.instances:
             if instance.state != "terminated":
                 report = Check_Report_AWS(self.metadata())
@@ -21,7 +19,6 @@ class ec2_instance_secrets_user_data(Check):
                 report.resource_arn = instance.arn
                 report.resource_tags = instance.tags
                 if instance.user_data:
-                    temp_user_data_file = tempfile.NamedTemporaryFile(delete=False)
                     user_data = b64decode(instance.user_data)
                     if user_data[0:2] == b"\x1f\x8b":  # GZIP magic number
                         user_data = zlib.decompress(
@@ -30,28 +27,26 @@ class ec2_instance_secrets_user_data(Check):
                     else:
                         user_data = user_data.decode("utf-8")
 
-                    temp_user_data_file.write(
-                        bytes(user_data, encoding="raw_unicode_escape")
+                    report.status = "PASS"
+                    report.status_extended = (
+                        f"No secrets found in EC2 instance {instance.id} User Data."
                     )
-                    temp_user_data_file.close()
-                    secrets = SecretsCollection()
-                    with default_settings():
-                        secrets.scan_file(temp_user_data_file.name)
-
-                    if secrets.json():
-                        report.status = "FAIL"
-                        report.status_extended = f"Potential secret found in EC2 instance {instance.id} User Data."
-                    else:
-                        report.status = "PASS"
-                        report.status_extended = (
-                            f"No secrets found in EC2 instance {instance.id} User Data."
-                        )
-
-                    os.remove(temp_user_data_file.name)
+                    scanned_instances.append((report, instance))
+                    user_data_payloads.append(user_data)
                 else:
                     report.status = "PASS"
                     report.status_extended = f"No secrets found in EC2 instance {instance.id} since User Data is empty."
 
                 findings.append(report)
 
+        # Scan the User Data of all the instances in one batch
+        for (report, instance), detect_secrets_output in zip(
+            scanned_instances, detect_secrets_scan_batch(user_data_payloads)
+        ):
+            if detect_secrets_output:
+                report.status = "FAIL"
+                report.status_extended = (
+                    f"Potential secret found in EC2 instance {instance.id} User Data."
+                )
+
         return findings
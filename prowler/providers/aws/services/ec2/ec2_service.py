@@ -1,18 +1,41 @@
-import threading
 from datetime import datetime
 from typing import Optional
 
 from botocore.client import ClientError
 from pydantic import BaseModel
 
+from prowler.config.config import get_config_var
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
-from prowler.providers.aws.services.ec2.lib.security_groups import check_security_group
+from prowler.providers.aws.aws_provider import (
+    Checks_Attributes,
+    Resource_Index,
+    Throttled_Calls_Executor,
+    generate_regional_clients,
+    threading_call,
+)
+from prowler.providers.aws.services.ec2.lib.security_groups import (
+    check_security_group_exposure,
+    get_security_group_exposure,
+)
+
+# Default number of resources whose attributes are fetched in parallel in every region
+default_max_ec2_workers = 10
 
 
 ################## EC2
 class EC2:
+    # Lookup indexes for the checks joining resources across services
+    security_groups_by_id = Resource_Index("security_groups", "id")
+    # Attributes fetched one call per resource, only gathered for the checks reading them
+    checks_attributes = Checks_Attributes(
+        client="ec2",
+        attributes=[
+            "user_data",
+            "snapshots_public",
+        ],
+    )
+
     def __init__(self, audit_info):
         self.service = "ec2"
         self.session = audit_info.audit_session
@@ -21,17 +44,23 @@ class EC2:
         self.audited_account_arn = audit_info.audited_account_arn
         self.audit_resources = audit_info.audit_resources
         self.audited_checks = audit_info.audit_metadata.expected_checks
+        self.audited_attributes = self.checks_attributes.get_audited_attributes(
+            audit_info
+        )
         self.regional_clients = generate_regional_clients(self.service, audit_info)
+        self.max_workers = get_config_var("max_ec2_workers") or default_max_ec2_workers
         self.instances = []
         self.__threading_call__(self.__describe_instances__)
-        self.__get_instance_user_data__()
+        if "user_data" in self.audited_attributes:
+            self.__threading_call__(self.__get_instances_user_data__)
         self.security_groups = []
         self.__threading_call__(self.__describe_security_groups__)
         self.network_acls = []
         self.__threading_call__(self.__describe_network_acls__)
         self.snapshots = []
         self.__threading_call__(self.__describe_snapshots__)
-        self.__get_snapshot_public__()
+        if "snapshots_public" in self.audited_attributes:
+            self.__threading_call__(self.__get_snapshots_public__)
         self.network_interfaces = []
         self.__threading_call__(self.__describe_public_network_interfaces__)
         self.__threading_call__(self.__describe_sg_network_interfaces__)
@@ -48,13 +77,7 @@ class EC2:
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        threading_call(call, self.regional_clients.values())
 
     def __describe_instances__(self, regional_client):
         logger.info("EC2 - Describing EC2 Instances...")
@@ -127,18 +150,16 @@ class EC2:
                     if not self.audit_resources or (
                         is_resource_filtered(arn, self.audit_resources)
                     ):
+                        # Index the ingress open to the Internet once for all the checks
+                        public_ingress = get_security_group_exposure(
+                            sg["IpPermissions"], any_address=True
+                        )
                         # check if sg has public access to all ports to reduce noise
-                        all_public_ports = False
-                        for ingress_rule in sg["IpPermissions"]:
-                            if (
-                                check_security_group(
-                                    ingress_rule, "-1", any_address=True
-                                )
-                                and "ec2_securitygroup_allow_ingress_from_internet_to_any_port"
-                                in self.audited_checks
-                            ):
-                                all_public_ports = True
-                                break
+                        all_public_ports = (
+                            check_security_group_exposure(public_ingress, "-1")
+                            and "ec2_securitygroup_allow_ingress_from_internet_to_any_port"
+                            in self.audited_checks
+                        )
                         self.security_groups.append(
                             SecurityGroup(
                                 name=sg["GroupName"],
@@ -148,6 +169,7 @@ class EC2:
                                 ingress_rules=sg["IpPermissions"],
                                 egress_rules=sg["IpPermissionsEgress"],
                                 public_ports=all_public_ports,
+                                public_ingress=public_ingress,
                                 tags=sg.get("Tags"),
                             )
                         )
@@ -211,32 +233,55 @@ class EC2:
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __get_snapshot_public__(self):
-        logger.info("EC2 - Gettting snapshots encryption...")
-        for snapshot in self.snapshots:
-            try:
-                regional_client = self.regional_clients[snapshot.region]
-                snapshot_public = regional_client.describe_snapshot_attribute(
-                    Attribute="createVolumePermission", SnapshotId=snapshot.id
-                )
-                for permission in snapshot_public["CreateVolumePermissions"]:
-                    if "Group" in permission:
-                        if permission["Group"] == "all":
-                            snapshot.public = True
-
-            except ClientError as error:
-                if error.response["Error"]["Code"] == "InvalidSnapshot.NotFound":
-                    logger.warning(
-                        f"{snapshot.region} --"
-                        f" {error.__class__.__name__}[{error.__traceback__.tb_lineno}]:"
-                        f" {error}"
-                    )
-                    continue
+    def __get_snapshots_public__(self, regional_client):
+        logger.info("EC2 - Getting public snapshots...")
+        regional_snapshots = {
+            snapshot.id: snapshot
+            for snapshot in self.snapshots
+            if snapshot.region == regional_client.region
+        }
+        if not regional_snapshots:
+            return
+        try:
+            # Only the snapshots restorable by everyone are returned, in a few pages instead of one call per snapshot
+            describe_snapshots_paginator = regional_client.get_paginator(
+                "describe_snapshots"
+            )
+            for page in describe_snapshots_paginator.paginate(
+                OwnerIds=["self"], RestorableByUserIds=["all"]
+            ):
+                for snapshot in page["Snapshots"]:
+                    if snapshot["SnapshotId"] in regional_snapshots:
+                        regional_snapshots[snapshot["SnapshotId"]].public = True
+        except Exception as error:
+            logger.warning(
+                f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            # Fall back to one call per snapshot
+            Throttled_Calls_Executor(self.max_workers).threading_call(
+                self.__get_snapshot_public__, regional_snapshots.values()
+            )
 
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+    def __get_snapshot_public__(self, snapshot):
+        try:
+            snapshot_public = self.regional_clients[
+                snapshot.region
+            ].describe_snapshot_attribute(
+                Attribute="createVolumePermission", SnapshotId=snapshot.id
+            )
+            for permission in snapshot_public["CreateVolumePermissions"]:
+                if "Group" in permission:
+                    if permission["Group"] == "all":
+                        snapshot.public = True
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "InvalidSnapshot.NotFound":
+                logger.warning(
+                    f"{snapshot.region} --"
+                    f" {error.__class__.__name__}[{error.__traceback__.tb_lineno}]:"
+                    f" {error}"
                 )
+            else:
+                raise
 
     def __describe_public_network_interfaces__(self, regional_client):
         logger.info("EC2 - Describing Network Interfaces...")
@@ -291,27 +336,34 @@ class EC2:
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __get_instance_user_data__(self):
-        logger.info("EC2 - Gettting instance user data...")
-        for instance in self.instances:
-            try:
-                regional_client = self.regional_clients[instance.region]
-                user_data = regional_client.describe_instance_attribute(
-                    Attribute="userData", InstanceId=instance.id
-                )["UserData"]
-                if "Value" in user_data:
-                    instance.user_data = user_data["Value"]
-
-            except ClientError as error:
-                if error.response["Error"]["Code"] == "InvalidInstanceID.NotFound":
-                    logger.warning(
-                        f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-                    continue
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+    def __get_instances_user_data__(self, regional_client):
+        logger.info("EC2 - Getting instances user data...")
+        # The calls are slowed down if EC2 throttles them in the region
+        Throttled_Calls_Executor(self.max_workers).threading_call(
+            self.__get_instance_user_data__,
+            [
+                instance
+                for instance in self.instances
+                if instance.region == regional_client.region
+            ],
+        )
+
+    def __get_instance_user_data__(self, instance):
+        try:
+            user_data = self.regional_clients[
+                instance.region
+            ].describe_instance_attribute(Attribute="userData", InstanceId=instance.id)[
+                "UserData"
+            ]
+            if "Value" in user_data:
+                instance.user_data = user_data["Value"]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "InvalidInstanceID.NotFound":
+                logger.warning(
+                    f"{instance.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+            else:
+                raise
 
     def __describe_images__(self, regional_client):
         logger.info("EC2 - Describing Images...")
@@ -456,6 +508,8 @@ class SecurityGroup(BaseModel):
     region: str
     id: str
     public_ports: bool
+    # (protocol, from_port, to_port) intervals open to the Internet
+    public_ingress: list[tuple] = []
     network_interfaces: list[str] = []
     ingress_rules: list[dict]
     egress_rules: list[dict]
@@ -1,4 +1,5 @@
 import ipaddress
+from functools import lru_cache
 from typing import Any
 
 
@@ -33,65 +34,92 @@ def check_security_group(
 
     @param ports: List of ports to check. (Default: [])
 
+    @param any_address: If True, only 0.0.0.0/0 will be public and do not search for public addresses. (Default: False)
+    """
+    return check_security_group_exposure(
+        get_ingress_rule_exposure(ingress_rule, any_address), protocol, ports
+    )
+
+
+def get_ingress_rule_exposure(ingress_rule: Any, any_address: bool = False) -> list:
+    """
+    Return the public exposure of the security group ingress rule as a list of (protocol, from_port, to_port) intervals.
+    A ("-1", None, None) interval means that all the traffic is public.
+
+    @param ingress_rule: AWS Security Group IpPermissions Ingress Rule
+
     @param any_address: If True, only 0.0.0.0/0 will be public and do not search for public addresses. (Default: False)
     """
     # Check for all traffic ingress rules regardless of the protocol
     if ingress_rule["IpProtocol"] == "-1":
         for ip_ingress_rule in ingress_rule["IpRanges"]:
             if _is_cidr_public(ip_ingress_rule["CidrIp"], any_address):
-                return True
+                return [("-1", None, None)]
         for ip_ingress_rule in ingress_rule["Ipv6Ranges"]:
             if _is_cidr_public(ip_ingress_rule["CidrIpv6"], any_address):
-                return True
+                return [("-1", None, None)]
 
     # Check for specific ports in ingress rules
     if "FromPort" in ingress_rule:
-        # If there is a port range
-        if ingress_rule["FromPort"] != ingress_rule["ToPort"]:
-            # Calculate port range, adding 1
-            diff = (ingress_rule["ToPort"] - ingress_rule["FromPort"]) + 1
-            ingress_port_range = []
-            for x in range(diff):
-                ingress_port_range.append(int(ingress_rule["FromPort"]) + x)
-        # If FromPort and ToPort are the same
-        else:
-            ingress_port_range = []
-            ingress_port_range.append(int(ingress_rule["FromPort"]))
-
-        # Test Security Group
         # IPv4
-        for ip_ingress_rule in ingress_rule["IpRanges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIp"], any_address):
-                # If there are input ports to check
-                if ports:
-                    for port in ports:
-                        if (
-                            port in ingress_port_range
-                            and ingress_rule["IpProtocol"] == protocol
-                        ):
-                            return True
-                # If no input ports check if all ports are open
-                if len(set(ingress_port_range)) == 65536:
-                    return True
-
+        is_public = any(
+            _is_cidr_public(ip_ingress_rule["CidrIp"], any_address)
+            for ip_ingress_rule in ingress_rule["IpRanges"]
+        )
         # IPv6
-        for ip_ingress_rule in ingress_rule["Ipv6Ranges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIpv6"]):
-                # If there are input ports to check
-                if ports:
-                    for port in ports:
-                        if (
-                            port in ingress_port_range
-                            and ingress_rule["IpProtocol"] == protocol
-                        ):
-                            return True
-                # If no input ports check if all ports are open
-                if len(set(ingress_port_range)) == 65536:
-                    return True
+        if not is_public:
+            is_public = any(
+                _is_cidr_public(ip_ingress_rule["CidrIpv6"])
+                for ip_ingress_rule in ingress_rule["Ipv6Ranges"]
+            )
+        if is_public:
+            return [
+                (
+                    ingress_rule["IpProtocol"],
+                    int(ingress_rule["FromPort"]),
+                    int(ingress_rule["ToPort"]),
+                )
+            ]
 
+    return []
+
+
+def get_security_group_exposure(ingress_rules: list, any_address: bool = False) -> list:
+    """Return the public exposure intervals of all the ingress rules of a security group"""
+    exposure = []
+    for ingress_rule in ingress_rules:
+        exposure.extend(get_ingress_rule_exposure(ingress_rule, any_address))
+    return exposure
+
+
+def check_security_group_exposure(
+    exposure: list, protocol: str, ports: list = []
+) -> bool:
+    """
+    Check if the public exposure intervals give access to the ports using the protocol
+
+    @param exposure: List of (protocol, from_port, to_port) intervals from get_ingress_rule_exposure
+
+    @param procotol: Protocol to check.
+
+    @param ports: List of ports to check. (Default: [])
+    """
+    for exposed_protocol, from_port, to_port in exposure:
+        # All traffic is public
+        if from_port is None:
+            return True
+        # If there are input ports to check
+        if ports and exposed_protocol == protocol:
+            for port in ports:
+                if from_port <= port <= to_port:
+                    return True
+        # If no input ports check if all ports are open
+        if to_port - from_port + 1 == 65536:
+            return True
     return False
 
 
+@lru_cache(maxsize=None)
 def _is_cidr_public(cidr: str, any_address: bool = False) -> bool:
     """
     Check if an input CIDR is public
@@ -1,43 +1,70 @@
-import threading
 from datetime import datetime
+from heapq import heappush, heapreplace
 from json import loads
 from typing import Optional
 
 from botocore.exceptions import ClientError
 from pydantic import BaseModel
 
+from prowler.config.config import get_config_var
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    Checks_Attributes,
+    generate_regional_clients,
+    threading_call,
+)
+
+# Default number of the most recently pushed images kept per repository
+default_max_ecr_images_per_repository = 1
 
 
 ################################ ECR
 class ECR:
+    # Attributes fetched one call per repository, only gathered for the checks reading them
+    checks_attributes = Checks_Attributes(
+        client="ecr",
+        attributes=[
+            "policy",
+            "images_details",
+            "lifecycle_policy",
+            "tags",
+        ],
+    )
+
     def __init__(self, audit_info):
         self.service = "ecr"
         self.session = audit_info.audit_session
         self.audit_resources = audit_info.audit_resources
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.registry_id = audit_info.audited_account
+        max_images_per_repository = get_config_var("max_ecr_images_per_repository")
+        # 0 keeps all the images
+        self.max_images_per_repository = (
+            default_max_ecr_images_per_repository
+            if max_images_per_repository in ("", None)
+            else max_images_per_repository
+        )
+        self.audited_attributes = self.checks_attributes.get_audited_attributes(
+            audit_info
+        )
         self.registries = {}
         self.__threading_call__(self.__describe_registries_and_repositories__)
-        self.__threading_call__(self.__describe_repository_policies__)
-        self.__threading_call__(self.__get_image_details__)
-        self.__threading_call__(self.__get_repository_lifecycle_policy__)
+        if "policy" in self.audited_attributes:
+            self.__threading_call__(self.__describe_repository_policies__)
+        if "images_details" in self.audited_attributes:
+            self.__threading_call__(self.__get_image_details__)
+        if "lifecycle_policy" in self.audited_attributes:
+            self.__threading_call__(self.__get_repository_lifecycle_policy__)
         self.__threading_call__(self.__get_registry_scanning_configuration__)
-        self.__threading_call__(self.__list_tags_for_resource__)
+        if "tags" in self.audited_attributes:
+            self.__threading_call__(self.__list_tags_for_resource__)
 
     def __get_session__(self):
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        threading_call(call, self.regional_clients.values())
 
     def __describe_registries_and_repositories__(self, regional_client):
         logger.info("ECR - Describing registries and repositories...")
@@ -136,6 +163,9 @@ class ECR:
                         describe_images_paginator = client.get_paginator(
                             "describe_images"
                         )
+                        # Min-heap of the most recently pushed images, the order they were listed breaks the ties
+                        latest_images = []
+                        listed_images = 0
                         for page in describe_images_paginator.paginate(
                             registryId=self.registries[regional_client.region].id,
                             repositoryName=repository.name,
@@ -145,54 +175,61 @@ class ECR:
                                 # The following condition is required since sometimes
                                 # the AWS ECR API returns None using the iterator
                                 if image is not None:
-                                    severity_counts = None
-                                    last_scan_status = None
-                                    if "imageScanStatus" in image:
-                                        last_scan_status = image["imageScanStatus"][
-                                            "status"
-                                        ]
-
-                                    if "imageScanFindingsSummary" in image:
-                                        severity_counts = FindingSeverityCounts(
-                                            critical=0, high=0, medium=0
-                                        )
-                                        finding_severity_counts = image[
-                                            "imageScanFindingsSummary"
-                                        ]["findingSeverityCounts"]
-                                        if "CRITICAL" in finding_severity_counts:
-                                            severity_counts.critical = (
-                                                finding_severity_counts["CRITICAL"]
-                                            )
-                                        if "HIGH" in finding_severity_counts:
-                                            severity_counts.high = (
-                                                finding_severity_counts["HIGH"]
-                                            )
-                                        if "MEDIUM" in finding_severity_counts:
-                                            severity_counts.medium = (
-                                                finding_severity_counts["MEDIUM"]
-                                            )
-                                    latest_tag = "None"
-                                    if image.get("imageTags"):
-                                        latest_tag = image["imageTags"][0]
-                                    repository.images_details.append(
-                                        ImageDetails(
-                                            latest_tag=latest_tag,
-                                            image_pushed_at=image["imagePushedAt"],
-                                            latest_digest=image["imageDigest"],
-                                            scan_findings_status=last_scan_status,
-                                            scan_findings_severity_count=severity_counts,
-                                        )
-                                    )
-                                    # Sort the repository images by date pushed
-                                    repository.images_details.sort(
-                                        key=lambda image: image.image_pushed_at
+                                    listed_image = (
+                                        image["imagePushedAt"],
+                                        listed_images,
+                                        image,
                                     )
+                                    listed_images += 1
+                                    if (
+                                        not self.max_images_per_repository
+                                        or len(latest_images)
+                                        < self.max_images_per_repository
+                                    ):
+                                        heappush(latest_images, listed_image)
+                                    elif listed_image[:2] > latest_images[0][:2]:
+                                        heapreplace(latest_images, listed_image)
+                        # The repository images are sorted by date pushed once
+                        repository.images_details = [
+                            self.__get_image_detail__(image)
+                            for _, _, image in sorted(
+                                latest_images, key=lambda image: image[:2]
+                            )
+                        ]
 
         except Exception as error:
             logger.error(
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def __get_image_detail__(self, image):
+        severity_counts = None
+        last_scan_status = None
+        if "imageScanStatus" in image:
+            last_scan_status = image["imageScanStatus"]["status"]
+
+        if "imageScanFindingsSummary" in image:
+            severity_counts = FindingSeverityCounts(critical=0, high=0, medium=0)
+            finding_severity_counts = image["imageScanFindingsSummary"][
+                "findingSeverityCounts"
+            ]
+            if "CRITICAL" in finding_severity_counts:
+                severity_counts.critical = finding_severity_counts["CRITICAL"]
+            if "HIGH" in finding_severity_counts:
+                severity_counts.high = finding_severity_counts["HIGH"]
+            if "MEDIUM" in finding_severity_counts:
+                severity_counts.medium = finding_severity_counts["MEDIUM"]
+        latest_tag = "None"
+        if image.get("imageTags"):
+            latest_tag = image["imageTags"][0]
+        return ImageDetails(
+            latest_tag=latest_tag,
+            image_pushed_at=image["imagePushedAt"],
+            latest_digest=image["imageDigest"],
+            scan_findings_status=last_scan_status,
+            scan_findings_severity_count=severity_counts,
+        )
+
     def __list_tags_for_resource__(self, regional_client):
         logger.info("ECR - List Tags...")
         try:
@@ -1,17 +1,15 @@
-import os
-import tempfile
 from json import dumps
 
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
-
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.utils.utils import detect_secrets_scan_batch
 from prowler.providers.aws.services.ecs.ecs_client import ecs_client
 
 
 class ecs_task_definitions_no_environment_secrets(Check):
     def execute(self):
         findings = []
+        scanned_task_definitions = []
+        env_data_payloads = []
         for task_definition in ecs_client.task_definitions:
             report = Check_Report_AWS(self.metadata())
             report.region = task_definition.region
@@ -25,29 +23,23 @@ class ecs_task_definitions_no_environment_secrets(Check):
                 for env_var in task_definition.environment_variables:
                     dump_env_vars.update({env_var.name: env_var.value})
 
-                temp_env_data_file = tempfile.NamedTemporaryFile(delete=False)
-
-                env_data = dumps(dump_env_vars, indent=2)
-                temp_env_data_file.write(bytes(env_data, encoding="raw_unicode_escape"))
-                temp_env_data_file.close()
-
-                secrets = SecretsCollection()
-                with default_settings():
-                    secrets.scan_file(temp_env_data_file.name)
-
-                detect_secrets_output = secrets.json()
-                if detect_secrets_output:
-                    secrets_string = ", ".join(
-                        [
-                            f"{secret['type']} on line {secret['line_number']}"
-                            for secret in detect_secrets_output[temp_env_data_file.name]
-                        ]
-                    )
-                    report.status = "FAIL"
-                    report.status_extended = f"Potential secret found in variables of ECS task definition {task_definition.name} with revision {task_definition.revision} -> {secrets_string}"
-
-                os.remove(temp_env_data_file.name)
+                scanned_task_definitions.append((report, task_definition))
+                env_data_payloads.append(dumps(dump_env_vars, indent=2))
 
             findings.append(report)
 
+        # Scan the variables of all the task definitions in one batch
+        for (report, task_definition), detect_secrets_output in zip(
+            scanned_task_definitions, detect_secrets_scan_batch(env_data_payloads)
+        ):
+            if detect_secrets_output:
+                secrets_string = ", ".join(
+                    [
+                        f"{secret['type']} on line {secret['line_number']}"
+                        for secret in detect_secrets_output
+                    ]
+                )
+                report.status = "FAIL"
+                report.status_extended = f"Potential secret found in variables of ECS task definition {task_definition.name} with revision {task_definition.revision} -> {secrets_string}"
+
         return findings
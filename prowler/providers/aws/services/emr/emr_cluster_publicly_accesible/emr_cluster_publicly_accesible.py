@@ -39,16 +39,12 @@ class emr_cluster_publicly_accesible(Check):
 
                     master_public_security_groups = []
                     for master_sg in master_node_sg_groups:
-                        master_sg_public = False
-                        for sg in ec2_client.security_groups:
-                            if sg.id == master_sg:
-                                for ingress_rule in sg.ingress_rules:
-                                    if check_security_group(ingress_rule, -1):
-                                        master_sg_public = True
-                                        break
-                            if master_sg_public:
-                                master_public_security_groups.append(sg.id)
-                                break
+                        sg = ec2_client.security_groups_by_id.get(master_sg)
+                        if sg:
+                            for ingress_rule in sg.ingress_rules:
+                                if check_security_group(ingress_rule, -1):
+                                    master_public_security_groups.append(sg.id)
+                                    break
 
                     # Check Public Slave Security Groups
                     slave_node_sg_groups = deepcopy(
@@ -61,16 +57,12 @@ class emr_cluster_publicly_accesible(Check):
 
                     slave_public_security_groups = []
                     for slave_sg in slave_node_sg_groups:
-                        slave_sg_public = False
-                        for sg in ec2_client.security_groups:
-                            if sg.id == slave_sg:
-                                for ingress_rule in sg.ingress_rules:
-                                    if check_security_group(ingress_rule, -1):
-                                        slave_sg_public = True
-                                        break
-                            if slave_sg_public:
-                                slave_public_security_groups.append(sg.id)
-                                break
+                        sg = ec2_client.security_groups_by_id.get(slave_sg)
+                        if sg:
+                            for ingress_rule in sg.ingress_rules:
+                                if check_security_group(ingress_rule, -1):
+                                    slave_public_security_groups.append(sg.id)
+                                    break
 
                     if master_public_security_groups or slave_public_security_groups:
                         report.status = "FAIL"
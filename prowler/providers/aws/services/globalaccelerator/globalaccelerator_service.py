@@ -2,6 +2,7 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.providers.aws.aws_provider import session_client_lock
 
 
 ################### GlobalAccelerator
@@ -17,7 +18,8 @@ class GlobalAccelerator:
             # but you must specify the US West (Oregon) Region to create, update, or otherwise work with accelerators.
             # That is, for example, specify --region us-west-2 on AWS CLI commands.
             self.region = "us-west-2"
-            self.client = self.session.client(self.service, self.region)
+            with session_client_lock:
+                self.client = self.session.client(self.service, self.region)
             self.__list_accelerators__()
 
     def __get_session__(self):
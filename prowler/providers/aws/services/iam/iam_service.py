@@ -5,9 +5,19 @@ from typing import Optional
 from botocore.client import ClientError
 from pydantic import BaseModel
 
+from prowler.config.config import get_config_var
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    Checks_Attributes,
+    Resource_Index,
+    Throttled_Calls_Executor,
+    generate_regional_clients,
+    session_client_lock,
+)
+
+# Default number of IAM entities enriched in parallel
+default_max_iam_workers = 10
 
 
 def is_service_role(role):
@@ -48,6 +58,28 @@ def is_service_role(role):
 
 ################## IAM
 class IAM:
+    # Lookup indexes for the checks joining resources across services
+    users_by_arn = Resource_Index("users", "arn")
+    roles_by_arn = Resource_Index("roles", "arn")
+    groups_by_arn = Resource_Index("groups", "arn")
+    policies_by_arn = Resource_Index("policies", "arn")
+    # Attributes fetched one call per entity, only gathered for the checks reading them
+    checks_attributes = Checks_Attributes(
+        client="iam",
+        attributes=[
+            "group_users",
+            "group_attached_policies",
+            "user_attached_policies",
+            "user_inline_policies",
+            "role_attached_policies",
+            "user_mfa_devices",
+            "user_tags",
+            "role_tags",
+            "policy_documents",
+            "policy_tags",
+        ],
+    )
+
     def __init__(self, audit_info):
         self.service = "iam"
         self.session = audit_info.audit_session
@@ -55,24 +87,63 @@ class IAM:
         self.audit_resources = audit_info.audit_resources
         self.partition = audit_info.audited_partition
         self.account_arn = audit_info.audited_account_arn
-        self.client = self.session.client(self.service)
+        with session_client_lock:
+            self.client = self.session.client(self.service)
         global_client = generate_regional_clients(
             self.service, audit_info, global_service=True
         )
         self.client = list(global_client.values())[0]
         self.region = self.client.region
+        self.throttled_calls_executor = Throttled_Calls_Executor(
+            get_config_var("max_iam_workers") or default_max_iam_workers
+        )
         self.users = self.__get_users__()
         self.roles = self.__get_roles__()
         self.account_summary = self.__get_account_summary__()
         self.virtual_mfa_devices = self.__list_virtual_mfa_devices__()
         self.credential_report = self.__get_credential_report__()
         self.groups = self.__get_groups__()
-        self.__get_group_users__()
-        self.__list_attached_group_policies__()
-        self.__list_attached_user_policies__()
-        self.__list_attached_role_policies__()
-        self.__list_inline_user_policies__()
-        self.__list_mfa_devices__()
+        # List both Customer (attached and unattached) and AWS Managed (only attached) policies
+        self.policies = []
+        self.policies.extend(self.__list_policies__("AWS"))
+        self.policies.extend(self.__list_policies__("Local"))
+        self.audited_attributes = self.checks_attributes.get_audited_attributes(
+            audit_info
+        )
+        # The account authorization details return in bulk most of the entities details
+        if not (
+            get_config_var("iam_use_account_authorization_details")
+            and self.__get_account_authorization_details__()
+        ):
+            if "group_users" in self.audited_attributes:
+                self.__threading_call__(self.__get_group_users__, self.groups)
+            if "group_attached_policies" in self.audited_attributes:
+                self.__threading_call__(
+                    self.__list_attached_group_policies__, self.groups
+                )
+            if "user_attached_policies" in self.audited_attributes:
+                self.__threading_call__(
+                    self.__list_attached_user_policies__, self.users
+                )
+            if "role_attached_policies" in self.audited_attributes:
+                self.__threading_call__(
+                    self.__list_attached_role_policies__, self.roles
+                )
+            if "user_inline_policies" in self.audited_attributes:
+                self.__threading_call__(self.__list_inline_user_policies__, self.users)
+            if "user_tags" in self.audited_attributes:
+                self.__threading_call__(self.__list_user_tags__, self.users)
+            if "role_tags" in self.audited_attributes:
+                self.__threading_call__(self.__list_role_tags__, self.roles)
+        if "policy_documents" in self.audited_attributes:
+            self.__threading_call__(
+                self.__list_policies_version__,
+                [policy for policy in self.policies if policy.document is None],
+            )
+        if "user_mfa_devices" in self.audited_attributes:
+            self.__threading_call__(self.__list_mfa_devices__, self.users)
+        if "policy_tags" in self.audited_attributes:
+            self.__threading_call__(self.__list_policy_tags__, self.policies)
         self.password_policy = self.__get_password_policy__()
         support_policy_arn = (
             "arn:aws:iam::aws:policy/aws-service-role/AWSSupportServiceRolePolicy"
@@ -84,14 +155,8 @@ class IAM:
         self.entities_role_attached_to_securityaudit_policy = (
             self.__list_entities_role_for_policy__(securityaudit_policy_arn)
         )
-        # List both Customer (attached and unattached) and AWS Managed (only attached) policies
-        self.policies = []
-        self.policies.extend(self.__list_policies__("AWS"))
-        self.policies.extend(self.__list_policies__("Local"))
-        self.__list_policies_version__(self.policies)
         self.saml_providers = self.__list_saml_providers__()
         self.server_certificates = self.__list_server_certificates__()
-        self.__list_tags_for_resource__()
 
     def __get_client__(self):
         return self.client
@@ -99,6 +164,9 @@ class IAM:
     def __get_session__(self):
         return self.session
 
+    def __threading_call__(self, call, entities):
+        self.throttled_calls_executor.threading_call(call, entities)
+
     def __get_roles__(self):
         logger.info("IAM - List Roles...")
         try:
@@ -269,143 +337,90 @@ class IAM:
         finally:
             return mfa_devices
 
-    def __list_attached_group_policies__(self):
-        logger.info("IAM - List Attached Group Policies...")
-        try:
-            for group in self.groups:
-                list_attached_group_policies_paginator = self.client.get_paginator(
-                    "list_attached_group_policies"
-                )
-                attached_group_policies = []
-                for page in list_attached_group_policies_paginator.paginate(
-                    GroupName=group.name
-                ):
-                    for attached_group_policy in page["AttachedPolicies"]:
-                        attached_group_policies.append(attached_group_policy)
-
-                group.attached_policies = attached_group_policies
-        except Exception as error:
-            logger.error(
-                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-            )
-
-    def __get_group_users__(self):
-        logger.info("IAM - Get Group Users...")
-        try:
-            for group in self.groups:
-                get_group_paginator = self.client.get_paginator("get_group")
-                group_users = []
-                for page in get_group_paginator.paginate(GroupName=group.name):
-                    for user in page["Users"]:
-                        if "PasswordLastUsed" not in user:
-                            group_users.append(
-                                User(name=user["UserName"], arn=user["Arn"])
-                            )
-                        else:
-                            group_users.append(
-                                User(
-                                    name=user["UserName"],
-                                    arn=user["Arn"],
-                                    password_last_used=user["PasswordLastUsed"],
-                                )
-                            )
-                group.users = group_users
-        except Exception as error:
-            logger.error(
-                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-            )
-
-    def __list_mfa_devices__(self):
-        logger.info("IAM - List MFA Devices...")
-        try:
-            for user in self.users:
-                list_mfa_devices_paginator = self.client.get_paginator(
-                    "list_mfa_devices"
-                )
-                mfa_devices = []
-                for page in list_mfa_devices_paginator.paginate(UserName=user.name):
-                    for mfa_device in page["MFADevices"]:
-                        mfa_serial_number = mfa_device["SerialNumber"]
-                        mfa_type = (
-                            mfa_device["SerialNumber"].split(":")[5].split("/")[0]
-                        )
-                        mfa_devices.append(
-                            MFADevice(serial_number=mfa_serial_number, type=mfa_type)
+    def __list_attached_group_policies__(self, group):
+        list_attached_group_policies_paginator = self.client.get_paginator(
+            "list_attached_group_policies"
+        )
+        attached_group_policies = []
+        for page in list_attached_group_policies_paginator.paginate(
+            GroupName=group.name
+        ):
+            for attached_group_policy in page["AttachedPolicies"]:
+                attached_group_policies.append(attached_group_policy)
+
+        group.attached_policies = attached_group_policies
+
+    def __get_group_users__(self, group):
+        get_group_paginator = self.client.get_paginator("get_group")
+        group_users = []
+        for page in get_group_paginator.paginate(GroupName=group.name):
+            for user in page["Users"]:
+                if "PasswordLastUsed" not in user:
+                    group_users.append(User(name=user["UserName"], arn=user["Arn"]))
+                else:
+                    group_users.append(
+                        User(
+                            name=user["UserName"],
+                            arn=user["Arn"],
+                            password_last_used=user["PasswordLastUsed"],
                         )
-                user.mfa_devices = mfa_devices
-        except Exception as error:
-            logger.error(
-                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-            )
-
-    def __list_attached_user_policies__(self):
-        logger.info("IAM - List Attached User Policies...")
-        try:
-            for user in self.users:
-                attached_user_policies = []
-                get_user_attached_policies_paginator = self.client.get_paginator(
-                    "list_attached_user_policies"
+                    )
+        group.users = group_users
+
+    def __list_mfa_devices__(self, user):
+        list_mfa_devices_paginator = self.client.get_paginator("list_mfa_devices")
+        mfa_devices = []
+        for page in list_mfa_devices_paginator.paginate(UserName=user.name):
+            for mfa_device in page["MFADevices"]:
+                mfa_serial_number = mfa_device["SerialNumber"]
+                mfa_type = mfa_device["SerialNumber"].split(":")[5].split("/")[0]
+                mfa_devices.append(
+                    MFADevice(serial_number=mfa_serial_number, type=mfa_type)
                 )
-                for page in get_user_attached_policies_paginator.paginate(
-                    UserName=user.name
-                ):
-                    for policy in page["AttachedPolicies"]:
-                        attached_user_policies.append(policy)
+        user.mfa_devices = mfa_devices
 
-                user.attached_policies = attached_user_policies
+    def __list_attached_user_policies__(self, user):
+        attached_user_policies = []
+        get_user_attached_policies_paginator = self.client.get_paginator(
+            "list_attached_user_policies"
+        )
+        for page in get_user_attached_policies_paginator.paginate(UserName=user.name):
+            for policy in page["AttachedPolicies"]:
+                attached_user_policies.append(policy)
 
-        except Exception as error:
-            logger.error(
-                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-            )
+        user.attached_policies = attached_user_policies
 
-    def __list_attached_role_policies__(self):
-        logger.info("IAM - List Attached User Policies...")
+    def __list_attached_role_policies__(self, role):
         try:
-            for role in self.roles:
-                try:
-                    attached_role_policies = []
-                    list_attached_role_policies_paginator = self.client.get_paginator(
-                        "list_attached_role_policies"
-                    )
-                    for page in list_attached_role_policies_paginator.paginate(
-                        RoleName=role.name
-                    ):
-                        for policy in page["AttachedPolicies"]:
-                            attached_role_policies.append(policy)
-
-                    role.attached_policies = attached_role_policies
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntityException":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-
-        except Exception as error:
-            logger.error(
-                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            attached_role_policies = []
+            list_attached_role_policies_paginator = self.client.get_paginator(
+                "list_attached_role_policies"
             )
+            for page in list_attached_role_policies_paginator.paginate(
+                RoleName=role.name
+            ):
+                for policy in page["AttachedPolicies"]:
+                    attached_role_policies.append(policy)
 
-    def __list_inline_user_policies__(self):
-        logger.info("IAM - List Inline User Policies...")
-        try:
-            for user in self.users:
-                inline_user_policies = []
-                get_user_inline_policies_paginator = self.client.get_paginator(
-                    "list_user_policies"
+            role.attached_policies = attached_role_policies
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
-                for page in get_user_inline_policies_paginator.paginate(
-                    UserName=user.name
-                ):
-                    for policy in page["PolicyNames"]:
-                        inline_user_policies.append(policy)
+            else:
+                raise
 
-                user.inline_policies = inline_user_policies
+    def __list_inline_user_policies__(self, user):
+        inline_user_policies = []
+        get_user_inline_policies_paginator = self.client.get_paginator(
+            "list_user_policies"
+        )
+        for page in get_user_inline_policies_paginator.paginate(UserName=user.name):
+            for policy in page["PolicyNames"]:
+                inline_user_policies.append(policy)
 
-        except Exception as error:
-            logger.error(
-                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-            )
+        user.inline_policies = inline_user_policies
 
     def __list_entities_role_for_policy__(self, policy_arn):
         logger.info("IAM - List Entities Role For Policy...")
@@ -451,18 +466,79 @@ class IAM:
         finally:
             return policies
 
-    def __list_policies_version__(self, policies):
-        logger.info("IAM - List Policies Version...")
+    def __list_policies_version__(self, policy):
+        policy_version = self.client.get_policy_version(
+            PolicyArn=policy.arn, VersionId=policy.version_id
+        )
+        policy.document = policy_version["PolicyVersion"]["Document"]
+
+    def __get_account_authorization_details__(self):
+        logger.info("IAM - Get Account Authorization Details...")
         try:
-            for policy in policies:
-                policy_version = self.client.get_policy_version(
-                    PolicyArn=policy.arn, VersionId=policy.version_id
-                )
-                policy.document = policy_version["PolicyVersion"]["Document"]
+            account_authorization_details_paginator = self.client.get_paginator(
+                "get_account_authorization_details"
+            )
+            users_groups = {}
+            for page in account_authorization_details_paginator.paginate(
+                Filter=[
+                    "User",
+                    "Role",
+                    "Group",
+                    "LocalManagedPolicy",
+                    "AWSManagedPolicy",
+                ]
+            ):
+                for user_detail in page["UserDetailList"]:
+                    for group_name in user_detail.get("GroupList", []):
+                        users_groups.setdefault(group_name, []).append(user_detail)
+                    user = self.users_by_arn.get(user_detail["Arn"])
+                    if user:
+                        user.attached_policies = user_detail.get(
+                            "AttachedManagedPolicies", []
+                        )
+                        user.inline_policies = [
+                            policy["PolicyName"]
+                            for policy in user_detail.get("UserPolicyList", [])
+                        ]
+                        user.tags = user_detail.get("Tags", [])
+                for role_detail in page["RoleDetailList"]:
+                    role = self.roles_by_arn.get(role_detail["Arn"])
+                    if role:
+                        role.attached_policies = role_detail.get(
+                            "AttachedManagedPolicies", []
+                        )
+                        role.tags = role_detail.get("Tags", [])
+                for group_detail in page["GroupDetailList"]:
+                    group = self.groups_by_arn.get(group_detail["Arn"])
+                    if group:
+                        group.attached_policies = group_detail.get(
+                            "AttachedManagedPolicies", []
+                        )
+                for policy_detail in page["Policies"]:
+                    policy = self.policies_by_arn.get(policy_detail["Arn"])
+                    if policy:
+                        for policy_version in policy_detail.get(
+                            "PolicyVersionList", []
+                        ):
+                            if policy_version["VersionId"] == policy.version_id:
+                                policy.document = policy_version["Document"]
+
+            for group in self.groups:
+                group.users = []
+                for user_detail in users_groups.get(group.name, []):
+                    user = self.users_by_arn.get(user_detail["Arn"])
+                    if not user:
+                        user = User(
+                            name=user_detail["UserName"], arn=user_detail["Arn"]
+                        )
+                    group.users.append(user)
+            return True
         except Exception as error:
+            # The entities details are gathered one by one if the bulk call fails
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
+            return False
 
     def __list_saml_providers__(self):
         logger.info("IAM - List SAML Providers...")
@@ -501,51 +577,32 @@ class IAM:
         finally:
             return server_certificates
 
-    def __list_tags_for_resource__(self):
-        logger.info("IAM - List Tags...")
+    def __list_role_tags__(self, role):
         try:
-            for role in self.roles:
-                try:
-                    response = self.client.list_role_tags(RoleName=role.name)["Tags"]
-                    role.tags = response
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntityException":
-                        role.tags = []
-
-        except Exception as error:
-            logger.error(
-                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-            )
+            role.tags = self.client.list_role_tags(RoleName=role.name)["Tags"]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                role.tags = []
+            else:
+                raise
 
+    def __list_user_tags__(self, user):
         try:
-            for user in self.users:
-                try:
-                    response = self.client.list_user_tags(UserName=user.name)["Tags"]
-                    user.tags = response
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntityException":
-                        user.tags = []
-
-        except Exception as error:
-            logger.error(
-                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-            )
+            user.tags = self.client.list_user_tags(UserName=user.name)["Tags"]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                user.tags = []
+            else:
+                raise
 
+    def __list_policy_tags__(self, policy):
         try:
-            for policy in self.policies:
-                try:
-                    response = self.client.list_policy_tags(PolicyArn=policy.arn)[
-                        "Tags"
-                    ]
-                    policy.tags = response
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntityException":
-                        policy.tags = []
-
-        except Exception as error:
-            logger.error(
-                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-            )
+            policy.tags = self.client.list_policy_tags(PolicyArn=policy.arn)["Tags"]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                policy.tags = []
+            else:
+                raise
 
 
 class MFADevice(BaseModel):
@@ -0,0 +1,175 @@
+import re
+import threading
+from functools import lru_cache
+
+
+################## IAM Policies
+# Consecutive wildcards, like *? or **
+wildcards_run = re.compile(r"[*?]{2,}")
+
+
+def normalize_wildcards(action: str) -> str:
+    """Rewrite every run of consecutive wildcards with its ? first and a single *, since they match the same actions"""
+    return wildcards_run.sub(
+        lambda run: "?" * run.group().count("?") + ("*" if "*" in run.group() else ""),
+        action,
+    )
+
+
+@lru_cache(maxsize=None)
+def compile_action_pattern(pattern: str) -> re.Pattern:
+    """
+    Compile an IAM action with the * and ? wildcards into a case insensitive regular expression,
+    matching the actions with normalized wildcards it covers: its * matches anything and its ? any character but a *
+    """
+    return re.compile(
+        re.escape(normalize_wildcards(pattern))
+        .replace(r"\*", ".*")
+        .replace(r"\?", "[^*]"),
+        re.IGNORECASE,
+    )
+
+
+def action_covers(pattern: str, action: str) -> bool:
+    """Return whether the pattern matches every action matched by the action, with or without wildcards"""
+    return bool(compile_action_pattern(pattern).fullmatch(normalize_wildcards(action)))
+
+
+def actions_overlap(pattern: str, action: str) -> bool:
+    """Return whether the pattern and the action, both with or without wildcards, match any common action"""
+    return action_covers(pattern, action) or action_covers(action, pattern)
+
+
+def _as_list(value) -> list:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+class Policy_Statement:
+    """Policy_Statement is a policy statement with its actions compiled once"""
+
+    def __init__(self, statement: dict):
+        self.effect = statement.get("Effect")
+        self.not_action = "NotAction" in statement
+        self.actions = [
+            action
+            for action in _as_list(
+                statement["NotAction"] if self.not_action else statement.get("Action")
+            )
+            if isinstance(action, str)
+        ]
+        resources = [
+            resource
+            for resource in _as_list(statement.get("Resource"))
+            if isinstance(resource, str)
+        ]
+        self.all_resources = "*" in resources
+        self.wildcard_resources = any("*" in resource for resource in resources)
+        self.conditional = "Condition" in statement
+        # All the actions in a single expression to match the actions without wildcards at once
+        self.actions_pattern = re.compile(
+            "|".join(
+                f"(?:{compile_action_pattern(action).pattern})"
+                for action in self.actions
+            )
+            or "(?!)",
+            re.IGNORECASE,
+        )
+
+    def matches(self, action: str) -> bool:
+        """Return whether the statement applies to every action matched by the action"""
+        if self.not_action:
+            return not any(
+                actions_overlap(not_action, action) for not_action in self.actions
+            )
+        return bool(self.actions_pattern.fullmatch(normalize_wildcards(action)))
+
+    def overlaps(self, action: str) -> bool:
+        """Return whether the statement applies to any action matched by the action"""
+        if self.not_action:
+            return not any(
+                action_covers(not_action, action) for not_action in self.actions
+            )
+        return self.matches(action) or any(
+            action_covers(action, statement_action) for statement_action in self.actions
+        )
+
+
+class Policy_Analysis:
+    """
+    Policy_Analysis is an IAM policy document parsed once into its Allow and Deny statements,
+    to query which actions it grants, matching the wildcards of both the policy and the queried actions.
+    The Condition elements are not evaluated, so only the Deny statements over "Resource": "*"
+    without a Condition are known to deny the actions they match.
+    """
+
+    def __init__(self, document: dict):
+        self.allow_statements = []
+        self.deny_statements = []
+        statements = _as_list((document or {}).get("Statement"))
+        for statement in statements:
+            if not isinstance(statement, dict):
+                continue
+            policy_statement = Policy_Statement(statement)
+            if policy_statement.effect == "Allow":
+                self.allow_statements.append(policy_statement)
+            elif policy_statement.effect == "Deny":
+                self.deny_statements.append(policy_statement)
+
+    def is_action_allowed(
+        self, action: str, all_resources: bool = False, wildcard_resources: bool = False
+    ) -> bool:
+        """
+        Return whether the policy allows every action matched by the action, e.g. kms:* or iam:PassRole,
+        and no unconditional Deny statement over "Resource": "*" denies any of them.
+        With all_resources only the Allow statements over "Resource": "*" are considered,
+        and with wildcard_resources only those with a wildcard in any of their resources.
+        """
+        allowed = any(
+            statement.matches(action)
+            for statement in self.allow_statements
+            if (statement.all_resources or not all_resources)
+            and (statement.wildcard_resources or not wildcard_resources)
+        )
+        return allowed and not any(
+            statement.overlaps(action)
+            for statement in self.deny_statements
+            if statement.all_resources and not statement.conditional
+        )
+
+    def get_allowed_actions(self, actions, all_resources: bool = False) -> set:
+        """Return the actions allowed by the policy, without those already included in another allowed action"""
+        allowed_actions = {
+            action
+            for action in actions
+            if self.is_action_allowed(action, all_resources)
+        }
+        return {
+            action
+            for action in allowed_actions
+            if not any(
+                other_action != action and action_covers(other_action, action)
+                for other_action in allowed_actions
+            )
+        }
+
+
+policy_analyses = {}
+policy_analyses_lock = threading.Lock()
+
+
+def get_policy_analysis(policy) -> Policy_Analysis:
+    """Return the Policy_Analysis of an IAM policy, parsed once per policy ARN and version"""
+    key = (policy.arn, policy.version_id)
+    with policy_analyses_lock:
+        cached_analysis = policy_analyses.get(key)
+    # The document is kept with the analysis to not reuse it if the policy is gathered again
+    if cached_analysis and cached_analysis[0] is policy.document:
+        return cached_analysis[1]
+    policy_analysis = Policy_Analysis(policy.document)
+    with policy_analyses_lock:
+        policy_analyses[key] = (policy.document, policy_analysis)
+    return policy_analysis
@@ -18,13 +18,9 @@ class networkfirewall_in_all_vpc(Check):
             report.status_extended = (
                 f"VPC {vpc.id} does not have Network Firewall enabled."
             )
-            for firewall in networkfirewall_client.network_firewalls:
-                if firewall.vpc_id == vpc.id:
-                    report.status = "PASS"
-                    report.status_extended = (
-                        f"VPC {vpc.id} has Network Firewall enabled."
-                    )
-                    break
+            if networkfirewall_client.network_firewalls_by_vpc_id.get(vpc.id):
+                report.status = "PASS"
+                report.status_extended = f"VPC {vpc.id} has Network Firewall enabled."
 
             findings.append(report)
 
@@ -1,17 +1,22 @@
-import threading
-
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import (
+    Resource_Index,
     generate_regional_clients,
     get_default_region,
+    threading_call,
 )
 
 
 ################## NetworkFirewall
 class NetworkFirewall:
+    # Lookup indexes for the checks joining resources across services
+    network_firewalls_by_vpc_id = Resource_Index(
+        "network_firewalls", "vpc_id", grouped=True
+    )
+
     def __init__(self, audit_info):
         self.service = "network-firewall"
         self.session = audit_info.audit_session
@@ -28,13 +33,7 @@ class NetworkFirewall:
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        threading_call(call, self.regional_clients.values())
 
     def __list_firewalls__(self, regional_client):
         logger.info("Network Firewall - Listing Network Firewalls...")
@@ -4,7 +4,10 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    session_client_lock,
+)
 
 
 ################## Route53
@@ -159,7 +162,8 @@ class Route53Domains:
             # Route53Domains is a global service that supports endpoints in multiple AWS Regions
             # but you must specify the US East (N. Virginia) Region to create, update, or otherwise work with domains.
             self.region = "us-east-1"
-            self.client = self.session.client(self.service, self.region)
+            with session_client_lock:
+                self.client = self.session.client(self.service, self.region)
             self.__list_domains__()
             self.__get_domain_detail__()
             self.__list_tags_for_domain__()
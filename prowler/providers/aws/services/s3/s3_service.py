@@ -1,48 +1,110 @@
 import json
-import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
 from botocore.client import ClientError
 from pydantic import BaseModel
 
+from prowler.config.config import get_config_var
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    Checks_Attributes,
+    Resource_Index,
+    generate_regional_clients,
+    session_client_lock,
+)
+
+# Default number of workers fetching the buckets attributes
+default_s3_max_workers = 10
 
 
 ################## S3
 class S3:
+    # Lookup indexes for the checks joining resources across services
+    buckets_by_name = Resource_Index("buckets", "name")
+    # Attributes fetched one call per bucket, only gathered for the checks reading them
+    checks_attributes = Checks_Attributes(
+        client="s3",
+        attributes=[
+            "versioning",
+            "logging",
+            "policy",
+            "acl_grantees",
+            "public_access_block",
+            "encryption",
+            "ownership",
+            "object_lock",
+            "tags",
+        ],
+    )
+
     def __init__(self, audit_info):
         self.service = "s3"
         self.session = audit_info.audit_session
-        self.client = self.session.client(self.service)
+        with session_client_lock:
+            self.client = self.session.client(self.service)
         self.audited_account = audit_info.audited_account
         self.audit_resources = audit_info.audit_resources
         self.audited_partition = audit_info.audited_partition
         self.audited_account_arn = audit_info.audited_account_arn
+        self.session_config = audit_info.session_config
         self.regional_clients = generate_regional_clients(self.service, audit_info)
+        self.max_workers = get_config_var("max_s3_workers") or default_s3_max_workers
+        self.audited_attributes = self.checks_attributes.get_audited_attributes(
+            audit_info
+        )
         self.buckets = self.__list_buckets__(audit_info)
-        self.__threading_call__(self.__get_bucket_versioning__)
-        self.__threading_call__(self.__get_bucket_logging__)
-        self.__threading_call__(self.__get_bucket_policy__)
-        self.__threading_call__(self.__get_bucket_acl__)
-        self.__threading_call__(self.__get_public_access_block__)
-        self.__threading_call__(self.__get_bucket_encryption__)
-        self.__threading_call__(self.__get_bucket_ownership_controls__)
-        self.__threading_call__(self.__get_object_lock_configuration__)
-        self.__threading_call__(self.__get_bucket_tagging__)
+        # All the attributes of a bucket are fetched by the same worker
+        self.__threading_call__(self.__get_bucket_attributes__)
 
     def __get_session__(self):
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for bucket in self.buckets:
-            threads.append(threading.Thread(target=call, args=(bucket,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="prowler-s3"
+        ) as executor:
+            futures = {executor.submit(call, bucket): bucket for bucket in self.buckets}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as error:
+                    logger.error(
+                        f"{futures[future].name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+
+    def __get_regional_client__(self, region):
+        # Buckets can be in regions without a client, create it once when needed
+        if region not in self.regional_clients:
+            with session_client_lock:
+                if region not in self.regional_clients:
+                    regional_client = self.session.client(
+                        self.service, region_name=region, config=self.session_config
+                    )
+                    regional_client.region = region
+                    self.regional_clients[region] = regional_client
+        return self.regional_clients[region]
+
+    def __get_bucket_attributes__(self, bucket):
+        if "versioning" in self.audited_attributes:
+            self.__get_bucket_versioning__(bucket)
+        if "logging" in self.audited_attributes:
+            self.__get_bucket_logging__(bucket)
+        if "policy" in self.audited_attributes:
+            self.__get_bucket_policy__(bucket)
+        if "acl_grantees" in self.audited_attributes:
+            self.__get_bucket_acl__(bucket)
+        if "public_access_block" in self.audited_attributes:
+            self.__get_public_access_block__(bucket)
+        if "encryption" in self.audited_attributes:
+            self.__get_bucket_encryption__(bucket)
+        if "ownership" in self.audited_attributes:
+            self.__get_bucket_ownership_controls__(bucket)
+        if "object_lock" in self.audited_attributes:
+            self.__get_object_lock_configuration__(bucket)
+        if "tags" in self.audited_attributes:
+            self.__get_bucket_tagging__(bucket)
 
     def __list_buckets__(self, audit_info):
         logger.info("S3 - Listing buckets...")
@@ -93,7 +155,7 @@ class S3:
     def __get_bucket_versioning__(self, bucket):
         logger.info("S3 - Get buckets versioning...")
         try:
-            regional_client = self.regional_clients[bucket.region]
+            regional_client = self.__get_regional_client__(bucket.region)
             bucket_versioning = regional_client.get_bucket_versioning(
                 Bucket=bucket.name
             )
@@ -116,7 +178,7 @@ class S3:
     def __get_bucket_encryption__(self, bucket):
         logger.info("S3 - Get buckets encryption...")
         try:
-            regional_client = self.regional_clients[bucket.region]
+            regional_client = self.__get_regional_client__(bucket.region)
             bucket.encryption = regional_client.get_bucket_encryption(
                 Bucket=bucket.name
             )["ServerSideEncryptionConfiguration"]["Rules"][0][
@@ -148,7 +210,7 @@ class S3:
     def __get_bucket_logging__(self, bucket):
         logger.info("S3 - Get buckets logging...")
         try:
-            regional_client = self.regional_clients[bucket.region]
+            regional_client = self.__get_regional_client__(bucket.region)
             bucket_logging = regional_client.get_bucket_logging(Bucket=bucket.name)
             if "LoggingEnabled" in bucket_logging:
                 bucket.logging = True
@@ -168,7 +230,7 @@ class S3:
     def __get_public_access_block__(self, bucket):
         logger.info("S3 - Get buckets public access block...")
         try:
-            regional_client = self.regional_clients[bucket.region]
+            regional_client = self.__get_regional_client__(bucket.region)
             public_access_block = regional_client.get_public_access_block(
                 Bucket=bucket.name
             )["PublicAccessBlockConfiguration"]
@@ -212,7 +274,7 @@ class S3:
         logger.info("S3 - Get buckets acl...")
         try:
             grantees = []
-            regional_client = self.regional_clients[bucket.region]
+            regional_client = self.__get_regional_client__(bucket.region)
             acl_grants = regional_client.get_bucket_acl(Bucket=bucket.name)["Grants"]
             for grant in acl_grants:
                 grantee = ACL_Grantee(type=grant["Grantee"]["Type"])
@@ -239,7 +301,7 @@ class S3:
     def __get_bucket_policy__(self, bucket):
         logger.info("S3 - Get buckets policy...")
         try:
-            regional_client = self.regional_clients[bucket.region]
+            regional_client = self.__get_regional_client__(bucket.region)
             bucket.policy = json.loads(
                 regional_client.get_bucket_policy(Bucket=bucket.name)["Policy"]
             )
@@ -259,7 +321,7 @@ class S3:
     def __get_bucket_ownership_controls__(self, bucket):
         logger.info("S3 - Get buckets ownership controls...")
         try:
-            regional_client = self.regional_clients[bucket.region]
+            regional_client = self.__get_regional_client__(bucket.region)
             bucket.ownership = regional_client.get_bucket_ownership_controls(
                 Bucket=bucket.name
             )["OwnershipControls"]["Rules"][0]["ObjectOwnership"]
@@ -287,7 +349,7 @@ class S3:
     def __get_object_lock_configuration__(self, bucket):
         logger.info("S3 - Get buckets ownership controls...")
         try:
-            regional_client = self.regional_clients[bucket.region]
+            regional_client = self.__get_regional_client__(bucket.region)
             regional_client.get_object_lock_configuration(Bucket=bucket.name)
             bucket.object_lock = True
         except Exception as error:
@@ -306,7 +368,7 @@ class S3:
     def __get_bucket_tagging__(self, bucket):
         logger.info("S3 - Get buckets logging...")
         try:
-            regional_client = self.regional_clients[bucket.region]
+            regional_client = self.__get_regional_client__(bucket.region)
             bucket_tags = regional_client.get_bucket_tagging(Bucket=bucket.name)[
                 "TagSet"
             ]
@@ -16,11 +16,9 @@ class shield_advanced_protection_in_associated_elastic_ips(Check):
                 report.status = "FAIL"
                 report.status_extended = f"Elastic IP {elastic_ip.allocation_id} is not protected by AWS Shield Advanced"
 
-                for protection in shield_client.protections.values():
-                    if elastic_ip.arn == protection.resource_arn:
-                        report.status = "PASS"
-                        report.status_extended = f"Elastic IP {elastic_ip.allocation_id} is protected by AWS Shield Advanced"
-                        break
+                if elastic_ip.arn in shield_client.protections_by_resource_arn:
+                    report.status = "PASS"
+                    report.status_extended = f"Elastic IP {elastic_ip.allocation_id} is protected by AWS Shield Advanced"
 
                 findings.append(report)
 
@@ -18,13 +18,11 @@ class shield_advanced_protection_in_classic_load_balancers(Check):
                     f"ELB {elb.name} is not protected by AWS Shield Advanced"
                 )
 
-                for protection in shield_client.protections.values():
-                    if elb.arn == protection.resource_arn:
-                        report.status = "PASS"
-                        report.status_extended = (
-                            f"ELB {elb.name} is protected by AWS Shield Advanced"
-                        )
-                        break
+                if elb.arn in shield_client.protections_by_resource_arn:
+                    report.status = "PASS"
+                    report.status_extended = (
+                        f"ELB {elb.name} is protected by AWS Shield Advanced"
+                    )
 
                 findings.append(report)
 
@@ -18,11 +18,9 @@ class shield_advanced_protection_in_cloudfront_distributions(Check):
                 report.status = "FAIL"
                 report.status_extended = f"CloudFront distribution {distribution.id} is not protected by AWS Shield Advanced"
 
-                for protection in shield_client.protections.values():
-                    if distribution.arn == protection.resource_arn:
-                        report.status = "PASS"
-                        report.status_extended = f"CloudFront distribution {distribution.id} is protected by AWS Shield Advanced"
-                        break
+                if distribution.arn in shield_client.protections_by_resource_arn:
+                    report.status = "PASS"
+                    report.status_extended = f"CloudFront distribution {distribution.id} is protected by AWS Shield Advanced"
 
                 findings.append(report)
 
@@ -17,11 +17,9 @@ class shield_advanced_protection_in_global_accelerators(Check):
                 report.status = "FAIL"
                 report.status_extended = f"Global Accelerator {accelerator.name} is not protected by AWS Shield Advanced"
 
-                for protection in shield_client.protections.values():
-                    if accelerator.arn == protection.resource_arn:
-                        report.status = "PASS"
-                        report.status_extended = f"Global Accelerator {accelerator.name} is protected by AWS Shield Advanced"
-                        break
+                if accelerator.arn in shield_client.protections_by_resource_arn:
+                    report.status = "PASS"
+                    report.status_extended = f"Global Accelerator {accelerator.name} is protected by AWS Shield Advanced"
 
                 findings.append(report)
 
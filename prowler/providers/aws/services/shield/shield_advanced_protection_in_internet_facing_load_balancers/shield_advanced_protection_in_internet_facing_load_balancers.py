@@ -17,11 +17,9 @@ class shield_advanced_protection_in_internet_facing_load_balancers(Check):
                     report.status = "FAIL"
                     report.status_extended = f"ELBv2 ALB {elbv2.name} is not protected by AWS Shield Advanced"
 
-                    for protection in shield_client.protections.values():
-                        if elbv2.arn == protection.resource_arn:
-                            report.status = "PASS"
-                            report.status_extended = f"ELBv2 ALB {elbv2.name} is protected by AWS Shield Advanced"
-                            break
+                    if elbv2.arn in shield_client.protections_by_resource_arn:
+                        report.status = "PASS"
+                        report.status_extended = f"ELBv2 ALB {elbv2.name} is protected by AWS Shield Advanced"
 
                     findings.append(report)
 
@@ -16,11 +16,9 @@ class shield_advanced_protection_in_route53_hosted_zones(Check):
                 report.status = "FAIL"
                 report.status_extended = f"Route53 Hosted Zone {hosted_zone.id} is not protected by AWS Shield Advanced"
 
-                for protection in shield_client.protections.values():
-                    if hosted_zone.arn == protection.resource_arn:
-                        report.status = "PASS"
-                        report.status_extended = f"Route53 Hosted Zone {hosted_zone.id} is protected by AWS Shield Advanced"
-                        break
+                if hosted_zone.arn in shield_client.protections_by_resource_arn:
+                    report.status = "PASS"
+                    report.status_extended = f"Route53 Hosted Zone {hosted_zone.id} is protected by AWS Shield Advanced"
 
                 findings.append(report)
 
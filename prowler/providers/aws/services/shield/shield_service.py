@@ -1,11 +1,14 @@
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import Resource_Index, generate_regional_clients
 
 
 ################### Shield
 class Shield:
+    # Lookup indexes for the checks joining resources across services
+    protections_by_resource_arn = Resource_Index("protections", "resource_arn")
+
     def __init__(self, audit_info):
         self.service = "shield"
         self.session = audit_info.audit_session
@@ -4,7 +4,7 @@ from botocore.client import ClientError
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
-from prowler.providers.aws.aws_provider import get_default_region
+from prowler.providers.aws.aws_provider import get_default_region, session_client_lock
 
 
 ################################ TrustedAdvisor
@@ -23,9 +23,10 @@ class TrustedAdvisor:
                 support_region = "us-east-1"
             else:
                 support_region = "us-gov-west-1"
-            self.client = audit_info.audit_session.client(
-                self.service, region_name=support_region
-            )
+            with session_client_lock:
+                self.client = audit_info.audit_session.client(
+                    self.service, region_name=support_region
+                )
             self.client.region = support_region
             self.__describe_trusted_advisor_checks__()
             self.__describe_trusted_advisor_check_result__()
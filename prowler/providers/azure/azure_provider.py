@@ -1,13 +1,104 @@
+import random
 import sys
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from os import getenv
 
+from azure.core.exceptions import HttpResponseError
 from azure.identity import DefaultAzureCredential, InteractiveBrowserCredential
 from azure.mgmt.subscription import SubscriptionClient
 from msgraph.core import GraphClient
 
+from prowler.config.config import get_config_var
+from prowler.lib.calls_executor.calls_executor import Calls_Executor
 from prowler.lib.logger import logger
 from prowler.providers.azure.lib.audit_info.models import Azure_Identity_Info
 
+default_max_azure_workers = 10
+default_max_azure_attempts = 5
+
+
+def get_retry_after(error: Exception, attempt: int = 1, max_delay: float = 60):
+    """Return the seconds to wait before retrying an ARM call throttled with a 429, None if it was not throttled"""
+    if not isinstance(error, HttpResponseError) or error.status_code != 429:
+        return None
+    headers = getattr(error.response, "headers", None) or {}
+    retry_after = headers.get("Retry-After")
+    delay = None
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            # Retry-After can also be an HTTP date
+            try:
+                delay = (
+                    parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)
+                ).total_seconds()
+            except (TypeError, ValueError):
+                delay = None
+    if delay is None:
+        # Full jitter backoff when ARM does not say how long to wait
+        delay = random.uniform(0, 2**attempt)
+    return min(max(delay, 0), max_delay)
+
+
+class Azure_Calls_Executor(Calls_Executor):
+    """
+    Azure_Calls_Executor runs the calls of all the Azure services, one per subscription,
+    and retries the calls throttled by ARM after their Retry-After.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = default_max_azure_workers,
+        max_attempts: int = default_max_azure_attempts,
+        max_delay: float = 60,
+    ):
+        super().__init__(max_workers, thread_name_prefix="prowler-azure")
+        self.max_attempts = max_attempts
+        self.max_delay = max_delay
+
+    def run_call(self, call, item):
+        attempt = 1
+        while True:
+            try:
+                return call(item)
+            except Exception as error:
+                retry_after = get_retry_after(error, attempt, self.max_delay)
+                if retry_after is None or attempt >= self.max_attempts:
+                    raise
+            logger.warning(
+                f"{call.__qualname__} -- {item} throttled, retrying in {retry_after:.1f} seconds"
+            )
+            time.sleep(retry_after)
+            attempt += 1
+
+    def threading_call(self, call, items) -> dict:
+        """Run the call for every item and return the results by item, in the items order, skipping the failed ones"""
+        return dict(self.run_calls(call, items))
+
+
+azure_calls_executor = None
+azure_calls_executor_lock = threading.Lock()
+
+
+def get_azure_calls_executor() -> Azure_Calls_Executor:
+    """Return the executor shared by all the Azure services, creating it on first use"""
+    global azure_calls_executor
+    with azure_calls_executor_lock:
+        if not azure_calls_executor:
+            azure_calls_executor = Azure_Calls_Executor(
+                get_config_var("max_azure_workers") or default_max_azure_workers
+            )
+        return azure_calls_executor
+
+
+def threading_call(call, items) -> dict:
+    """Run the call for every item, usually a subscription, in the shared executor and return the results by item"""
+    return get_azure_calls_executor().threading_call(call, items)
+
 
 class Azure_Provider:
     def __init__(
@@ -162,11 +253,18 @@ class Azure_Provider:
                     )
             else:
                 logger.info("Scanning the subscriptions passed as argument ...")
-                for id in subscription_ids:
-                    subscription = subscriptions_client.subscriptions.get(
-                        subscription_id=id
+
+                # The subscriptions are resolved in parallel, all of them must exist
+                def get_subscription(subscription_id):
+                    return subscriptions_client.subscriptions.get(
+                        subscription_id=subscription_id
                     )
-                    identity.subscriptions.update({subscription.display_name: id})
+
+                subscriptions = threading_call(get_subscription, subscription_ids)
+                for id in subscription_ids:
+                    if id not in subscriptions:
+                        raise Exception(f"Subscription {id} could not be retrieved")
+                    identity.subscriptions.update({subscriptions[id].display_name: id})
 
             # If there are no subscriptions listed -> checks are not going to be run against any resource
             if not identity.subscriptions:
@@ -4,6 +4,7 @@ from azure.mgmt.security import SecurityCenter
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
+from prowler.providers.azure.azure_provider import threading_call
 
 
 ########################## Defender
@@ -35,28 +36,25 @@ class Defender:
         else:
             return clients
 
+    def __threading_call__(self, call, subscriptions):
+        return threading_call(call, subscriptions)
+
     def __get_pricings__(self):
         logger.info("Defender - Getting pricings...")
+        return self.__threading_call__(self.__get_subscription_pricings__, self.clients)
+
+    def __get_subscription_pricings__(self, subscription):
         pricings = {}
-        for subscription, client in self.clients.items():
-            try:
-                pricings_list = client.pricings.list()
-                pricings.update({subscription: {}})
-                for pricing in pricings_list.value:
-                    pricings[subscription].update(
-                        {
-                            pricing.name: Defender_Pricing(
-                                resource_id=pricing.id,
-                                pricing_tier=pricing.pricing_tier,
-                                free_trial_remaining_time=pricing.free_trial_remaining_time,
-                            )
-                        }
+        for pricing in self.clients[subscription].pricings.list().value:
+            pricings.update(
+                {
+                    pricing.name: Defender_Pricing(
+                        resource_id=pricing.id,
+                        pricing_tier=pricing.pricing_tier,
+                        free_trial_remaining_time=pricing.free_trial_remaining_time,
                     )
-            except Exception as error:
-                logger.error(f"Subscription name: {subscription}")
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+                }
+            )
         return pricings
 
 
@@ -4,6 +4,7 @@ from azure.mgmt.authorization import AuthorizationManagementClient
 from azure.mgmt.authorization.v2022_04_01.models import Permission
 
 from prowler.lib.logger import logger
+from prowler.providers.azure.azure_provider import threading_call
 
 
 ########################## IAM
@@ -36,30 +37,28 @@ class IAM:
         else:
             return clients
 
+    def __threading_call__(self, call, subscriptions):
+        return threading_call(call, subscriptions)
+
     def __get_roles__(self):
         logger.info("IAM - Getting roles...")
-        roles = {}
-        for subscription, client in self.clients.items():
-            try:
-                roles.update({subscription: []})
-                for role in client.role_definitions.list(
-                    scope=f"/subscriptions/{self.subscriptions[subscription]}",
-                    filter="type eq 'CustomRole'",
-                ):
-                    roles[subscription].append(
-                        Role(
-                            id=role.id,
-                            name=role.role_name,
-                            type=role.role_type,
-                            assignable_scopes=role.assignable_scopes,
-                            permissions=role.permissions,
-                        )
-                    )
-            except Exception as error:
-                logger.error(f"Subscription name: {subscription}")
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        return self.__threading_call__(self.__get_subscription_roles__, self.clients)
+
+    def __get_subscription_roles__(self, subscription):
+        roles = []
+        for role in self.clients[subscription].role_definitions.list(
+            scope=f"/subscriptions/{self.subscriptions[subscription]}",
+            filter="type eq 'CustomRole'",
+        ):
+            roles.append(
+                Role(
+                    id=role.id,
+                    name=role.role_name,
+                    type=role.role_type,
+                    assignable_scopes=role.assignable_scopes,
+                    permissions=role.permissions,
                 )
+            )
         return roles
 
 
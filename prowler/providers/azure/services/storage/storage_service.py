@@ -4,6 +4,7 @@ from azure.mgmt.storage import StorageManagementClient
 from azure.mgmt.storage.v2022_09_01.models import NetworkRuleSet
 
 from prowler.lib.logger import logger
+from prowler.providers.azure.azure_provider import threading_call
 
 
 ########################## Storage
@@ -36,31 +37,30 @@ class Storage:
         else:
             return clients
 
+    def __threading_call__(self, call, subscriptions):
+        return threading_call(call, subscriptions)
+
     def __get_storage_accounts__(self):
         logger.info("Storage - Getting storage accounts...")
-        storage_accounts = {}
-        for subscription, client in self.clients.items():
-            try:
-                storage_accounts.update({subscription: []})
-                storage_accounts_list = client.storage_accounts.list()
-                for storage_account in storage_accounts_list:
-                    storage_accounts[subscription].append(
-                        Storage_Account(
-                            id=storage_account.id,
-                            name=storage_account.name,
-                            enable_https_traffic_only=storage_account.enable_https_traffic_only,
-                            infrastructure_encryption=storage_account.encryption.require_infrastructure_encryption,
-                            allow_blob_public_access=storage_account.allow_blob_public_access,
-                            network_rule_set=storage_account.network_rule_set,
-                            encryption_type=storage_account.encryption.key_source,
-                            minimum_tls_version=storage_account.minimum_tls_version,
-                        )
-                    )
-            except Exception as error:
-                logger.error(f"Subscription name: {subscription}")
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        return self.__threading_call__(
+            self.__get_subscription_storage_accounts__, self.clients
+        )
+
+    def __get_subscription_storage_accounts__(self, subscription):
+        storage_accounts = []
+        for storage_account in self.clients[subscription].storage_accounts.list():
+            storage_accounts.append(
+                Storage_Account(
+                    id=storage_account.id,
+                    name=storage_account.name,
+                    enable_https_traffic_only=storage_account.enable_https_traffic_only,
+                    infrastructure_encryption=storage_account.encryption.require_infrastructure_encryption,
+                    allow_blob_public_access=storage_account.allow_blob_public_access,
+                    network_rule_set=storage_account.network_rule_set,
+                    encryption_type=storage_account.encryption.key_source,
+                    minimum_tls_version=storage_account.minimum_tls_version,
                 )
+            )
         return storage_accounts
 
 
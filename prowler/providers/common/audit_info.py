@@ -5,6 +5,7 @@ from colorama import Fore, Style
 
 from prowler.config.config import boto3_user_agent_extra
 from prowler.lib.logger import logger
+from prowler.lib.scan_filters.scan_filters import Resource_Filter
 from prowler.providers.aws.aws_provider import (
     AWS_Provider,
     assume_role,
@@ -244,13 +245,15 @@ Azure Identity Type: {Fore.YELLOW}[{audit_info.identity.identity_type}]{Style.RE
         # Parse Scan Tags
         if arguments.get("resource_tags"):
             input_resource_tags = arguments.get("resource_tags")
-            current_audit_info.audit_resources = get_tagged_resources(
-                input_resource_tags, current_audit_info
+            current_audit_info.audit_resources = Resource_Filter(
+                get_tagged_resources(input_resource_tags, current_audit_info)
             )
 
         # Parse Input Resource ARNs
         if arguments.get("resource_arn"):
-            current_audit_info.audit_resources = arguments.get("resource_arn")
+            current_audit_info.audit_resources = Resource_Filter(
+                arguments.get("resource_arn")
+            )
 
         return current_audit_info
 
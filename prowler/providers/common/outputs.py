@@ -6,6 +6,8 @@ from os.path import isdir
 
 from prowler.config.config import change_config_var, output_file_timestamp
 from prowler.lib.logger import logger
+from prowler.lib.outputs.file_descriptors import Output_Session
+from prowler.lib.outputs.findings_aggregator import Findings_Aggregator
 
 
 def set_provider_output_options(
@@ -39,6 +41,8 @@ class Provider_Output_Options:
     verbose: str
     output_filename: str
     only_logs: bool
+    output_session: Output_Session
+    findings_aggregator: Findings_Aggregator
 
     def __init__(self, arguments, allowlist_file, bulk_checks_metadata):
         self.is_quiet = arguments.quiet
@@ -48,6 +52,10 @@ class Provider_Output_Options:
         self.bulk_checks_metadata = bulk_checks_metadata
         self.allowlist_file = allowlist_file
         self.only_logs = arguments.only_logs
+        # Output files shared by all the checks, set before the execution
+        self.output_session = None
+        # Running counters of the findings, the findings are not kept if set
+        self.findings_aggregator = None
         # Check output directory, if it is not created -> create it
         if arguments.output_directory:
             if not isdir(arguments.output_directory):
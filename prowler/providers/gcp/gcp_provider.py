@@ -1,10 +1,21 @@
 import os
 import sys
+import threading
+import time
+from functools import lru_cache
+from itertools import chain
 
+import requests
 from google import auth
 from googleapiclient import discovery
 from googleapiclient.discovery import Resource
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.errors import UnknownApiNameOrVersion
+from googleapiclient.http import MAX_BATCH_LIMIT
+from googleapiclient.version import __version__ as googleapiclient_version
 
+from prowler.config.config import gcp_discovery_cache_directory, get_config_var
+from prowler.lib.calls_executor.calls_executor import Calls_Executor
 from prowler.lib.logger import logger
 from prowler.providers.gcp.lib.audit_info.models import GCP_Audit_Info
 
@@ -68,8 +79,9 @@ class GCP_Provider:
         try:
             project_ids = []
 
-            service = discovery.build(
-                "cloudresourcemanager", "v1", credentials=self.credentials
+            service = discovery.build_from_document(
+                get_discovery_document("cloudresourcemanager", "v1"),
+                credentials=self.credentials,
             )
 
             request = service.projects().list()
@@ -92,14 +104,210 @@ class GCP_Provider:
             return []
 
 
+# Seconds the downloaded discovery documents are reused before downloading them again
+gcp_discovery_cache_max_age = 7 * 24 * 60 * 60
+
+
+@lru_cache(maxsize=None)
+def get_discovery_document(service: str, api_version: str) -> str:
+    """
+    Return the discovery document of the API version, loaded once per process from the documents
+    bundled with googleapiclient, the local discovery cache or the discovery service, in that order.
+    The documents downloaded from the discovery service are stored in the local discovery cache,
+    kept per googleapiclient version and downloaded again once they are older than gcp_discovery_cache_max_age.
+    """
+    document = get_static_doc(service, api_version)
+    if document:
+        return document
+
+    cache_file = os.path.join(
+        gcp_discovery_cache_directory,
+        googleapiclient_version,
+        f"{service}.{api_version}.json",
+    )
+    cached_document = None
+    if os.path.isfile(cache_file):
+        with open(cache_file) as f:
+            cached_document = f.read()
+        if time.time() - os.path.getmtime(cache_file) < gcp_discovery_cache_max_age:
+            return cached_document
+
+    try:
+        document = download_discovery_document(service, api_version)
+    except requests.RequestException as error:
+        # The expired document is better than none if the discovery service cannot be reached
+        if cached_document:
+            logger.warning(
+                f"{service} {api_version} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return cached_document
+        raise
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        # Written aside and renamed to not leave a partial document to other processes
+        with open(f"{cache_file}.{os.getpid()}", "w") as f:
+            f.write(document)
+        os.replace(f"{cache_file}.{os.getpid()}", cache_file)
+    except OSError as error:
+        logger.warning(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return document
+
+
+def download_discovery_document(service: str, api_version: str) -> str:
+    """Return the discovery document of the API version from the discovery service"""
+    for discovery_uri in (discovery.DISCOVERY_URI, discovery.V2_DISCOVERY_URI):
+        response = requests.get(
+            discovery_uri.format(api=service, apiVersion=api_version), timeout=60
+        )
+        if response.status_code == 404:
+            continue
+        response.raise_for_status()
+        return response.text
+
+    raise UnknownApiNameOrVersion(f"name: {service}  version: {api_version}")
+
+
+# Default number of workers running the calls of all the GCP services
+default_max_gcp_workers = 10
+# Requests grouped in an HTTP batch, the lowest limit among the Google APIs used
+default_gcp_batch_size = 100
+
+
+class Thread_Local_Client:
+    """
+    Thread_Local_Client builds a discovery client per thread, since the httplib2 transport
+    of googleapiclient is not thread-safe, and forwards every attribute to the client of the current thread.
+    """
+
+    def __init__(
+        self,
+        service: str,
+        api_version: str,
+        credentials,
+        batch_requests: bool = False,
+        batch_size: int = default_gcp_batch_size,
+    ):
+        self.service = service
+        self.api_version = api_version
+        self.credentials = credentials
+        self.batch_requests = batch_requests
+        self.batch_size = max(1, min(batch_size, MAX_BATCH_LIMIT))
+        self.thread_clients = threading.local()
+        # The client of the calling thread is built right away to raise the errors here
+        self.get_client()
+
+    def get_client(self) -> Resource:
+        client = getattr(self.thread_clients, "client", None)
+        if client is None:
+            client = discovery.build_from_document(
+                get_discovery_document(self.service, self.api_version),
+                credentials=self.credentials,
+            )
+            self.thread_clients.client = client
+        return client
+
+    def __getattr__(self, name):
+        return getattr(self.get_client(), name)
+
+    def execute_requests(self, requests: list) -> list:
+        """
+        Execute the independent requests, in HTTP batches of up to batch_size requests if enabled,
+        and return their responses in the requests order, or the exception raised by each failed request
+        """
+        if not self.batch_requests or len(requests) < 2:
+            responses = []
+            for request in requests:
+                try:
+                    responses.append(request.execute())
+                except Exception as error:
+                    responses.append(error)
+            return responses
+
+        responses = {}
+
+        def callback(request_id, response, exception):
+            responses[int(request_id)] = exception if exception else response
+
+        for start in range(0, len(requests), self.batch_size):
+            batch = self.get_client().new_batch_http_request(callback=callback)
+            for request_id, request in enumerate(
+                requests[start : start + self.batch_size], start
+            ):
+                batch.add(request, request_id=str(request_id))
+            batch.execute()
+        return [responses.get(request_id) for request_id in range(len(requests))]
+
+
 def generate_client(
     service: str,
     api_version: str,
     audit_info: GCP_Audit_Info,
-) -> Resource:
+    batch_requests: bool = None,
+) -> Thread_Local_Client:
     try:
-        return discovery.build(service, api_version, credentials=audit_info.credentials)
+        # The HTTP batches are enabled for every client in the configuration file if not set
+        if batch_requests is None:
+            batch_requests = bool(get_config_var("gcp_batch_requests"))
+        return Thread_Local_Client(
+            service,
+            api_version,
+            audit_info.credentials,
+            batch_requests=batch_requests,
+            batch_size=get_config_var("gcp_batch_size") or default_gcp_batch_size,
+        )
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
         )
+
+
+def get_request_batches(client: Thread_Local_Client, items) -> list:
+    """Split the items in groups of the client batch size, or of one item if its requests are not batched"""
+    items = list(items)
+    size = client.batch_size if client and client.batch_requests else 1
+    return [items[index : index + size] for index in range(0, len(items), size)]
+
+
+class GCP_Calls_Executor(Calls_Executor):
+    """
+    GCP_Calls_Executor runs the calls of all the GCP services, one per project or resource,
+    and merges their results in the order of the input.
+    """
+
+    def __init__(self, max_workers: int = default_max_gcp_workers):
+        super().__init__(max_workers, thread_name_prefix="prowler-gcp")
+
+    def log_call_error(self, call, item, error: Exception):
+        logger.error(
+            f"{call.__qualname__} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+    def threading_call(self, call, items) -> list:
+        """Run the call for every item and return the concatenation of the lists returned, in the items order"""
+        return list(
+            chain.from_iterable(
+                result for _, result in self.run_calls(call, items) if result
+            )
+        )
+
+
+gcp_calls_executor = None
+gcp_calls_executor_lock = threading.Lock()
+
+
+def get_gcp_calls_executor() -> GCP_Calls_Executor:
+    """Return the executor shared by all the GCP services, creating it on first use"""
+    global gcp_calls_executor
+    with gcp_calls_executor_lock:
+        if not gcp_calls_executor:
+            gcp_calls_executor = GCP_Calls_Executor(
+                get_config_var("max_gcp_workers") or default_max_gcp_workers
+            )
+        return gcp_calls_executor
+
+
+def threading_call(call, items) -> list:
+    """Run the call for every item in the shared executor and merge the returned lists in the items order"""
+    return get_gcp_calls_executor().threading_call(call, items)
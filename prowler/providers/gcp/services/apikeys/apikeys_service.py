@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
-from prowler.providers.gcp.gcp_provider import generate_client
+from prowler.providers.gcp.gcp_provider import generate_client, threading_call
 
 
 ################## API Keys
@@ -13,44 +13,47 @@ class APIKeys:
         self.default_project_id = audit_info.default_project_id
         self.region = "global"
         self.client = generate_client(self.service, self.api_version, audit_info)
-        self.keys = []
-        self.__get_keys__()
+        self.keys = self.__threading_call__(self.__get_keys__, self.project_ids)
+
+    def __threading_call__(self, call, items):
+        return threading_call(call, items)
+
+    def __get_keys__(self, project_id):
+        keys = []
+        try:
+            request = (
+                self.client.projects()
+                .locations()
+                .keys()
+                .list(
+                    parent=f"projects/{project_id}/locations/global",
+                )
+            )
+            while request is not None:
+                response = request.execute()
+
+                for key in response.get("keys", []):
+                    keys.append(
+                        Key(
+                            name=key["displayName"],
+                            id=key["uid"],
+                            creation_time=key["createTime"],
+                            restrictions=key.get("restrictions", {}),
+                            project_id=project_id,
+                        )
+                    )
 
-    def __get_keys__(self):
-        for project_id in self.project_ids:
-            try:
                 request = (
                     self.client.projects()
                     .locations()
                     .keys()
-                    .list(
-                        parent=f"projects/{project_id}/locations/global",
-                    )
-                )
-                while request is not None:
-                    response = request.execute()
-
-                    for key in response.get("keys", []):
-                        self.keys.append(
-                            Key(
-                                name=key["displayName"],
-                                id=key["uid"],
-                                creation_time=key["createTime"],
-                                restrictions=key.get("restrictions", {}),
-                                project_id=project_id,
-                            )
-                        )
-
-                    request = (
-                        self.client.projects()
-                        .locations()
-                        .keys()
-                        .list_next(previous_request=request, previous_response=response)
-                    )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    .list_next(previous_request=request, previous_response=response)
                 )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return keys
 
 
 class Key(BaseModel):
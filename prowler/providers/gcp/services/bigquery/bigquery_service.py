@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
-from prowler.providers.gcp.gcp_provider import generate_client
+from prowler.providers.gcp.gcp_provider import generate_client, threading_call
 
 
 ################## BigQuery
@@ -11,27 +11,33 @@ class BigQuery:
         self.api_version = "v2"
         self.project_ids = audit_info.project_ids
         self.client = generate_client(self.service, self.api_version, audit_info)
-        self.datasets = []
-        self.tables = []
-        self.__get_datasets__()
-        self.__get_tables__()
+        self.datasets = self.__threading_call__(self.__get_datasets__, self.project_ids)
+        self.tables = self.__threading_call__(self.__get_tables__, self.datasets)
 
-    def __get_datasets__(self):
-        for project_id in self.project_ids:
-            try:
-                request = self.client.datasets().list(projectId=project_id)
-                while request is not None:
-                    response = request.execute()
+    def __threading_call__(self, call, items):
+        return threading_call(call, items)
 
-                    for dataset in response.get("datasets", []):
-                        dataset_info = (
-                            self.client.datasets()
-                            .get(
-                                projectId=project_id,
-                                datasetId=dataset["datasetReference"]["datasetId"],
-                            )
-                            .execute()
+    def __get_datasets__(self, project_id):
+        datasets = []
+        try:
+            request = self.client.datasets().list(projectId=project_id)
+            while request is not None:
+                response = request.execute()
+
+                page_datasets = response.get("datasets", [])
+                datasets_info = self.client.execute_requests(
+                    [
+                        self.client.datasets().get(
+                            projectId=project_id,
+                            datasetId=dataset["datasetReference"]["datasetId"],
                         )
+                        for dataset in page_datasets
+                    ]
+                )
+                for dataset, dataset_info in zip(page_datasets, datasets_info):
+                    try:
+                        if isinstance(dataset_info, Exception):
+                            raise dataset_info
                         cmk_encryption = False
                         public = False
                         roles = dataset_info.get("access", "")
@@ -41,7 +47,7 @@ class BigQuery:
                             public = True
                         if dataset_info.get("defaultEncryptionConfiguration"):
                             cmk_encryption = True
-                        self.datasets.append(
+                        datasets.append(
                             Dataset(
                                 name=dataset["datasetReference"]["datasetId"],
                                 id=dataset["id"],
@@ -51,38 +57,48 @@ class BigQuery:
                                 project_id=project_id,
                             )
                         )
+                    except Exception as error:
+                        logger.error(
+                            f"{dataset['id']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
 
-                    request = self.client.datasets().list_next(
-                        previous_request=request, previous_response=response
-                    )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                request = self.client.datasets().list_next(
+                    previous_request=request, previous_response=response
                 )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return datasets
 
-    def __get_tables__(self):
-        for dataset in self.datasets:
-            try:
-                request = self.client.tables().list(
-                    projectId=dataset.project_id, datasetId=dataset.name
-                )
-                while request is not None:
-                    response = request.execute()
+    def __get_tables__(self, dataset):
+        tables = []
+        try:
+            request = self.client.tables().list(
+                projectId=dataset.project_id, datasetId=dataset.name
+            )
+            while request is not None:
+                response = request.execute()
 
-                    for table in response.get("tables", []):
+                page_tables = response.get("tables", [])
+                tables_info = self.client.execute_requests(
+                    [
+                        self.client.tables().get(
+                            projectId=dataset.project_id,
+                            datasetId=dataset.name,
+                            tableId=table["tableReference"]["tableId"],
+                        )
+                        for table in page_tables
+                    ]
+                )
+                for table, table_info in zip(page_tables, tables_info):
+                    try:
+                        if isinstance(table_info, Exception):
+                            raise table_info
                         cmk_encryption = False
-                        if (
-                            self.client.tables()
-                            .get(
-                                projectId=dataset.project_id,
-                                datasetId=dataset.name,
-                                tableId=table["tableReference"]["tableId"],
-                            )
-                            .execute()
-                            .get("encryptionConfiguration")
-                        ):
+                        if table_info.get("encryptionConfiguration"):
                             cmk_encryption = True
-                        self.tables.append(
+                        tables.append(
                             Table(
                                 name=table["tableReference"]["tableId"],
                                 id=table["id"],
@@ -91,14 +107,19 @@ class BigQuery:
                                 project_id=dataset.project_id,
                             )
                         )
+                    except Exception as error:
+                        logger.error(
+                            f"{table['id']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
 
-                    request = self.client.tables().list_next(
-                        previous_request=request, previous_response=response
-                    )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                request = self.client.tables().list_next(
+                    previous_request=request, previous_response=response
                 )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return tables
 
 
 class Dataset(BaseModel):
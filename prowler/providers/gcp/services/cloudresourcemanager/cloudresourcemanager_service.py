@@ -1,7 +1,11 @@
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
-from prowler.providers.gcp.gcp_provider import generate_client
+from prowler.providers.gcp.gcp_provider import (
+    generate_client,
+    get_request_batches,
+    threading_call,
+)
 
 
 ################## CloudResourceManager
@@ -15,36 +19,57 @@ class CloudResourceManager:
         self.bindings = []
         self.projects = []
         self.organizations = []
-        self.__get_iam_policy__()
+        for project, bindings in self.__threading_call__(
+            self.__get_iam_policy__, get_request_batches(self.client, self.project_ids)
+        ):
+            self.projects.append(project)
+            self.bindings.extend(bindings)
         self.__get_organizations__()
 
     def __get_client__(self):
         return self.client
 
-    def __get_iam_policy__(self):
-        for project_id in self.project_ids:
-            try:
-                policy = (
-                    self.client.projects().getIamPolicy(resource=project_id).execute()
-                )
-                audit_logging = False
-                if policy.get("auditConfigs"):
-                    audit_logging = True
-                self.projects.append(
-                    Project(id=project_id, audit_logging=audit_logging)
-                )
-                for binding in policy["bindings"]:
-                    self.bindings.append(
-                        Binding(
-                            role=binding["role"],
-                            members=binding["members"],
-                            project_id=project_id,
+    def __threading_call__(self, call, items):
+        return threading_call(call, items)
+
+    def __get_iam_policy__(self, project_ids):
+        projects = []
+        try:
+            policies = self.client.execute_requests(
+                [
+                    self.client.projects().getIamPolicy(resource=project_id)
+                    for project_id in project_ids
+                ]
+            )
+            for project_id, policy in zip(project_ids, policies):
+                # The errors of a project do not stop the rest of the batch
+                try:
+                    if isinstance(policy, Exception):
+                        raise policy
+                    audit_logging = False
+                    if policy.get("auditConfigs"):
+                        audit_logging = True
+                    bindings = []
+                    projects.append(
+                        (Project(id=project_id, audit_logging=audit_logging), bindings)
+                    )
+                    for binding in policy["bindings"]:
+                        bindings.append(
+                            Binding(
+                                role=binding["role"],
+                                members=binding["members"],
+                                project_id=project_id,
+                            )
                         )
+                except Exception as error:
+                    logger.error(
+                        f"{self.region} -- {project_id} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                     )
-            except Exception as error:
-                logger.error(
-                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return projects
 
     def __get_organizations__(self):
         try:
@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
-from prowler.providers.gcp.gcp_provider import generate_client
+from prowler.providers.gcp.gcp_provider import generate_client, threading_call
 
 
 ################## CloudSQL
@@ -11,49 +11,54 @@ class CloudSQL:
         self.api_version = "v1"
         self.project_ids = audit_info.project_ids
         self.client = generate_client(self.service, self.api_version, audit_info)
-        self.instances = []
-        self.__get_instances__()
+        self.instances = self.__threading_call__(
+            self.__get_instances__, self.project_ids
+        )
 
-    def __get_instances__(self):
-        for project_id in self.project_ids:
-            try:
-                request = self.client.instances().list(project=project_id)
-                while request is not None:
-                    response = request.execute()
+    def __threading_call__(self, call, items):
+        return threading_call(call, items)
 
-                    for instance in response.get("items", []):
-                        public_ip = False
-                        for address in instance.get("ipAddresses", []):
-                            if address["type"] == "PRIMARY":
-                                public_ip = True
-                        self.instances.append(
-                            Instance(
-                                name=instance["name"],
-                                version=instance["databaseVersion"],
-                                region=instance["region"],
-                                ip_addresses=instance.get("ipAddresses", []),
-                                public_ip=public_ip,
-                                ssl=instance["settings"]["ipConfiguration"].get(
-                                    "requireSsl", False
-                                ),
-                                automated_backups=instance["settings"][
-                                    "backupConfiguration"
-                                ]["enabled"],
-                                authorized_networks=instance["settings"][
-                                    "ipConfiguration"
-                                ]["authorizedNetworks"],
-                                flags=instance["settings"].get("databaseFlags", []),
-                                project_id=project_id,
-                            )
-                        )
+    def __get_instances__(self, project_id):
+        instances = []
+        try:
+            request = self.client.instances().list(project=project_id)
+            while request is not None:
+                response = request.execute()
 
-                    request = self.client.instances().list_next(
-                        previous_request=request, previous_response=response
+                for instance in response.get("items", []):
+                    public_ip = False
+                    for address in instance.get("ipAddresses", []):
+                        if address["type"] == "PRIMARY":
+                            public_ip = True
+                    instances.append(
+                        Instance(
+                            name=instance["name"],
+                            version=instance["databaseVersion"],
+                            region=instance["region"],
+                            ip_addresses=instance.get("ipAddresses", []),
+                            public_ip=public_ip,
+                            ssl=instance["settings"]["ipConfiguration"].get(
+                                "requireSsl", False
+                            ),
+                            automated_backups=instance["settings"][
+                                "backupConfiguration"
+                            ]["enabled"],
+                            authorized_networks=instance["settings"]["ipConfiguration"][
+                                "authorizedNetworks"
+                            ],
+                            flags=instance["settings"].get("databaseFlags", []),
+                            project_id=project_id,
+                        )
                     )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+
+                request = self.client.instances().list_next(
+                    previous_request=request, previous_response=response
                 )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return instances
 
 
 class Instance(BaseModel):
@@ -3,7 +3,7 @@ from typing import Optional
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
-from prowler.providers.gcp.gcp_provider import generate_client
+from prowler.providers.gcp.gcp_provider import generate_client, threading_call
 
 
 ################## CloudStorage
@@ -13,27 +13,35 @@ class CloudStorage:
         self.api_version = "v1"
         self.project_ids = audit_info.project_ids
         self.client = generate_client(self.service, self.api_version, audit_info)
-        self.buckets = []
-        self.__get_buckets__()
+        self.buckets = self.__threading_call__(self.__get_buckets__, self.project_ids)
 
-    def __get_buckets__(self):
-        for project_id in self.project_ids:
-            try:
-                request = self.client.buckets().list(project=project_id)
-                while request is not None:
-                    response = request.execute()
-                    for bucket in response.get("items", []):
-                        bucket_iam = (
-                            self.client.buckets()
-                            .getIamPolicy(bucket=bucket["id"])
-                            .execute()["bindings"]
-                        )
+    def __threading_call__(self, call, items):
+        return threading_call(call, items)
+
+    def __get_buckets__(self, project_id):
+        buckets = []
+        try:
+            request = self.client.buckets().list(project=project_id)
+            while request is not None:
+                response = request.execute()
+                page_buckets = response.get("items", [])
+                buckets_iam = self.client.execute_requests(
+                    [
+                        self.client.buckets().getIamPolicy(bucket=bucket["id"])
+                        for bucket in page_buckets
+                    ]
+                )
+                for bucket, bucket_iam_policy in zip(page_buckets, buckets_iam):
+                    try:
+                        if isinstance(bucket_iam_policy, Exception):
+                            raise bucket_iam_policy
+                        bucket_iam = bucket_iam_policy["bindings"]
                         public = False
                         if "allAuthenticatedUsers" in str(
                             bucket_iam
                         ) or "allUsers" in str(bucket_iam):
                             public = True
-                        self.buckets.append(
+                        buckets.append(
                             Bucket(
                                 name=bucket["name"],
                                 id=bucket["id"],
@@ -46,14 +54,19 @@ class CloudStorage:
                                 project_id=project_id,
                             )
                         )
+                    except Exception as error:
+                        logger.error(
+                            f"{bucket['id']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
 
-                    request = self.client.buckets().list_next(
-                        previous_request=request, previous_response=response
-                    )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                request = self.client.buckets().list_next(
+                    previous_request=request, previous_response=response
                 )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return buckets
 
 
 class Bucket(BaseModel):
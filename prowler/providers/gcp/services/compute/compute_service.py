@@ -1,7 +1,13 @@
+from itertools import product
+
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
-from prowler.providers.gcp.gcp_provider import generate_client
+from prowler.providers.gcp.gcp_provider import (
+    generate_client,
+    get_request_batches,
+    threading_call,
+)
 
 
 ################## Compute
@@ -13,260 +19,295 @@ class Compute:
         self.default_project_id = audit_info.default_project_id
         self.client = generate_client(self.service, self.api_version, audit_info)
         self.region = "global"
-        self.regions = set()
-        self.zones = set()
-        self.instances = []
-        self.networks = []
-        self.subnets = []
-        self.firewalls = []
-        self.projects = []
-        self.load_balancers = []
-        self.__get_url_maps__()
-        self.__describe_backend_service__()
-        self.__get_regions__()
-        self.__get_projects__()
-        self.__get_zones__()
-        self.__get_instances__()
-        self.__get_networks__()
-        self.__get_subnetworks__()
-        self.__get_firewalls__()
-
-    def __get_regions__(self):
-        for project_id in self.project_ids:
-            try:
-                request = self.client.regions().list(project=project_id)
-                while request is not None:
-                    response = request.execute()
-
-                    for region in response.get("items", []):
-                        self.regions.add(region["name"])
-
-                    request = self.client.regions().list_next(
-                        previous_request=request, previous_response=response
-                    )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
-
-    def __get_zones__(self):
-        for project_id in self.project_ids:
-            try:
-                request = self.client.zones().list(project=project_id)
-                while request is not None:
-                    response = request.execute()
-
-                    for zone in response.get("items", []):
-                        self.zones.add(zone["name"])
-
-                    request = self.client.zones().list_next(
-                        previous_request=request, previous_response=response
-                    )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
-
-    def __get_projects__(self):
-        for project_id in self.project_ids:
-            try:
-                enable_oslogin = False
-                response = self.client.projects().get(project=project_id).execute()
-                for item in response["commonInstanceMetadata"].get("items", []):
-                    if item["key"] == "enable-oslogin" and item["value"] == "TRUE":
-                        enable_oslogin = True
-                self.projects.append(
-                    Project(id=project_id, enable_oslogin=enable_oslogin)
+        self.load_balancers = self.__threading_call__(
+            self.__get_url_maps__, self.project_ids
+        )
+        self.__threading_call__(
+            self.__describe_backend_service__,
+            get_request_batches(self.client, self.load_balancers),
+        )
+        self.regions = set(
+            self.__threading_call__(self.__get_regions__, self.project_ids)
+        )
+        self.projects = self.__threading_call__(
+            self.__get_projects__, get_request_batches(self.client, self.project_ids)
+        )
+        self.zones = set(self.__threading_call__(self.__get_zones__, self.project_ids))
+        self.instances = self.__threading_call__(
+            self.__get_instances__, product(self.project_ids, sorted(self.zones))
+        )
+        self.networks = self.__threading_call__(self.__get_networks__, self.project_ids)
+        self.subnets = self.__threading_call__(
+            self.__get_subnetworks__, product(self.project_ids, sorted(self.regions))
+        )
+        self.firewalls = self.__threading_call__(
+            self.__get_firewalls__, self.project_ids
+        )
+
+    def __threading_call__(self, call, items):
+        return threading_call(call, items)
+
+    def __get_regions__(self, project_id):
+        regions = []
+        try:
+            request = self.client.regions().list(project=project_id)
+            while request is not None:
+                response = request.execute()
+
+                for region in response.get("items", []):
+                    regions.append(region["name"])
+
+                request = self.client.regions().list_next(
+                    previous_request=request, previous_response=response
                 )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return regions
+
+    def __get_zones__(self, project_id):
+        zones = []
+        try:
+            request = self.client.zones().list(project=project_id)
+            while request is not None:
+                response = request.execute()
+
+                for zone in response.get("items", []):
+                    zones.append(zone["name"])
+
+                request = self.client.zones().list_next(
+                    previous_request=request, previous_response=response
                 )
-
-    def __get_instances__(self):
-        for project_id in self.project_ids:
-            try:
-                for zone in self.zones:
-                    request = self.client.instances().list(
-                        project=project_id, zone=zone
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return zones
+
+    def __get_projects__(self, project_ids):
+        projects = []
+        try:
+            responses = self.client.execute_requests(
+                [
+                    self.client.projects().get(project=project_id)
+                    for project_id in project_ids
+                ]
+            )
+            for project_id, response in zip(project_ids, responses):
+                try:
+                    if isinstance(response, Exception):
+                        raise response
+                    enable_oslogin = False
+                    for item in response["commonInstanceMetadata"].get("items", []):
+                        if item["key"] == "enable-oslogin" and item["value"] == "TRUE":
+                            enable_oslogin = True
+                    projects.append(
+                        Project(id=project_id, enable_oslogin=enable_oslogin)
+                    )
+                except Exception as error:
+                    logger.error(
+                        f"{project_id} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                     )
-                    while request is not None:
-                        response = request.execute()
-
-                        for instance in response.get("items", []):
-                            public_ip = False
-                            for interface in instance["networkInterfaces"]:
-                                for config in interface.get("accessConfigs", []):
-                                    if "natIP" in config:
-                                        public_ip = True
-                            self.instances.append(
-                                Instance(
-                                    name=instance["name"],
-                                    id=instance["id"],
-                                    zone=zone,
-                                    public_ip=public_ip,
-                                    metadata=instance["metadata"],
-                                    shielded_enabled_vtpm=instance[
-                                        "shieldedInstanceConfig"
-                                    ]["enableVtpm"],
-                                    shielded_enabled_integrity_monitoring=instance[
-                                        "shieldedInstanceConfig"
-                                    ]["enableIntegrityMonitoring"],
-                                    confidential_computing=instance[
-                                        "confidentialInstanceConfig"
-                                    ]["enableConfidentialCompute"],
-                                    service_accounts=instance["serviceAccounts"],
-                                    ip_forward=instance.get("canIpForward", False),
-                                    disks_encryption=[
-                                        (
-                                            disk["deviceName"],
-                                            True
-                                            if disk.get("diskEncryptionKey", {}).get(
-                                                "sha256"
-                                            )
-                                            else False,
-                                        )
-                                        for disk in instance["disks"]
-                                    ],
-                                    project_id=project_id,
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return projects
+
+    def __get_instances__(self, project_zone):
+        project_id, zone = project_zone
+        instances = []
+        try:
+            request = self.client.instances().list(project=project_id, zone=zone)
+            while request is not None:
+                response = request.execute()
+
+                for instance in response.get("items", []):
+                    public_ip = False
+                    for interface in instance["networkInterfaces"]:
+                        for config in interface.get("accessConfigs", []):
+                            if "natIP" in config:
+                                public_ip = True
+                    instances.append(
+                        Instance(
+                            name=instance["name"],
+                            id=instance["id"],
+                            zone=zone,
+                            public_ip=public_ip,
+                            metadata=instance["metadata"],
+                            shielded_enabled_vtpm=instance["shieldedInstanceConfig"][
+                                "enableVtpm"
+                            ],
+                            shielded_enabled_integrity_monitoring=instance[
+                                "shieldedInstanceConfig"
+                            ]["enableIntegrityMonitoring"],
+                            confidential_computing=instance[
+                                "confidentialInstanceConfig"
+                            ]["enableConfidentialCompute"],
+                            service_accounts=instance["serviceAccounts"],
+                            ip_forward=instance.get("canIpForward", False),
+                            disks_encryption=[
+                                (
+                                    disk["deviceName"],
+                                    True
+                                    if disk.get("diskEncryptionKey", {}).get("sha256")
+                                    else False,
                                 )
-                            )
-
-                        request = self.client.instances().list_next(
-                            previous_request=request, previous_response=response
+                                for disk in instance["disks"]
+                            ],
+                            project_id=project_id,
                         )
-            except Exception as error:
-                logger.error(
-                    f"{zone} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+                    )
 
-    def __get_networks__(self):
-        for project_id in self.project_ids:
-            try:
-                request = self.client.networks().list(project=project_id)
-                while request is not None:
-                    response = request.execute()
-                    for network in response.get("items", []):
-                        subnet_mode = (
-                            "legacy"
-                            if "autoCreateSubnetworks" not in network
-                            else "auto"
-                            if network["autoCreateSubnetworks"]
-                            else "custom"
-                        )
-                        self.networks.append(
-                            Network(
-                                name=network["name"],
-                                id=network["id"],
-                                subnet_mode=subnet_mode,
-                                project_id=project_id,
-                            )
+                request = self.client.instances().list_next(
+                    previous_request=request, previous_response=response
+                )
+        except Exception as error:
+            logger.error(
+                f"{zone} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return instances
+
+    def __get_networks__(self, project_id):
+        networks = []
+        try:
+            request = self.client.networks().list(project=project_id)
+            while request is not None:
+                response = request.execute()
+                for network in response.get("items", []):
+                    subnet_mode = (
+                        "legacy"
+                        if "autoCreateSubnetworks" not in network
+                        else "auto"
+                        if network["autoCreateSubnetworks"]
+                        else "custom"
+                    )
+                    networks.append(
+                        Network(
+                            name=network["name"],
+                            id=network["id"],
+                            subnet_mode=subnet_mode,
+                            project_id=project_id,
                         )
-
-                    request = self.client.networks().list_next(
-                        previous_request=request, previous_response=response
                     )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
 
-    def __get_subnetworks__(self):
-        for project_id in self.project_ids:
-            try:
-                for region in self.regions:
-                    request = self.client.subnetworks().list(
-                        project=project_id, region=region
+                request = self.client.networks().list_next(
+                    previous_request=request, previous_response=response
+                )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return networks
+
+    def __get_subnetworks__(self, project_region):
+        project_id, region = project_region
+        subnets = []
+        try:
+            request = self.client.subnetworks().list(project=project_id, region=region)
+            while request is not None:
+                response = request.execute()
+                for subnet in response.get("items", []):
+                    subnets.append(
+                        Subnet(
+                            name=subnet["name"],
+                            id=subnet["id"],
+                            project_id=project_id,
+                            flow_logs=subnet.get("enableFlowLogs", False),
+                            network=subnet["network"].split("/")[-1],
+                            region=region,
+                        )
                     )
-                    while request is not None:
-                        response = request.execute()
-                        for subnet in response.get("items", []):
-                            self.subnets.append(
-                                Subnet(
-                                    name=subnet["name"],
-                                    id=subnet["id"],
-                                    project_id=project_id,
-                                    flow_logs=subnet.get("enableFlowLogs", False),
-                                    network=subnet["network"].split("/")[-1],
-                                    region=region,
-                                )
-                            )
 
-                        request = self.client.subnetworks().list_next(
-                            previous_request=request, previous_response=response
-                        )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                request = self.client.subnetworks().list_next(
+                    previous_request=request, previous_response=response
                 )
-
-    def __get_firewalls__(self):
-        for project_id in self.project_ids:
-            try:
-                request = self.client.firewalls().list(project=project_id)
-                while request is not None:
-                    response = request.execute()
-
-                    for firewall in response.get("items", []):
-                        self.firewalls.append(
-                            Firewall(
-                                name=firewall["name"],
-                                id=firewall["id"],
-                                source_ranges=firewall["sourceRanges"],
-                                direction=firewall["direction"],
-                                allowed_rules=firewall.get("allowed", []),
-                                project_id=project_id,
-                            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return subnets
+
+    def __get_firewalls__(self, project_id):
+        firewalls = []
+        try:
+            request = self.client.firewalls().list(project=project_id)
+            while request is not None:
+                response = request.execute()
+
+                for firewall in response.get("items", []):
+                    firewalls.append(
+                        Firewall(
+                            name=firewall["name"],
+                            id=firewall["id"],
+                            source_ranges=firewall["sourceRanges"],
+                            direction=firewall["direction"],
+                            allowed_rules=firewall.get("allowed", []),
+                            project_id=project_id,
                         )
-
-                    request = self.client.firewalls().list_next(
-                        previous_request=request, previous_response=response
                     )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
 
-    def __get_url_maps__(self):
-        for project_id in self.project_ids:
-            try:
-                request = self.client.urlMaps().list(project=project_id)
-                while request is not None:
-                    response = request.execute()
-                    for urlmap in response.get("items", []):
-                        self.load_balancers.append(
-                            LoadBalancer(
-                                name=urlmap["name"],
-                                id=urlmap["id"],
-                                service=urlmap["defaultService"],
-                                project_id=project_id,
-                            )
+                request = self.client.firewalls().list_next(
+                    previous_request=request, previous_response=response
+                )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return firewalls
+
+    def __get_url_maps__(self, project_id):
+        load_balancers = []
+        try:
+            request = self.client.urlMaps().list(project=project_id)
+            while request is not None:
+                response = request.execute()
+                for urlmap in response.get("items", []):
+                    load_balancers.append(
+                        LoadBalancer(
+                            name=urlmap["name"],
+                            id=urlmap["id"],
+                            service=urlmap["defaultService"],
+                            project_id=project_id,
                         )
-
-                    request = self.client.urlMaps().list_next(
-                        previous_request=request, previous_response=response
                     )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
 
-    def __describe_backend_service__(self):
-        for balancer in self.load_balancers:
-            try:
-                response = (
-                    self.client.backendServices()
-                    .get(
+                request = self.client.urlMaps().list_next(
+                    previous_request=request, previous_response=response
+                )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return load_balancers
+
+    def __describe_backend_service__(self, balancers):
+        try:
+            responses = self.client.execute_requests(
+                [
+                    self.client.backendServices().get(
                         project=balancer.project_id,
                         backendService=balancer.service.split("/")[-1],
                     )
-                    .execute()
-                )
-                balancer.logging = response.get("logConfig", False).get("enable", False)
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+                    for balancer in balancers
+                ]
+            )
+            for balancer, response in zip(balancers, responses):
+                try:
+                    if isinstance(response, Exception):
+                        raise response
+                    balancer.logging = response.get("logConfig", False).get(
+                        "enable", False
+                    )
+                except Exception as error:
+                    logger.error(
+                        f"{balancer.name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
 
 class Instance(BaseModel):
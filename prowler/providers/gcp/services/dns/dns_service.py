@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
-from prowler.providers.gcp.gcp_provider import generate_client
+from prowler.providers.gcp.gcp_provider import generate_client, threading_call
 
 
 ################## DNS
@@ -13,66 +13,69 @@ class DNS:
         self.default_project_id = audit_info.default_project_id
         self.client = generate_client(self.service, self.api_version, audit_info)
         self.region = "global"
-        self.managed_zones = []
-        self.__get_managed_zones__()
-        self.policies = []
-        self.__get_policies__()
+        self.managed_zones = self.__threading_call__(
+            self.__get_managed_zones__, self.project_ids
+        )
+        self.policies = self.__threading_call__(self.__get_policies__, self.project_ids)
 
-    def __get_managed_zones__(self):
-        for project_id in self.project_ids:
-            try:
-                request = self.client.managedZones().list(project=project_id)
-                while request is not None:
-                    response = request.execute()
-                    for managed_zone in response.get("managedZones"):
-                        self.managed_zones.append(
-                            ManagedZone(
-                                name=managed_zone["name"],
-                                id=managed_zone["id"],
-                                dnssec=managed_zone["dnssecConfig"]["state"] == "on",
-                                key_specs=managed_zone["dnssecConfig"][
-                                    "defaultKeySpecs"
-                                ],
-                                project_id=project_id,
-                            )
-                        )
+    def __threading_call__(self, call, items):
+        return threading_call(call, items)
 
-                    request = self.client.managedZones().list_next(
-                        previous_request=request, previous_response=response
+    def __get_managed_zones__(self, project_id):
+        managed_zones = []
+        try:
+            request = self.client.managedZones().list(project=project_id)
+            while request is not None:
+                response = request.execute()
+                for managed_zone in response.get("managedZones"):
+                    managed_zones.append(
+                        ManagedZone(
+                            name=managed_zone["name"],
+                            id=managed_zone["id"],
+                            dnssec=managed_zone["dnssecConfig"]["state"] == "on",
+                            key_specs=managed_zone["dnssecConfig"]["defaultKeySpecs"],
+                            project_id=project_id,
+                        )
                     )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+
+                request = self.client.managedZones().list_next(
+                    previous_request=request, previous_response=response
                 )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return managed_zones
 
-    def __get_policies__(self):
-        for project_id in self.project_ids:
-            try:
-                request = self.client.policies().list(project=project_id)
-                while request is not None:
-                    response = request.execute()
+    def __get_policies__(self, project_id):
+        policies = []
+        try:
+            request = self.client.policies().list(project=project_id)
+            while request is not None:
+                response = request.execute()
 
-                    for policy in response.get("policies", []):
-                        policy_networks = []
-                        for network in policy.get("networks", []):
-                            policy_networks.append(network["networkUrl"].split("/")[-1])
-                        self.policies.append(
-                            Policy(
-                                name=policy["name"],
-                                id=policy["id"],
-                                logging=policy.get("enableLogging", False),
-                                networks=policy_networks,
-                                project_id=project_id,
-                            )
+                for policy in response.get("policies", []):
+                    policy_networks = []
+                    for network in policy.get("networks", []):
+                        policy_networks.append(network["networkUrl"].split("/")[-1])
+                    policies.append(
+                        Policy(
+                            name=policy["name"],
+                            id=policy["id"],
+                            logging=policy.get("enableLogging", False),
+                            networks=policy_networks,
+                            project_id=project_id,
                         )
-
-                    request = self.client.policies().list_next(
-                        previous_request=request, previous_response=response
                     )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+
+                request = self.client.policies().list_next(
+                    previous_request=request, previous_response=response
                 )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return policies
 
 
 class ManagedZone(BaseModel):
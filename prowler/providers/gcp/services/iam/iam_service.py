@@ -3,7 +3,11 @@ from datetime import datetime
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
-from prowler.providers.gcp.gcp_provider import generate_client
+from prowler.providers.gcp.gcp_provider import (
+    generate_client,
+    get_request_batches,
+    threading_call,
+)
 from prowler.providers.gcp.services.cloudresourcemanager.cloudresourcemanager_client import (
     cloudresourcemanager_client,
 )
@@ -17,48 +21,56 @@ class IAM:
         self.project_ids = audit_info.project_ids
         self.region = "global"
         self.client = generate_client(self.service, self.api_version, audit_info)
-        self.service_accounts = []
-        self.__get_service_accounts__()
-        self.__get_service_accounts_keys__()
+        self.service_accounts = self.__threading_call__(
+            self.__get_service_accounts__, self.project_ids
+        )
+        self.__threading_call__(
+            self.__get_service_accounts_keys__,
+            get_request_batches(self.client, self.service_accounts),
+        )
 
     def __get_client__(self):
         return self.client
 
-    def __get_service_accounts__(self):
-        for project_id in self.project_ids:
-            try:
+    def __threading_call__(self, call, items):
+        return threading_call(call, items)
+
+    def __get_service_accounts__(self, project_id):
+        service_accounts = []
+        try:
+            request = (
+                self.client.projects()
+                .serviceAccounts()
+                .list(name="projects/" + project_id)
+            )
+            while request is not None:
+                response = request.execute()
+
+                for account in response["accounts"]:
+                    service_accounts.append(
+                        ServiceAccount(
+                            name=account["name"],
+                            email=account["email"],
+                            display_name=account.get("displayName", ""),
+                            project_id=project_id,
+                        )
+                    )
+
                 request = (
                     self.client.projects()
                     .serviceAccounts()
-                    .list(name="projects/" + project_id)
-                )
-                while request is not None:
-                    response = request.execute()
-
-                    for account in response["accounts"]:
-                        self.service_accounts.append(
-                            ServiceAccount(
-                                name=account["name"],
-                                email=account["email"],
-                                display_name=account.get("displayName", ""),
-                                project_id=project_id,
-                            )
-                        )
-
-                    request = (
-                        self.client.projects()
-                        .serviceAccounts()
-                        .list_next(previous_request=request, previous_response=response)
-                    )
-            except Exception as error:
-                logger.error(
-                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    .list_next(previous_request=request, previous_response=response)
                 )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return service_accounts
 
-    def __get_service_accounts_keys__(self):
+    def __get_service_accounts_keys__(self, service_accounts):
         try:
-            for sa in self.service_accounts:
-                request = (
+            responses = self.client.execute_requests(
+                [
                     self.client.projects()
                     .serviceAccounts()
                     .keys()
@@ -68,22 +80,30 @@ class IAM:
                         + "/serviceAccounts/"
                         + sa.email
                     )
-                )
-                response = request.execute()
-
-                for key in response["keys"]:
-                    sa.keys.append(
-                        Key(
-                            name=key["name"].split("/")[-1],
-                            origin=key["keyOrigin"],
-                            type=key["keyType"],
-                            valid_after=datetime.strptime(
-                                key["validAfterTime"], "%Y-%m-%dT%H:%M:%SZ"
-                            ),
-                            valid_before=datetime.strptime(
-                                key["validBeforeTime"], "%Y-%m-%dT%H:%M:%SZ"
-                            ),
+                    for sa in service_accounts
+                ]
+            )
+            for sa, response in zip(service_accounts, responses):
+                try:
+                    if isinstance(response, Exception):
+                        raise response
+                    for key in response["keys"]:
+                        sa.keys.append(
+                            Key(
+                                name=key["name"].split("/")[-1],
+                                origin=key["keyOrigin"],
+                                type=key["keyType"],
+                                valid_after=datetime.strptime(
+                                    key["validAfterTime"], "%Y-%m-%dT%H:%M:%SZ"
+                                ),
+                                valid_before=datetime.strptime(
+                                    key["validBeforeTime"], "%Y-%m-%dT%H:%M:%SZ"
+                                ),
+                            )
                         )
+                except Exception as error:
+                    logger.error(
+                        f"{self.region} -- {sa.email} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                     )
 
         except Exception as error:
@@ -117,29 +137,47 @@ class AccessApproval:
         self.region = "global"
         self.client = generate_client(self.service, self.api_version, audit_info)
         self.settings = {}
-        self.__get_settings__()
+        for setting in self.__threading_call__(
+            self.__get_settings__, get_request_batches(self.client, self.project_ids)
+        ):
+            self.settings.setdefault(setting.project_id, []).append(setting)
 
     def __get_client__(self):
         return self.client
 
-    def __get_settings__(self):
-        for project_id in self.project_ids:
-            try:
-                response = (
+    def __threading_call__(self, call, items):
+        return threading_call(call, items)
+
+    def __get_settings__(self, project_ids):
+        settings = []
+        try:
+            responses = self.client.execute_requests(
+                [
                     self.client.projects().getAccessApprovalSettings(
                         name=f"projects/{project_id}/accessApprovalSettings"
                     )
-                ).execute()
-                self.settings[project_id].append(
-                    Setting(
-                        name=response["name"],
-                        project_id=project_id,
+                    for project_id in project_ids
+                ]
+            )
+            for project_id, response in zip(project_ids, responses):
+                try:
+                    if isinstance(response, Exception):
+                        raise response
+                    settings.append(
+                        Setting(
+                            name=response["name"],
+                            project_id=project_id,
+                        )
                     )
-                )
-            except Exception as error:
-                logger.error(
-                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+                except Exception as error:
+                    logger.error(
+                        f"{self.region} -- {project_id} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return settings
 
 
 class Setting(BaseModel):
@@ -154,35 +192,40 @@ class EssentialContacts:
         self.api_version = "v1"
         self.region = "global"
         self.client = generate_client(self.service, self.api_version, audit_info)
-        self.organizations = []
-        self.__get_contacts__()
+        self.organizations = self.__threading_call__(
+            self.__get_contacts__, cloudresourcemanager_client.organizations
+        )
 
     def __get_client__(self):
         return self.client
 
-    def __get_contacts__(self):
-        for org in cloudresourcemanager_client.organizations:
-            try:
-                contacts = False
-                response = (
-                    self.client.organizations()
-                    .contacts()
-                    .list(parent="organizations/" + org.id)
-                ).execute()
-                if len(response["contacts"]) > 0:
-                    contacts = True
-
-                self.organizations.append(
-                    Organization(
-                        name=org.name,
-                        email=org.id,
-                        contacts=contacts,
-                    )
-                )
-            except Exception as error:
-                logger.error(
-                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+    def __threading_call__(self, call, items):
+        return threading_call(call, items)
+
+    def __get_contacts__(self, org):
+        organizations = []
+        try:
+            contacts = False
+            response = (
+                self.client.organizations()
+                .contacts()
+                .list(parent="organizations/" + org.id)
+            ).execute()
+            if len(response["contacts"]) > 0:
+                contacts = True
+
+            organizations.append(
+                Organization(
+                    name=org.name,
+                    email=org.id,
+                    contacts=contacts,
                 )
+            )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return organizations
 
 
 class Organization(BaseModel):
@@ -3,7 +3,11 @@ from typing import Optional
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
-from prowler.providers.gcp.gcp_provider import generate_client
+from prowler.providers.gcp.gcp_provider import (
+    generate_client,
+    get_request_batches,
+    threading_call,
+)
 
 
 ################## KMS
@@ -14,128 +18,141 @@ class KMS:
         self.project_ids = audit_info.project_ids
         self.region = "global"
         self.client = generate_client(self.service, self.api_version, audit_info)
-        self.locations = []
-        self.key_rings = []
-        self.crypto_keys = []
-        self.__get_locations__()
-        self.__get_key_rings__()
-        self.__get_crypto_keys__()
-        self.__get_crypto_keys_iam_policy__()
+        self.locations = self.__threading_call__(
+            self.__get_locations__, self.project_ids
+        )
+        self.key_rings = self.__threading_call__(self.__get_key_rings__, self.locations)
+        self.crypto_keys = self.__threading_call__(
+            self.__get_crypto_keys__, self.key_rings
+        )
+        self.__threading_call__(
+            self.__get_crypto_keys_iam_policy__,
+            get_request_batches(self.client, self.crypto_keys),
+        )
 
     def __get_client__(self):
         return self.client
 
-    def __get_locations__(self):
-        for project_id in self.project_ids:
-            try:
+    def __threading_call__(self, call, items):
+        return threading_call(call, items)
+
+    def __get_locations__(self, project_id):
+        locations = []
+        try:
+            request = (
+                self.client.projects().locations().list(name="projects/" + project_id)
+            )
+            while request is not None:
+                response = request.execute()
+
+                for location in response["locations"]:
+                    locations.append(
+                        KeyLocation(name=location["name"], project_id=project_id)
+                    )
+
                 request = (
                     self.client.projects()
                     .locations()
-                    .list(name="projects/" + project_id)
+                    .list_next(previous_request=request, previous_response=response)
                 )
-                while request is not None:
-                    response = request.execute()
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return locations
+
+    def __get_key_rings__(self, location):
+        key_rings = []
+        try:
+            request = (
+                self.client.projects().locations().keyRings().list(parent=location.name)
+            )
+            while request is not None:
+                response = request.execute()
 
-                    for location in response["locations"]:
-                        self.locations.append(
-                            KeyLocation(name=location["name"], project_id=project_id)
+                for ring in response.get("keyRings", []):
+                    key_rings.append(
+                        KeyRing(
+                            name=ring["name"],
+                            project_id=location.project_id,
                         )
-
-                    request = (
-                        self.client.projects()
-                        .locations()
-                        .list_next(previous_request=request, previous_response=response)
                     )
-            except Exception as error:
-                logger.error(
-                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
 
-    def __get_key_rings__(self):
-        for location in self.locations:
-            try:
                 request = (
                     self.client.projects()
                     .locations()
                     .keyRings()
-                    .list(parent=location.name)
+                    .list_next(previous_request=request, previous_response=response)
                 )
-                while request is not None:
-                    response = request.execute()
-
-                    for ring in response.get("keyRings", []):
-                        self.key_rings.append(
-                            KeyRing(
-                                name=ring["name"],
-                                project_id=location.project_id,
-                            )
-                        )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return key_rings
+
+    def __get_crypto_keys__(self, ring):
+        crypto_keys = []
+        try:
+            request = (
+                self.client.projects()
+                .locations()
+                .keyRings()
+                .cryptoKeys()
+                .list(parent=ring.name)
+            )
+            while request is not None:
+                response = request.execute()
 
-                    request = (
-                        self.client.projects()
-                        .locations()
-                        .keyRings()
-                        .list_next(previous_request=request, previous_response=response)
+                for key in response.get("cryptoKeys", []):
+                    crypto_keys.append(
+                        CriptoKey(
+                            name=key["name"].split("/")[-1],
+                            location=key["name"].split("/")[3],
+                            rotation_period=key.get("rotationPeriod"),
+                            key_ring=ring.name,
+                            project_id=ring.project_id,
+                        )
                     )
-            except Exception as error:
-                logger.error(
-                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
 
-    def __get_crypto_keys__(self):
-        for ring in self.key_rings:
-            try:
                 request = (
                     self.client.projects()
                     .locations()
                     .keyRings()
                     .cryptoKeys()
-                    .list(parent=ring.name)
+                    .list_next(previous_request=request, previous_response=response)
                 )
-                while request is not None:
-                    response = request.execute()
-
-                    for key in response.get("cryptoKeys", []):
-                        self.crypto_keys.append(
-                            CriptoKey(
-                                name=key["name"].split("/")[-1],
-                                location=key["name"].split("/")[3],
-                                rotation_period=key.get("rotationPeriod"),
-                                key_ring=ring.name,
-                                project_id=ring.project_id,
-                            )
-                        )
-
-                    request = (
-                        self.client.projects()
-                        .locations()
-                        .keyRings()
-                        .cryptoKeys()
-                        .list_next(previous_request=request, previous_response=response)
-                    )
-            except Exception as error:
-                logger.error(
-                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
-
-    def __get_crypto_keys_iam_policy__(self):
-        for key in self.crypto_keys:
-            try:
-                request = (
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return crypto_keys
+
+    def __get_crypto_keys_iam_policy__(self, keys):
+        try:
+            responses = self.client.execute_requests(
+                [
                     self.client.projects()
                     .locations()
                     .keyRings()
                     .cryptoKeys()
                     .getIamPolicy(resource=key.key_ring + "/cryptoKeys/" + key.name)
-                )
-                response = request.execute()
-
-                for binding in response.get("bindings", []):
-                    key.members.extend(binding.get("members", []))
-            except Exception as error:
-                logger.error(
-                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+                    for key in keys
+                ]
+            )
+            for key, response in zip(keys, responses):
+                try:
+                    if isinstance(response, Exception):
+                        raise response
+                    for binding in response.get("bindings", []):
+                        key.members.extend(binding.get("members", []))
+                except Exception as error:
+                    logger.error(
+                        f"{self.region} -- {key.name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
 
 class KeyLocation(BaseModel):
@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
-from prowler.providers.gcp.gcp_provider import generate_client
+from prowler.providers.gcp.gcp_provider import generate_client, threading_call
 
 
 ################## Logging
@@ -13,66 +13,67 @@ class Logging:
         self.project_ids = audit_info.project_ids
         self.default_project_id = audit_info.default_project_id
         self.client = generate_client(self.service, self.api_version, audit_info)
-        self.sinks = []
-        self.metrics = []
-        self.__get_sinks__()
-        self.__get_metrics__()
+        self.sinks = self.__threading_call__(self.__get_sinks__, self.project_ids)
+        self.metrics = self.__threading_call__(self.__get_metrics__, self.project_ids)
 
-    def __get_sinks__(self):
-        for project_id in self.project_ids:
-            try:
-                request = self.client.sinks().list(parent=f"projects/{project_id}")
-                while request is not None:
-                    response = request.execute()
+    def __threading_call__(self, call, items):
+        return threading_call(call, items)
 
-                    for sink in response.get("sinks", []):
-                        self.sinks.append(
-                            Sink(
-                                name=sink["name"],
-                                destination=sink["destination"],
-                                filter=sink.get("filter", "all"),
-                                project_id=project_id,
-                            )
-                        )
+    def __get_sinks__(self, project_id):
+        sinks = []
+        try:
+            request = self.client.sinks().list(parent=f"projects/{project_id}")
+            while request is not None:
+                response = request.execute()
 
-                    request = self.client.sinks().list_next(
-                        previous_request=request, previous_response=response
+                for sink in response.get("sinks", []):
+                    sinks.append(
+                        Sink(
+                            name=sink["name"],
+                            destination=sink["destination"],
+                            filter=sink.get("filter", "all"),
+                            project_id=project_id,
+                        )
                     )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
 
-    def __get_metrics__(self):
-        for project_id in self.project_ids:
-            try:
-                request = (
-                    self.client.projects()
-                    .metrics()
-                    .list(parent=f"projects/{project_id}")
+                request = self.client.sinks().list_next(
+                    previous_request=request, previous_response=response
                 )
-                while request is not None:
-                    response = request.execute()
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return sinks
 
-                    for metric in response.get("metrics", []):
-                        self.metrics.append(
-                            Metric(
-                                name=metric["name"],
-                                type=metric["metricDescriptor"]["type"],
-                                filter=metric["filter"],
-                                project_id=project_id,
-                            )
-                        )
+    def __get_metrics__(self, project_id):
+        metrics = []
+        try:
+            request = (
+                self.client.projects().metrics().list(parent=f"projects/{project_id}")
+            )
+            while request is not None:
+                response = request.execute()
 
-                    request = (
-                        self.client.projects()
-                        .metrics()
-                        .list_next(previous_request=request, previous_response=response)
+                for metric in response.get("metrics", []):
+                    metrics.append(
+                        Metric(
+                            name=metric["name"],
+                            type=metric["metricDescriptor"]["type"],
+                            filter=metric["filter"],
+                            project_id=project_id,
+                        )
                     )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+
+                request = (
+                    self.client.projects()
+                    .metrics()
+                    .list_next(previous_request=request, previous_response=response)
                 )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return metrics
 
 
 class Sink(BaseModel):
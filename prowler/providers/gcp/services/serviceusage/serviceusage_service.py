@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
-from prowler.providers.gcp.gcp_provider import generate_client
+from prowler.providers.gcp.gcp_provider import generate_client, threading_call
 
 
 ################## ServiceUsage
@@ -12,37 +12,43 @@ class ServiceUsage:
         self.region = "global"
         self.project_ids = audit_info.project_ids
         self.client = generate_client(self.service, self.api_version, audit_info)
-        self.active_services = {}
-        self.__get_active_services__()
+        self.active_services = {project_id: [] for project_id in self.project_ids}
+        for service in self.__threading_call__(
+            self.__get_active_services__, self.project_ids
+        ):
+            self.active_services[service.project_id].append(service)
 
     def __get_client__(self):
         return self.client
 
-    def __get_active_services__(self):
-        for project_id in self.project_ids:
-            self.active_services[project_id] = []
-            try:
-                request = self.client.services().list(
-                    parent="projects/" + project_id, filter="state:ENABLED"
-                )
-                while request is not None:
-                    response = request.execute()
-                    for service in response["services"]:
-                        self.active_services[project_id].append(
-                            Service(
-                                name=service["name"].split("/")[-1],
-                                title=service["config"]["title"],
-                                project_id=project_id,
-                            )
+    def __threading_call__(self, call, items):
+        return threading_call(call, items)
+
+    def __get_active_services__(self, project_id):
+        active_services = []
+        try:
+            request = self.client.services().list(
+                parent="projects/" + project_id, filter="state:ENABLED"
+            )
+            while request is not None:
+                response = request.execute()
+                for service in response["services"]:
+                    active_services.append(
+                        Service(
+                            name=service["name"].split("/")[-1],
+                            title=service["config"]["title"],
+                            project_id=project_id,
                         )
-
-                    request = self.client.services().list_next(
-                        previous_request=request, previous_response=response
                     )
-            except Exception as error:
-                logger.error(
-                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+
+                request = self.client.services().list_next(
+                    previous_request=request, previous_response=response
                 )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return active_services
 
 
 class Service(BaseModel):
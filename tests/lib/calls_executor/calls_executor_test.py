@@ -0,0 +1,47 @@
+import threading
+
+from prowler.lib.calls_executor.calls_executor import Calls_Executor
+
+
+class Test_Calls_Executor:
+    def test_run_calls(self):
+        executor = Calls_Executor(max_workers=4)
+
+        def call(item):
+            if item == "failed":
+                raise Exception("Forbidden")
+            return item.upper()
+
+        assert executor.run_calls(call, ["item-1", "failed", "item-2"]) == [
+            ("item-1", "ITEM-1"),
+            ("item-2", "ITEM-2"),
+        ]
+
+    def test_run_calls_nested_calls_inline(self):
+        # A single worker would wait forever on the nested calls if they were queued
+        worker_calls = []
+
+        class Limited_Calls_Executor(Calls_Executor):
+            def run_worker_call(self, call, item):
+                worker_calls.append(item)
+                return super().run_worker_call(call, item)
+
+        executor = Limited_Calls_Executor(max_workers=1)
+
+        def nested_call(item):
+            return threading.current_thread()
+
+        def call(item):
+            return [
+                thread is threading.current_thread()
+                for _, thread in executor.run_calls(
+                    nested_call, [f"{item}-a", f"{item}-b"]
+                )
+            ]
+
+        assert executor.run_calls(call, ["item-1", "item-2"]) == [
+            ("item-1", [True, True]),
+            ("item-2", [True, True]),
+        ]
+        # Only the calls made from outside the pool run in its workers
+        assert worker_calls == ["item-1", "item-2"]
@@ -1,23 +1,29 @@
 import os
 import pathlib
+import threading
 from importlib.machinery import FileFinder
 from pkgutil import ModuleInfo
 
+import pytest
 from boto3 import client, session
 from fixtures.bulk_checks_metadata import test_bulk_checks_metadata
-from mock import patch
+from mock import MagicMock, patch
 from moto import mock_s3
 
 from prowler.lib.check.check import (
     exclude_checks_to_run,
     exclude_services_to_run,
+    execute_checks,
     list_categories,
     list_modules,
     list_services,
     parse_checks_from_file,
     parse_checks_from_folder,
+    prefetch_service_clients,
+    recover_check_service_attributes,
     recover_checks_from_provider,
     recover_checks_from_service,
+    recover_service_clients_from_checks,
     remove_custom_checks_module,
     update_audit_metadata,
 )
@@ -119,6 +125,33 @@ def mock_recover_checks_from_aws_provider(*_):
     ]
 
 
+def mock_execute_service_checks(service, service_checks, *_):
+    # Return the check names as findings to verify the order
+    return {check_name: ([check_name], None) for check_name in service_checks}
+
+
+class mock_check:
+    """Check executed by the parallel execution workers"""
+
+    def __init__(self, check_name, findings):
+        self.CheckID = check_name
+        self.ServiceName = check_name.split("_")[0]
+        self.Severity = "low"
+        self.findings = findings
+
+    def execute(self):
+        return self.findings
+
+
+def mock_import_check(check_module_path):
+    # Format: "prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+    check_name = check_module_path.split(".")[-1]
+    # The ec2_ami_public check fails before its execution
+    if check_name == "ec2_ami_public":
+        return MagicMock(**{check_name: MagicMock(side_effect=Exception("Failed"))})
+    return MagicMock(**{check_name: lambda: mock_check(check_name, [check_name])})
+
+
 def mock_recover_checks_from_aws_provider_lambda_service(*_):
     return [
         (
@@ -525,3 +558,252 @@ class Test_Check:
         assert audit_metadata.services_scanned == 1
         assert audit_metadata.expected_checks == expected_checks
         assert audit_metadata.completed_checks == 1
+
+    @patch("prowler.lib.check.check.report")
+    @patch(
+        "prowler.lib.check.check.execute_service_checks",
+        new=mock_execute_service_checks,
+    )
+    def test_execute_checks_parallel(self, mock_report):
+        audit_info = self.set_mocked_audit_info()
+        audit_output_options = MagicMock(only_logs=True, findings_aggregator=None)
+        checks_to_execute = [
+            "accessanalyzer_enabled_without_findings",
+            "ec2_ami_public",
+            "ec2_ebs_public_snapshot",
+            "iam_support_role_created",
+            "s3_bucket_public_access",
+        ]
+
+        findings = execute_checks(
+            checks_to_execute,
+            "aws",
+            audit_info,
+            audit_output_options,
+            parallel_checks=3,
+        )
+
+        # Findings are returned and reported in the input checks order
+        assert findings == checks_to_execute
+        assert mock_report.call_count == len(checks_to_execute)
+        assert [call.args[0] for call in mock_report.call_args_list] == [
+            [check_name] for check_name in checks_to_execute
+        ]
+        assert audit_info.audit_metadata.services_scanned == 4
+        assert audit_info.audit_metadata.completed_checks == 5
+        assert audit_info.audit_metadata.audit_progress == 100
+
+    @patch("prowler.lib.check.check.report")
+    @patch(
+        "prowler.lib.check.check.execute_service_checks",
+        new=mock_execute_service_checks,
+    )
+    def test_execute_checks_parallel_streaming(self, mock_report):
+        audit_info = self.set_mocked_audit_info()
+        findings_aggregator = MagicMock()
+        audit_output_options = MagicMock(
+            only_logs=True, findings_aggregator=findings_aggregator
+        )
+        checks_to_execute = [
+            "accessanalyzer_enabled_without_findings",
+            "ec2_ami_public",
+        ]
+
+        findings = execute_checks(
+            checks_to_execute,
+            "aws",
+            audit_info,
+            audit_output_options,
+            parallel_checks=2,
+        )
+
+        # The findings go to the aggregator instead of being kept
+        assert findings == []
+        assert [
+            call.args[0] for call in findings_aggregator.add_findings.call_args_list
+        ] == [[check_name] for check_name in checks_to_execute]
+
+    def test_recover_service_clients_from_checks(self):
+        checks_to_execute = [
+            "cloudtrail_logs_s3_bucket_access_logging_enabled",
+            "s3_bucket_default_encryption",
+            "non_existing_check",
+        ]
+        assert recover_service_clients_from_checks(checks_to_execute, "aws") == [
+            "prowler.providers.aws.services.cloudtrail.cloudtrail_client",
+            "prowler.providers.aws.services.s3.s3_client",
+        ]
+
+    @patch("prowler.lib.check.check.report")
+    @patch("prowler.lib.check.check.import_check", new=mock_import_check)
+    def test_execute_checks_parallel_with_bar_and_failed_check(self, mock_report):
+        audit_info = self.set_mocked_audit_info()
+        audit_output_options = MagicMock(
+            only_logs=False, verbose=False, findings_aggregator=None
+        )
+        checks_to_execute = [
+            "accessanalyzer_enabled_without_findings",
+            "ec2_ami_public",
+            "ec2_ebs_public_snapshot",
+            "s3_bucket_public_access",
+        ]
+
+        with patch("prowler.lib.check.check.alive_bar") as mock_alive_bar:
+            findings = execute_checks(
+                checks_to_execute,
+                "aws",
+                audit_info,
+                audit_output_options,
+                parallel_checks=2,
+            )
+            bar = mock_alive_bar.return_value.__enter__.return_value
+
+        # The failed check has no findings and the rest are kept in order
+        assert findings == [
+            "accessanalyzer_enabled_without_findings",
+            "ec2_ebs_public_snapshot",
+            "s3_bucket_public_access",
+        ]
+        assert bar.call_count == 3
+        assert audit_info.audit_metadata.completed_checks == 3
+        assert audit_info.audit_metadata.audit_progress == 75
+
+    @patch("prowler.lib.check.check.import_check", new=mock_import_check)
+    def test_execute_checks_parallel_failed_report(self):
+        audit_info = self.set_mocked_audit_info()
+        audit_output_options = MagicMock(
+            only_logs=True, verbose=False, findings_aggregator=None
+        )
+        checks_to_execute = [
+            "accessanalyzer_enabled_without_findings",
+            "s3_bucket_public_access",
+        ]
+
+        # A failed report is logged and the execution continues
+        with patch(
+            "prowler.lib.check.check.report",
+            side_effect=[Exception("Report failed"), None],
+        ) as mock_report, patch("prowler.lib.check.check.logger") as mock_logger:
+            findings = execute_checks(
+                checks_to_execute,
+                "aws",
+                audit_info,
+                audit_output_options,
+                parallel_checks=2,
+            )
+
+        assert mock_report.call_count == 2
+        assert mock_logger.error.call_count == 1
+        assert findings == ["s3_bucket_public_access"]
+
+    @patch("prowler.lib.check.check.execute_service_checks")
+    def test_execute_checks_parallel_check_not_found(self, mock_execute_service_checks):
+        audit_info = self.set_mocked_audit_info()
+        audit_output_options = MagicMock(only_logs=True, findings_aggregator=None)
+        checks_to_execute = [
+            "accessanalyzer_enabled_without_findings",
+            "ec2_non_existing_check",
+        ]
+
+        with pytest.raises(SystemExit) as wrapped_exit:
+            execute_checks(
+                checks_to_execute,
+                "aws",
+                audit_info,
+                audit_output_options,
+                parallel_checks=2,
+            )
+
+        assert wrapped_exit.value.code == 1
+        # No check is executed if any of them does not exist
+        mock_execute_service_checks.assert_not_called()
+
+    def test_recover_service_clients_from_checks_through_lib_modules(self):
+        # The check imports the ec2_client and the ec2 lib module, which is also parsed
+        checks_to_execute = ["ec2_securitygroup_default_restrict_traffic"]
+        service_clients = recover_service_clients_from_checks(checks_to_execute, "aws")
+        assert service_clients == [
+            "prowler.providers.aws.services.ec2.ec2_client",
+        ]
+
+    def test_recover_check_service_attributes(self):
+        recover_check_service_attributes.cache_clear()
+        # The attributes declared in the check's metadata for every service client it imports
+        assert recover_check_service_attributes(
+            "cloudtrail_logs_s3_bucket_access_logging_enabled", "aws"
+        ) == {"cloudtrail": None, "s3": ["logging"]}
+        assert recover_check_service_attributes("ec2_ami_public", "aws") == {"ec2": []}
+        assert recover_check_service_attributes("non_existing_check", "aws") == {}
+
+    def test_recover_check_service_attributes_not_declared(self):
+        recover_check_service_attributes.cache_clear()
+        with patch(
+            "prowler.lib.check.check.Check_Metadata_Model.parse_file",
+            return_value=MagicMock(ServiceAttributes=None),
+        ):
+            assert recover_check_service_attributes("ec2_ami_public", "aws") == {
+                "ec2": None
+            }
+        recover_check_service_attributes.cache_clear()
+
+    def test_prefetch_service_clients(self):
+        service_clients = [
+            "prowler.providers.aws.services.ec2.ec2_client",
+            "prowler.providers.aws.services.s3.s3_client",
+            "prowler.providers.aws.services.iam.iam_client",
+        ]
+        imported_clients = []
+
+        def mock_import_client(client_module_path):
+            imported_clients.append(
+                (client_module_path, threading.current_thread().name)
+            )
+            if client_module_path.endswith("iam_client"):
+                raise Exception("Failed to build the service client")
+
+        with patch(
+            "prowler.lib.check.check.recover_service_clients_from_checks",
+            return_value=service_clients,
+        ), patch(
+            "prowler.lib.check.check.import_check", side_effect=mock_import_client
+        ), patch(
+            "prowler.lib.check.check.logger"
+        ) as mock_logger:
+            prefetch_service_clients(["ec2_ami_public"], "aws", 2)
+
+        # Every service client is imported once in the workers pool
+        assert sorted(client for client, _ in imported_clients) == sorted(
+            service_clients
+        )
+        assert all(
+            thread_name.startswith("prowler-prefetch")
+            for _, thread_name in imported_clients
+        )
+        # The error building the service client is logged
+        assert mock_logger.error.call_count == 1
+        assert "iam_client" in mock_logger.error.call_args[0][0]
+
+    def test_execute_checks_prefetch_before_execution(self):
+        audit_info = self.set_mocked_audit_info()
+        audit_output_options = MagicMock(only_logs=True, findings_aggregator=None)
+        events = []
+
+        with patch(
+            "prowler.lib.check.check.prefetch_service_clients",
+            side_effect=lambda *_: events.append("prefetch"),
+        ) as mock_prefetch, patch(
+            "prowler.lib.check.check.execute",
+            side_effect=lambda *_: events.append("execute") or [],
+        ):
+            execute_checks(
+                ["ec2_ami_public", "s3_bucket_public_access"],
+                "aws",
+                audit_info,
+                audit_output_options,
+                prefetch_workers=4,
+            )
+
+        mock_prefetch.assert_called_once_with(
+            ["ec2_ami_public", "s3_bucket_public_access"], "aws", 4
+        )
+        assert events == ["prefetch", "execute", "execute"]
@@ -0,0 +1,78 @@
+from os import path
+
+import pytest
+from mock import patch
+from pydantic import ValidationError
+
+from prowler.lib.check.models import (
+    Check,
+    Check_Metadata_Model,
+    Check_Report_AWS,
+    Check_Report_Azure,
+    Check_Report_GCP,
+    Check_Report_Metadata,
+    load_check_metadata,
+)
+
+check_metadata = load_check_metadata(
+    f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
+)
+
+
+class iam_disable_30_days_credentials(Check):
+    def execute(self):
+        return []
+
+
+def mock_check() -> Check:
+    # The check's metadata file is loaded from the fixtures
+    with patch(
+        "prowler.lib.check.models.Check_Metadata_Model.parse_file",
+        return_value=check_metadata,
+    ):
+        return iam_disable_30_days_credentials()
+
+
+class Test_Check_Models:
+    def test_check_metadata_same_instance(self):
+        check = mock_check()
+        metadata = check.metadata()
+
+        assert isinstance(metadata, Check_Report_Metadata)
+        assert metadata is check.metadata()
+        assert metadata.CheckID == "iam_disable_30_days_credentials"
+        assert metadata.Severity == check.Severity
+
+    def test_check_metadata_cannot_be_reassigned(self):
+        metadata = mock_check().metadata()
+
+        with pytest.raises(TypeError):
+            metadata.Severity = "critical"
+
+    def test_check_reports_reuse_check_metadata(self):
+        check = mock_check()
+
+        with patch.object(Check_Metadata_Model, "parse_raw") as mock_parse_raw:
+            reports = [
+                Check_Report_AWS(check.metadata()),
+                Check_Report_Azure(check.metadata()),
+                Check_Report_GCP(check.metadata()),
+            ]
+
+        mock_parse_raw.assert_not_called()
+        for report in reports:
+            assert report.check_metadata is check.metadata()
+            assert report.status == ""
+            assert report.resource_tags == []
+
+    def test_check_report_from_json(self):
+        report = Check_Report_AWS(check_metadata.json())
+
+        assert isinstance(report.check_metadata, Check_Metadata_Model)
+        assert report.check_metadata == check_metadata
+        assert report.resource_id == ""
+        assert report.region == ""
+
+    def test_check_report_from_invalid_json(self):
+        with pytest.raises(ValidationError):
+            Check_Report_GCP('{"CheckID": "invalid"}')
@@ -1,8 +1,9 @@
 import uuid
+from argparse import ArgumentTypeError
 
 import pytest
 
-from prowler.lib.cli.parser import ProwlerArgumentParser
+from prowler.lib.cli.parser import ProwlerArgumentParser, int_type
 
 prowler_command = "prowler"
 
@@ -916,6 +917,65 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.aws_retries_max_attempts == int(max_retries)
 
+    def test_execution_parser_parallel_checks_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert parsed.parallel_checks == 1
+
+    def test_execution_parser_parallel_checks(self):
+        argument = "--parallel-checks"
+        workers = "8"
+        command = [prowler_command, argument, workers]
+        parsed = self.parser.parse(command)
+        assert parsed.parallel_checks == int(workers)
+
+    def test_execution_parser_parallel_checks_no_value(self):
+        command = [prowler_command, "--parallel-checks"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_execution_parser_parallel_checks_zero(self):
+        command = [prowler_command, "--parallel-checks", "0"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_execution_parser_parallel_checks_azure(self):
+        command = [prowler_command, "azure", "--parallel-checks", "8"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_execution_parser_prefetch_workers_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert parsed.prefetch_workers == 0
+
+    def test_execution_parser_prefetch_workers(self):
+        argument = "--prefetch-workers"
+        workers = "16"
+        command = [prowler_command, argument, workers]
+        parsed = self.parser.parse(command)
+        assert parsed.prefetch_workers == int(workers)
+
+    def test_execution_parser_prefetch_workers_negative(self):
+        command = [prowler_command, "--prefetch-workers", "-3"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_execution_parser_prefetch_workers_gcp(self):
+        command = [prowler_command, "gcp", "--prefetch-workers", "4"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
     def test_parser_azure_auth_sp(self):
         argument = "--sp-env-auth"
         command = [prowler_command, "azure", argument]
@@ -997,3 +1057,11 @@ class Test_Parser:
         assert len(parsed.project_ids) == 2
         assert parsed.project_ids[0] == project_1
         assert parsed.project_ids[1] == project_2
+
+    def test_int_type(self):
+        assert int_type(minimum=0)("0") == 0
+        assert int_type(minimum=1)("8") == 8
+        with pytest.raises(ArgumentTypeError):
+            int_type(minimum=1)("0")
+        with pytest.raises(ArgumentTypeError):
+            int_type(minimum=0)("eight")
@@ -25,7 +25,11 @@ from prowler.lib.check.compliance_models import (
     Compliance_Requirement,
 )
 from prowler.lib.check.models import Check_Report, load_check_metadata
-from prowler.lib.outputs.file_descriptors import fill_file_descriptors
+from prowler.lib.outputs.file_descriptors import Output_Session, fill_file_descriptors
+from prowler.lib.outputs.findings_aggregator import (
+    Findings_Aggregator,
+    aggregate_findings,
+)
 from prowler.lib.outputs.json import (
     fill_json_asff,
     fill_json_ocsf,
@@ -63,6 +67,7 @@ from prowler.lib.outputs.models import (
 )
 from prowler.lib.outputs.outputs import (
     extract_findings_statistics,
+    report,
     send_to_s3_bucket,
     set_report_color,
 )
@@ -184,6 +189,54 @@ class Test_Outputs:
                 )
                 remove(expected[index][output_mode].name)
 
+    def test_output_session(self):
+        output_directory = f"{os.path.dirname(os.path.realpath(__file__))}"
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=None,
+            audited_account=AWS_ACCOUNT_ID,
+            audited_account_arn=f"arn:aws:iam::{AWS_ACCOUNT_ID}:root",
+            audited_identity_arn="test-arn",
+            audited_user_id="test",
+            audited_partition="aws",
+            profile="default",
+            profile_region="eu-west-1",
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=["eu-west-2", "eu-west-1"],
+            organizations_metadata=None,
+            audit_resources=None,
+            mfa_enabled=False,
+        )
+        output_modes = ["csv", "json"]
+        output_filename = f"prowler-output-session-{AWS_ACCOUNT_ID}"
+        output_session = Output_Session(
+            output_modes, output_directory, output_filename, audit_info
+        )
+        output_options = mock.MagicMock()
+        output_options.output_modes = output_modes
+        output_options.output_session = output_session
+        output_options.allowlist_file = None
+        output_options.verbose = False
+
+        file_descriptors = dict(output_session.file_descriptors)
+        with patch(
+            "prowler.lib.outputs.outputs.fill_file_descriptors"
+        ) as fill_file_descriptors_mock:
+            # The output files are kept open between the reports
+            report([], output_options, audit_info)
+            report([], output_options, audit_info)
+            fill_file_descriptors_mock.assert_not_called()
+        for file_descriptor in file_descriptors.values():
+            assert not file_descriptor.closed
+
+        output_session.close()
+        assert output_session.file_descriptors == {}
+        for file_descriptor in file_descriptors.values():
+            assert file_descriptor.closed
+            remove(file_descriptor.name)
+
     def test_set_report_color(self):
         test_status = ["PASS", "FAIL", "ERROR", "WARNING"]
         test_colors = [Fore.GREEN, Fore.RED, Fore.BLACK, orange_color]
@@ -1275,6 +1328,50 @@ class Test_Outputs:
         assert stats["resources_count"] == 0
         assert stats["findings_count"] == 0
 
+    def test_findings_aggregator(self):
+        findings = []
+        for service, status, severity, resource_id in [
+            ("ec2", "PASS", "high", "test_resource_1"),
+            ("ec2", "FAIL", "high", "test_resource_2"),
+            ("ec2", "FAIL", "low", "test_resource_2"),
+            ("s3", "INFO", "medium", "test_resource_3"),
+            ("ec2", "FAIL", "critical", "test_resource_1"),
+        ]:
+            finding = mock.MagicMock()
+            finding.status = status
+            finding.resource_id = resource_id
+            finding.check_metadata.CheckID = f"{service}_check"
+            finding.check_metadata.ServiceName = service
+            finding.check_metadata.Provider = "aws"
+            finding.check_metadata.Severity = severity
+            findings.append(finding)
+
+        findings_aggregator = Findings_Aggregator()
+        findings_aggregator.add_findings(findings[:2])
+        findings_aggregator.add_findings(findings[2:])
+
+        assert extract_findings_statistics(
+            findings_aggregator
+        ) == extract_findings_statistics(findings)
+        assert findings_aggregator.get_statistics() == {
+            "total_pass": 1,
+            "total_fail": 3,
+            "resources_count": 3,
+            "findings_count": 4,
+        }
+        assert findings_aggregator.total_findings == 5
+        # Consecutive findings of the same service share the summary row
+        assert [
+            (service["Service"], service["Total"], service["Critical"])
+            for service in findings_aggregator.services
+        ] == [("ec2", 3, 0), ("s3", 1, 0), ("ec2", 1, 1)]
+        assert findings_aggregator.check_status_counts == {
+            ("ec2_check", "PASS"): 1,
+            ("ec2_check", "FAIL"): 3,
+            ("s3_check", "INFO"): 1,
+        }
+        assert aggregate_findings(findings_aggregator) is findings_aggregator
+
     @mock.patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
     def test_send_to_security_hub(self):
         # Create mock session
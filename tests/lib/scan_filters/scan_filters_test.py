@@ -1,4 +1,4 @@
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.scan_filters.scan_filters import Resource_Filter, is_resource_filtered
 
 
 class Test_Scan_Filters:
@@ -15,3 +15,26 @@ class Test_Scan_Filters:
         )
         assert is_resource_filtered("test_bucket", audit_resources)
         assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+
+    def test_resource_filter(self):
+        audit_resources = Resource_Filter(
+            [
+                "arn:aws:iam::123456789012:user/test_user",
+                "arn:aws:ec2:eu-west-1:123456789012:instance/i-1234567890abcdef0",
+            ]
+        )
+        assert is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test_user", audit_resources
+        )
+        assert is_resource_filtered("i-1234567890abcdef0", audit_resources)
+        assert is_resource_filtered("instance/i-1234567890abcdef0", audit_resources)
+        # Only the trailing parts of the ARNs match, not any substring of them
+        assert not is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test", audit_resources
+        )
+        assert not is_resource_filtered("test", audit_resources)
+        assert not is_resource_filtered("i-1234567890", audit_resources)
+        # The filter keeps the ARNs it was built from
+        assert len(audit_resources) == 2
+        assert list(audit_resources)[0] == "arn:aws:iam::123456789012:user/test_user"
+        assert not Resource_Filter(None)
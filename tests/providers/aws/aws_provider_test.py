@@ -1,21 +1,56 @@
+import threading
+import time
+
 import boto3
 import sure  # noqa
+from botocore.client import ClientError
 from mock import patch
 from moto import mock_iam, mock_sts
 
 from prowler.providers.aws.aws_provider import (
     AWS_Provider,
+    Checks_Attributes,
+    Regional_Calls_Executor,
+    Resource_Index,
+    Throttled_Calls_Executor,
     assume_role,
     generate_regional_clients,
+    get_audited_service_regions,
     get_available_aws_service_regions,
+    get_aws_regions_by_service,
     get_default_region,
     get_global_region,
 )
 from prowler.providers.aws.lib.audit_info.models import AWS_Assume_Role, AWS_Audit_Info
+from prowler.providers.common.models import Audit_Metadata
 
 ACCOUNT_ID = 123456789012
 
 
+def clear_aws_regions_cache():
+    get_aws_regions_by_service.cache_clear()
+    get_audited_service_regions.cache_clear()
+
+
+class mock_regional_client:
+    def __init__(self, region):
+        self.region = region
+
+
+class mock_resource:
+    def __init__(self, id, group):
+        self.id = id
+        self.group = group
+
+
+class mock_service:
+    resources_by_id = Resource_Index("resources", "id")
+    resources_by_group = Resource_Index("resources", "group", grouped=True)
+
+    def __init__(self, resources):
+        self.resources = resources
+
+
 class Test_AWS_Provider:
     @mock_iam
     @mock_sts
@@ -505,7 +540,9 @@ class Test_AWS_Provider:
                 }
             },
         ):
+            clear_aws_regions_cache()
             assert get_available_aws_service_regions("ec2", audit_info) == ["us-east-1"]
+        clear_aws_regions_cache()
 
     def test_get_available_aws_service_regions_with_all_regions_audited(self):
         audit_info = AWS_Audit_Info(
@@ -556,4 +593,214 @@ class Test_AWS_Provider:
                 }
             },
         ):
+            clear_aws_regions_cache()
             assert len(get_available_aws_service_regions("ec2", audit_info)) == 17
+        clear_aws_regions_cache()
+
+    def test_regional_calls_executor(self):
+        executor = Regional_Calls_Executor(max_workers=4, max_workers_per_region=4)
+        regional_clients = [
+            mock_regional_client(region) for region in ["eu-west-1", "us-east-1"]
+        ]
+        called_regions = []
+
+        def call(regional_client):
+            called_regions.append(regional_client.region)
+            if regional_client.region == "us-east-1":
+                raise Exception("error")
+
+        with patch("prowler.providers.aws.aws_provider.logger") as logger_mock:
+            executor.threading_call(call, regional_clients)
+        # All the calls run and the errors are logged
+        assert sorted(called_regions) == ["eu-west-1", "us-east-1"]
+        logger_mock.error.assert_called_once()
+
+    def test_regional_calls_executor_limit_per_region(self):
+        executor = Regional_Calls_Executor(
+            max_workers=8, max_workers_per_region=2, max_workers_per_api=8
+        )
+        regional_clients = [mock_regional_client("eu-west-1") for _ in range(6)]
+        running_calls = []
+        max_running_calls = []
+        lock = threading.Lock()
+
+        def call(regional_client):
+            with lock:
+                running_calls.append(regional_client)
+                max_running_calls.append(len(running_calls))
+            time.sleep(0.05)
+            with lock:
+                running_calls.remove(regional_client)
+
+        executor.threading_call(call, regional_clients)
+        assert len(max_running_calls) == 6
+        assert max(max_running_calls) == 2
+
+    def test_regional_calls_executor_nested_call(self):
+        executor = Regional_Calls_Executor(max_workers=1)
+        regional_clients = [mock_regional_client("eu-west-1")]
+        called = []
+
+        def nested_call(regional_client):
+            called.append("nested")
+
+        def call(regional_client):
+            # A call from a worker of a full pool must not wait on the pool
+            executor.threading_call(nested_call, regional_clients)
+            called.append("call")
+
+        executor.threading_call(call, regional_clients)
+        assert called == ["nested", "call"]
+
+    def test_throttled_calls_executor(self):
+        executor = Throttled_Calls_Executor(max_workers=4, base_delay=0)
+        throttled_calls = []
+        called_resources = []
+        lock = threading.Lock()
+
+        def call(resource):
+            with lock:
+                # The first call of every resource is throttled
+                if resource not in throttled_calls:
+                    throttled_calls.append(resource)
+                    raise ClientError(
+                        {"Error": {"Code": "Throttling", "Message": "Rate exceeded"}},
+                        "ListRoleTags",
+                    )
+                called_resources.append(resource)
+
+        executor.threading_call(call, range(8))
+        # The throttled calls are retried and the concurrency recovers after them
+        assert sorted(called_resources) == list(range(8))
+        assert executor.running_calls == 0
+        assert 1 <= executor.concurrency_limit <= 4
+
+    def test_throttled_calls_executor_errors(self):
+        executor = Throttled_Calls_Executor(max_workers=2, max_attempts=2, base_delay=0)
+        calls = []
+
+        def call(resource):
+            calls.append(resource)
+            if resource == "throttled":
+                raise ClientError(
+                    {"Error": {"Code": "Throttling", "Message": "Rate exceeded"}},
+                    "ListRoleTags",
+                )
+            raise Exception("error")
+
+        with patch("prowler.providers.aws.aws_provider.logger") as logger_mock:
+            executor.threading_call(call, ["throttled", "error"])
+        # Only the throttled calls are retried, until the maximum attempts
+        assert sorted(calls) == ["error", "throttled", "throttled"]
+        assert logger_mock.error.call_count == 2
+        assert executor.concurrency_limit == 1
+
+    def test_get_aws_regions_by_service_loaded_once(self):
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=None,
+            audited_account=None,
+            audited_account_arn=None,
+            audited_partition="aws",
+            audited_identity_arn=None,
+            audited_user_id=None,
+            profile=None,
+            profile_region=None,
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=["eu-west-1", "us-east-1"],
+            organizations_metadata=None,
+            audit_resources=None,
+            mfa_enabled=False,
+        )
+        clear_aws_regions_cache()
+        with patch(
+            "prowler.providers.aws.aws_provider.parse_json_file",
+            return_value={
+                "services": {
+                    "ec2": {"regions": {"aws": ["eu-west-1", "us-east-1"]}},
+                    "s3": {"regions": {"aws": ["eu-west-1"]}},
+                }
+            },
+        ) as parse_json_file_mock:
+            assert sorted(get_available_aws_service_regions("ec2", audit_info)) == [
+                "eu-west-1",
+                "us-east-1",
+            ]
+            assert get_available_aws_service_regions("s3", audit_info) == ["eu-west-1"]
+            assert get_default_region("s3", audit_info) == "eu-west-1"
+            parse_json_file_mock.assert_called_once()
+        clear_aws_regions_cache()
+
+    def test_resource_index(self):
+        first = mock_resource("sg-1", "vpc-1")
+        second = mock_resource("sg-2", "vpc-1")
+        service = mock_service([first, second])
+
+        assert service.resources_by_id == {"sg-1": first, "sg-2": second}
+        assert service.resources_by_group == {"vpc-1": [first, second]}
+        # The index is built once and reused
+        assert service.resources_by_id is service.resources_by_id
+
+        # and rebuilt if the collection changes
+        third = mock_resource("sg-3", None)
+        service.resources.append(third)
+        assert service.resources_by_id["sg-3"] is third
+        assert None not in service.resources_by_group
+
+    def test_checks_attributes(self):
+        checks_attributes = Checks_Attributes(
+            client="ec2", attributes=["user_data", "snapshots_public"]
+        )
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=None,
+            audited_account=ACCOUNT_ID,
+            audited_account_arn=f"arn:aws:iam::{ACCOUNT_ID}:root",
+            audited_identity_arn=None,
+            audited_user_id=None,
+            audited_partition="aws",
+            profile=None,
+            profile_region=None,
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=None,
+            organizations_metadata=None,
+            audit_resources=None,
+            mfa_enabled=False,
+        )
+
+        # All the attributes are gathered if the checks to execute are unknown
+        assert checks_attributes.get_audited_attributes(audit_info) == {
+            "user_data",
+            "snapshots_public",
+        }
+
+        audit_info.audit_metadata = Audit_Metadata(
+            services_scanned=0,
+            expected_checks=[
+                "ec2_ami_public",
+                "ec2_ebs_public_snapshot",
+                "s3_bucket_object_lock",
+            ],
+            completed_checks=0,
+            audit_progress=0,
+        )
+        assert checks_attributes.get_audited_attributes(audit_info) == {
+            "snapshots_public"
+        }
+
+        audit_info.audit_metadata.expected_checks = ["ec2_ami_public"]
+        assert checks_attributes.get_audited_attributes(audit_info) == set()
+
+        # All the attributes are gathered if any check importing the client does not declare them
+        with patch(
+            "prowler.providers.aws.aws_provider.recover_check_service_attributes",
+            return_value={"ec2": None},
+        ):
+            assert checks_attributes.get_audited_attributes(audit_info) == {
+                "user_data",
+                "snapshots_public",
+            }
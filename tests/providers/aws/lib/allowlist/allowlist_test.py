@@ -1,8 +1,10 @@
 import yaml
 from boto3 import resource, session
+from mock import MagicMock
 from moto import mock_dynamodb, mock_s3
 
 from prowler.providers.aws.lib.allowlist.allowlist import (
+    Allowlist_Matcher,
     is_allowlisted,
     is_allowlisted_in_check,
     is_allowlisted_in_region,
@@ -57,8 +59,11 @@ class Test_Allowlist:
         )
 
         with open("tests/providers/aws/lib/allowlist/fixtures/allowlist.yaml") as f:
-            assert yaml.safe_load(f)["Allowlist"] == parse_allowlist_file(
-                audit_info, "s3://test-allowlist/allowlist.yaml"
+            assert (
+                yaml.safe_load(f)["Allowlist"]
+                == parse_allowlist_file(
+                    audit_info, "s3://test-allowlist/allowlist.yaml"
+                ).allowlist
             )
 
     # Test DynamoDB allowlist
@@ -103,7 +108,9 @@ class Test_Allowlist:
                 + str(AWS_ACCOUNT_NUMBER)
                 + ":table/"
                 + table_name,
-            )["Accounts"]["*"]["Checks"]["iam_user_hardware_mfa_enabled"]["Resources"]
+            ).allowlist["Accounts"]["*"]["Checks"]["iam_user_hardware_mfa_enabled"][
+                "Resources"
+            ]
         )
 
     @mock_dynamodb
@@ -148,7 +155,7 @@ class Test_Allowlist:
                 + str(AWS_ACCOUNT_NUMBER)
                 + ":table/"
                 + table_name,
-            )["Accounts"]["*"]["Checks"]["*"]["Tags"]
+            ).allowlist["Accounts"]["*"]["Checks"]["*"]["Tags"]
         )
 
     # Allowlist checks
@@ -648,3 +655,127 @@ class Test_Allowlist:
             "test",
             "environment=pro",
         )
+
+    def test_allowlist_matcher_match(self):
+        # Allowlist example
+        allowlist = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "lambda_*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                        },
+                        "check_test": {
+                            "Regions": ["us-east-1", "eu-west-1"],
+                            "Resources": ["^test"],
+                            "Tags": ["environment=dev"],
+                        },
+                    }
+                }
+            }
+        }
+        allowlist_matcher = Allowlist_Matcher(allowlist, AWS_ACCOUNT_NUMBER)
+
+        finding = MagicMock()
+        finding.check_metadata.CheckID = "check_test"
+        finding.region = AWS_REGION
+        finding.resource_id = "test-prowler"
+        finding.resource_tags = [{"Key": "environment", "Value": "dev"}]
+        assert allowlist_matcher.match(finding)
+
+        finding.resource_tags = [{"Key": "environment", "Value": "prod"}]
+        assert not allowlist_matcher.match(finding)
+
+        finding.check_metadata.CheckID = "awslambda_function_url_public"
+        assert allowlist_matcher.match(finding)
+
+        # The matching allowlisted checks are indexed by check
+        assert [
+            allowlisted_check.name
+            for allowlisted_check in allowlist_matcher.checks_index[
+                ("*", "awslambda_function_url_public")
+            ]
+        ] == ["awslambda_*"]
+
+    def test_allowlist_matcher_same_as_is_allowlisted(self):
+        # Allowlist example
+        allowlist = {
+            "Accounts": {
+                AWS_ACCOUNT_NUMBER: {
+                    "Checks": {
+                        "s3_bucket_public_access": {
+                            "Regions": ["*"],
+                            "Resources": ["public"],
+                        },
+                        "ec2_*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                            "Exceptions": {
+                                "Regions": ["eu-west-1"],
+                                "Resources": ["^prod"],
+                            },
+                        },
+                        "s3_*": {
+                            "Regions": [AWS_REGION],
+                            "Resources": ["*"],
+                        },
+                        "iam_*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                            "Tags": ["project=.*"],
+                            "Exceptions": {"Tags": ["environment=prod"]},
+                        },
+                    }
+                },
+                "*": {
+                    "Checks": {
+                        "*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                        }
+                    }
+                },
+            }
+        }
+        allowlist_matcher = Allowlist_Matcher(allowlist, AWS_ACCOUNT_NUMBER)
+
+        for account in [AWS_ACCOUNT_NUMBER, "111122223333"]:
+            for check in [
+                "s3_bucket_public_access",
+                "s3_bucket_default_encryption",
+                "ec2_ami_public",
+                "iam_root_mfa_enabled",
+            ]:
+                for region in [AWS_REGION, "eu-west-1"]:
+                    for resource_id in ["public-bucket", "prod-instance", "test"]:
+                        for tags in [
+                            "",
+                            "project=prowler",
+                            "environment=prod | project=prowler",
+                        ]:
+                            assert allowlist_matcher.is_allowlisted(
+                                account, check, region, resource_id, tags
+                            ) == is_allowlisted(
+                                allowlist, account, check, region, resource_id, tags
+                            )
+
+    def test_allowlist_matcher_account_not_allowlisted(self):
+        # Allowlist example
+        allowlist = {
+            "Accounts": {
+                AWS_ACCOUNT_NUMBER: {
+                    "Checks": {
+                        "*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                        }
+                    }
+                }
+            }
+        }
+        allowlist_matcher = Allowlist_Matcher(allowlist, "111122223333")
+
+        assert not allowlist_matcher.is_allowlisted(
+            "111122223333", "check_test", AWS_REGION, "prowler", ""
+        )
@@ -0,0 +1,151 @@
+import csv
+import json
+from unittest import mock
+
+from boto3 import client, session
+from moto import mock_iam, mock_resourcegroupstaggingapi, mock_s3
+
+from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.lib.quick_inventory.quick_inventory import (
+    create_output,
+    get_buckets_per_region,
+    quick_inventory,
+)
+
+AWS_ACCOUNT_NUMBER = "123456789012"
+
+
+def set_mocked_audit_info(audited_regions):
+    return AWS_Audit_Info(
+        session_config=None,
+        original_session=None,
+        audit_session=session.Session(
+            profile_name=None,
+            botocore_session=None,
+        ),
+        audited_account=AWS_ACCOUNT_NUMBER,
+        audited_account_arn=f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:root",
+        audited_identity_arn=None,
+        audited_user_id=None,
+        audited_partition="aws",
+        profile=None,
+        profile_region="us-east-1",
+        credentials=None,
+        assumed_role_info=None,
+        audited_regions=audited_regions,
+        organizations_metadata=None,
+        audit_resources=None,
+        mfa_enabled=False,
+    )
+
+
+def set_mocked_args(output_directory):
+    return mock.MagicMock(
+        output_directory=str(output_directory),
+        output_bucket=None,
+        output_bucket_no_assume=None,
+    )
+
+
+def create_buckets():
+    """Create one bucket per location, tagging the one in eu-west-1"""
+    s3_client = client("s3", region_name="us-east-1")
+    s3_client.create_bucket(Bucket="bucket-us-east-1")
+    s3_client.create_bucket(
+        Bucket="bucket-eu-west-1",
+        CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
+    )
+    s3_client.put_bucket_tagging(
+        Bucket="bucket-eu-west-1",
+        Tagging={"TagSet": [{"Key": "env", "Value": "test"}]},
+    )
+    s3_client.create_bucket(
+        Bucket="bucket-ap-south-1",
+        CreateBucketConfiguration={"LocationConstraint": "ap-south-1"},
+    )
+
+
+class Test_Quick_Inventory:
+    @mock_s3
+    def test_get_buckets_per_region(self):
+        create_buckets()
+        audit_info = set_mocked_audit_info(["eu-west-1", "us-east-1"])
+
+        # The buckets are only placed in the audited regions
+        assert get_buckets_per_region(audit_info, ["eu-west-1", "us-east-1"]) == {
+            "eu-west-1": [
+                {
+                    "arn": "arn:aws:s3:eu-west-1::bucket-eu-west-1",
+                    "tags": [{"Key": "env", "Value": "test"}],
+                }
+            ],
+            "us-east-1": [
+                {"arn": "arn:aws:s3:us-east-1::bucket-us-east-1", "tags": []}
+            ],
+        }
+
+    @mock_s3
+    @mock_iam
+    @mock_resourcegroupstaggingapi
+    def test_quick_inventory(self, tmp_path):
+        create_buckets()
+        iam_client = client("iam")
+        user_arn = iam_client.create_user(UserName="test-user")["User"]["Arn"]
+        audit_info = set_mocked_audit_info(["us-east-1", "eu-west-1"])
+
+        quick_inventory(audit_info, set_mocked_args(tmp_path))
+
+        expected_resources = [
+            {
+                "AWS_AccountID": AWS_ACCOUNT_NUMBER,
+                "AWS_Region": "",
+                "AWS_Partition": "aws",
+                "AWS_Service": "iam",
+                "AWS_ResourceType": "user",
+                "AWS_ResourceID": "test-user",
+                "AWS_ResourceARN": user_arn,
+                "AWS_Tags": None,
+            },
+            {
+                "AWS_AccountID": AWS_ACCOUNT_NUMBER,
+                "AWS_Region": "eu-west-1",
+                "AWS_Partition": "aws",
+                "AWS_Service": "s3",
+                "AWS_ResourceType": "bucket",
+                "AWS_ResourceID": "bucket-eu-west-1",
+                "AWS_ResourceARN": "arn:aws:s3:eu-west-1::bucket-eu-west-1",
+                "AWS_Tags": [{"Key": "env", "Value": "test"}],
+            },
+            {
+                "AWS_AccountID": AWS_ACCOUNT_NUMBER,
+                "AWS_Region": "us-east-1",
+                "AWS_Partition": "aws",
+                "AWS_Service": "s3",
+                "AWS_ResourceType": "bucket",
+                "AWS_ResourceID": "bucket-us-east-1",
+                "AWS_ResourceARN": "arn:aws:s3:us-east-1::bucket-us-east-1",
+                "AWS_Tags": [],
+            },
+        ]
+        (json_file,) = tmp_path.glob("prowler-inventory-*.json")
+        # Same content than dumping the whole inventory at once
+        assert json_file.read_text() == json.dumps(expected_resources, indent=4)
+
+        (csv_file,) = tmp_path.glob("prowler-inventory-*.csv")
+        with open(csv_file, newline="") as csv_output:
+            rows = list(csv.reader(csv_output))
+        assert rows[0] == list(expected_resources[0].keys())
+        assert [row[6] for row in rows[1:]] == [
+            resource["AWS_ResourceARN"] for resource in expected_resources
+        ]
+
+    def test_create_output_empty_inventory(self, tmp_path):
+        audit_info = set_mocked_audit_info(["us-east-1"])
+
+        create_output([], audit_info, set_mocked_args(tmp_path))
+
+        (json_file,) = tmp_path.glob("prowler-inventory-*.json")
+        assert json_file.read_text() == "[]"
+        assert json.loads(json_file.read_text()) == []
+        (csv_file,) = tmp_path.glob("prowler-inventory-*.csv")
+        assert csv_file.read_text() == ""
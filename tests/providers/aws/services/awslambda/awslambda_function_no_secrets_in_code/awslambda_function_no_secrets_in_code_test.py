@@ -1,3 +1,4 @@
+import io
 import zipfile
 from unittest import mock
 
@@ -125,3 +126,139 @@ class Test_awslambda_function_no_secrets_in_code:
                 result[0].status_extended
                 == f"No secrets found in Lambda function {function_name} code"
             )
+
+    def test_function_code_skipped_files(self):
+        lambda_client = mock.MagicMock
+        function_name = "test-lambda"
+        function_runtime = "nodejs4.3"
+        function_arn = (
+            f"arn:aws:lambda:{AWS_REGION}:{DEFAULT_ACCOUNT_ID}:function/{function_name}"
+        )
+        code_with_secrets = """
+        def lambda_handler(event, context):
+                db_password = "test-password"
+                return event
+        """
+        code_zip = io.BytesIO()
+        with zipfile.ZipFile(code_zip, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.writestr("binary_file", b"\xff\xfe" + code_with_secrets.encode())
+            zip_file.writestr("big_file.py", code_with_secrets + "#" * 2 * 1024 * 1024)
+            zip_file.writestr("lib/lambda_function.py", code_with_secrets)
+        code_zip.seek(0)
+        lambda_client.functions = {
+            "function_name": Function(
+                name=function_name,
+                arn=function_arn,
+                region=AWS_REGION,
+                runtime=function_runtime,
+                code=LambdaCode(
+                    location="",
+                    size=len(code_zip.getvalue()),
+                    code_zip=zipfile.ZipFile(code_zip),
+                ),
+            )
+        }
+
+        with mock.patch(
+            "prowler.providers.aws.services.awslambda.awslambda_service.Lambda",
+            new=lambda_client,
+        ):
+            # Test Check
+            from prowler.providers.aws.services.awslambda.awslambda_function_no_secrets_in_code.awslambda_function_no_secrets_in_code import (
+                awslambda_function_no_secrets_in_code,
+            )
+
+            check = awslambda_function_no_secrets_in_code()
+            result = check.execute()
+
+            assert len(result) == 1
+            assert result[0].status == "PASS"
+            assert (
+                result[0].status_extended
+                == f"No secrets found in Lambda function {function_name} code"
+            )
+
+    def test_function_code_unreadable(self):
+        lambda_client = mock.MagicMock
+        function_name = "test-lambda"
+        function_arn = (
+            f"arn:aws:lambda:{AWS_REGION}:{DEFAULT_ACCOUNT_ID}:function/{function_name}"
+        )
+        lambda_client.functions = {
+            "function_name": Function(
+                name=function_name,
+                arn=function_arn,
+                region=AWS_REGION,
+                runtime="nodejs4.3",
+                code=LambdaCode(location="https://test", size=1024),
+            )
+        }
+
+        with mock.patch(
+            "prowler.providers.aws.services.awslambda.awslambda_service.Lambda",
+            new=lambda_client,
+        ):
+            # Test Check
+            from prowler.providers.aws.services.awslambda.awslambda_function_no_secrets_in_code import (
+                awslambda_function_no_secrets_in_code as check_module,
+            )
+
+            with mock.patch.object(
+                check_module, "awslambda_client", new=lambda_client()
+            ) as awslambda_client:
+                awslambda_client.get_function_code.return_value = None
+                check = check_module.awslambda_function_no_secrets_in_code()
+                result = check.execute()
+
+            # The function is not reported if its code package cannot be read
+            assert len(result) == 0
+
+    def test_function_code_scanned_in_one_batch(self):
+        lambda_client = mock.MagicMock
+        function_name = "test-lambda"
+        function_arn = (
+            f"arn:aws:lambda:{AWS_REGION}:{DEFAULT_ACCOUNT_ID}:function/{function_name}"
+        )
+        code_zip = io.BytesIO()
+        with zipfile.ZipFile(code_zip, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.writestr("lambda_function.py", 'db_password = "test-password"')
+            zip_file.writestr("utils.py", "print('custom log event')")
+        code_zip.seek(0)
+        lambda_client.functions = {
+            "function_name": Function(
+                name=function_name,
+                arn=function_arn,
+                region=AWS_REGION,
+                runtime="nodejs4.3",
+                code=LambdaCode(location="", code_zip=zipfile.ZipFile(code_zip)),
+            )
+        }
+
+        with mock.patch(
+            "prowler.providers.aws.services.awslambda.awslambda_service.Lambda",
+            new=lambda_client,
+        ):
+            # Test Check
+            from prowler.providers.aws.services.awslambda.awslambda_function_no_secrets_in_code import (
+                awslambda_function_no_secrets_in_code as check_module,
+            )
+
+            with mock.patch.object(
+                check_module,
+                "detect_secrets_scan_batch",
+                wraps=check_module.detect_secrets_scan_batch,
+            ) as detect_secrets_scan_batch:
+                check = check_module.awslambda_function_no_secrets_in_code()
+                result = check.execute()
+
+            detect_secrets_scan_batch.assert_called_once()
+            assert detect_secrets_scan_batch.call_args.args[1] == [
+                "lambda_function.py",
+                "utils.py",
+            ]
+            assert len(result) == 1
+            assert result[0].status == "FAIL"
+            assert (
+                result[0].status_extended
+                == f"Potential secret found in Lambda function {function_name} code -> lambda_function.py: Secret Keyword on line 1"
+            )
@@ -11,7 +11,12 @@ from moto import mock_iam, mock_lambda, mock_s3
 from moto.core import DEFAULT_ACCOUNT_ID
 
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
-from prowler.providers.aws.services.awslambda.awslambda_service import AuthType, Lambda
+from prowler.providers.aws.services.awslambda.awslambda_service import (
+    AuthType,
+    Function,
+    Lambda,
+    LambdaCode,
+)
 from prowler.providers.common.models import Audit_Metadata
 
 # Mock Test Region
@@ -38,12 +43,19 @@ def create_zip_file(code: str = "") -> io.BytesIO:
     return zip_output
 
 
-def mock_request_get(_):
-    """Mock requests.get() to get the Lambda Code in Zip Format"""
-    mock_resp = mock.MagicMock
-    mock_resp.status_code = 200
-    mock_resp.content = create_zip_file().read()
-    return mock_resp
+def mock_range_get(code_package: bytes, ranges: list = None):
+    """Mock requests.Session.get() to get the range requested of the Lambda Code in Zip Format"""
+
+    def session_get(self, url, headers):
+        start, end = map(int, headers["Range"][len("bytes=") :].split("-"))
+        if ranges is not None:
+            ranges.append((start, end))
+        mock_resp = mock.MagicMock()
+        mock_resp.status_code = 206
+        mock_resp.content = code_package[start : end + 1]
+        return mock_resp
+
+    return session_get
 
 
 # Mock generate_regional_clients()
@@ -217,8 +229,8 @@ class Test_Lambda_Service:
         lambda_arn_2 = resp_2["FunctionArn"]
 
         with mock.patch(
-            "prowler.providers.aws.services.awslambda.awslambda_service.requests.get",
-            new=mock_request_get,
+            "prowler.providers.aws.services.awslambda.awslambda_service.requests.Session.get",
+            new=mock_range_get(create_zip_file().read()),
         ):
             awslambda = Lambda(self.set_mocked_audit_info())
             assert awslambda.functions
@@ -256,9 +268,12 @@ class Test_Lambda_Service:
 
             assert awslambda.functions[lambda_arn_1].tags == [{"test": "test"}]
 
-            # Pending ZipFile tests
+            # The code package is downloaded when it is scanned
+            assert not awslambda.functions[lambda_arn_1].code.code_zip
+            assert awslambda.functions[lambda_arn_1].code.size
+            code_zip = awslambda.get_function_code(awslambda.functions[lambda_arn_1])
             with tempfile.TemporaryDirectory() as tmp_dir_name:
-                awslambda.functions[lambda_arn_1].code.code_zip.extractall(tmp_dir_name)
+                code_zip.extractall(tmp_dir_name)
                 files_in_zip = next(os.walk(tmp_dir_name))[2]
                 assert len(files_in_zip) == 1
                 assert files_in_zip[0] == "lambda_function.py"
@@ -293,3 +308,32 @@ class Test_Lambda_Service:
                 f"s3://awslambda-{AWS_REGION_NORTH_VIRGINIA}-tasks.s3-{AWS_REGION_NORTH_VIRGINIA}.amazonaws.com",
                 awslambda.functions[lambda_arn_2].code.location,
             )
+
+    @mock_lambda
+    def test_get_function_code_range_requests(self):
+        code_package = io.BytesIO()
+        with zipfile.ZipFile(code_package, "w", zipfile.ZIP_STORED) as zip_file:
+            zip_file.writestr("lib/dependency.so", os.urandom(4 * 1024 * 1024))
+            zip_file.writestr("lambda_function.py", "print('custom log event')")
+        code_package = code_package.getvalue()
+        ranges = []
+        function = Function(
+            name="test-lambda",
+            arn=f"arn:aws:lambda:{AWS_REGION}:{DEFAULT_ACCOUNT_ID}:function/test-lambda",
+            region=AWS_REGION,
+            runtime="python3.9",
+            code=LambdaCode(location="https://test", size=len(code_package)),
+        )
+
+        with mock.patch(
+            "prowler.providers.aws.services.awslambda.awslambda_service.requests.Session.get",
+            new=mock_range_get(code_package, ranges),
+        ):
+            awslambda = Lambda(self.set_mocked_audit_info())
+            code_zip = awslambda.get_function_code(function)
+            assert code_zip.namelist() == ["lib/dependency.so", "lambda_function.py"]
+            assert code_zip.read("lambda_function.py") == b"print('custom log event')"
+
+        # Only the end of the package is downloaded
+        assert ranges
+        assert sum(end - start + 1 for start, end in ranges) < len(code_package) / 2
@@ -6,6 +6,7 @@ from moto import mock_ec2
 
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.common.models import Audit_Metadata
+from tests.providers.aws.services.ec2.ec2_moto_helpers import mock_make_api_call
 
 AWS_REGION = "us-east-1"
 AWS_ACCOUNT_NUMBER = "123456789012"
@@ -21,6 +22,7 @@ def mock_generate_regional_clients(service, audit_info):
     "prowler.providers.aws.services.ec2.ec2_service.generate_regional_clients",
     new=mock_generate_regional_clients,
 )
+@patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
 class Test_ec2_ebs_public_snapshot:
     def set_mocked_audit_info(self):
         audit_info = AWS_Audit_Info(
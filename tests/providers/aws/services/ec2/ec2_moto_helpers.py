@@ -0,0 +1,26 @@
+import botocore
+
+# Original botocore _make_api_call function
+make_api_call = botocore.client.BaseClient._make_api_call
+
+
+def mock_make_api_call(self, operation_name, kwarg):
+    """Moto ignores RestorableByUserIds, keep only the snapshots restorable by everyone"""
+    response = make_api_call(self, operation_name, kwarg)
+    if operation_name == "DescribeSnapshots" and kwarg.get("RestorableByUserIds") == [
+        "all"
+    ]:
+        response["Snapshots"] = [
+            snapshot
+            for snapshot in response["Snapshots"]
+            if {"Group": "all"}
+            in make_api_call(
+                self,
+                "DescribeSnapshotAttribute",
+                {
+                    "Attribute": "createVolumePermission",
+                    "SnapshotId": snapshot["SnapshotId"],
+                },
+            )["CreateVolumePermissions"]
+        ]
+    return response
@@ -3,14 +3,20 @@ import re
 from base64 import b64decode
 from datetime import datetime
 
+import botocore
 from boto3 import client, resource, session
 from dateutil.tz import tzutc
 from freezegun import freeze_time
+from mock import patch
 from moto import mock_ec2
 
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.aws.services.ec2.ec2_service import EC2
 from prowler.providers.common.models import Audit_Metadata
+from tests.providers.aws.services.ec2.ec2_moto_helpers import (
+    make_api_call,
+    mock_make_api_call,
+)
 
 AWS_ACCOUNT_NUMBER = "123456789012"
 AWS_REGION = "us-east-1"
@@ -18,6 +24,16 @@ EXAMPLE_AMI_ID = "ami-12c6146b"
 MOCK_DATETIME = datetime(2023, 1, 4, 7, 27, 30, tzinfo=tzutc())
 
 
+def mock_make_api_call_restorable_by_error(self, operation_name, kwarg):
+    if operation_name == "DescribeSnapshots" and "RestorableByUserIds" in kwarg:
+        raise botocore.exceptions.ClientError(
+            {"Error": {"Code": "UnauthorizedOperation", "Message": ""}},
+            operation_name,
+        )
+    return make_api_call(self, operation_name, kwarg)
+
+
+@patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
 class Test_EC2_Service:
     # Mocked Audit Info
     def set_mocked_audit_info(self):
@@ -44,7 +60,9 @@ class Test_EC2_Service:
             audit_metadata=Audit_Metadata(
                 services_scanned=0,
                 expected_checks=[
-                    "ec2_securitygroup_allow_ingress_from_internet_to_any_port"
+                    "ec2_securitygroup_allow_ingress_from_internet_to_any_port",
+                    "ec2_instance_secrets_user_data",
+                    "ec2_ebs_public_snapshot",
                 ],
                 completed_checks=0,
                 audit_progress=0,
@@ -311,6 +329,42 @@ class Test_EC2_Service:
                 assert not snapshot.encrypted
                 assert snapshot.public
 
+    # Test EC2 Get Snapshot Public one by one if they cannot be listed in bulk
+    @mock_ec2
+    def test__get_snapshot_public__fallback(self):
+        ec2_client = client("ec2", region_name=AWS_REGION)
+        ec2_resource = resource("ec2", region_name=AWS_REGION)
+        volume_id = ec2_resource.create_volume(
+            AvailabilityZone="us-east-1a",
+            Size=80,
+            VolumeType="gp2",
+        ).id
+        public_snapshot_id = ec2_client.create_snapshot(
+            VolumeId=volume_id,
+        )["SnapshotId"]
+        private_snapshot_id = ec2_client.create_snapshot(
+            VolumeId=volume_id,
+        )["SnapshotId"]
+        ec2_client.modify_snapshot_attribute(
+            Attribute="createVolumePermission",
+            GroupNames=[
+                "all",
+            ],
+            OperationType="add",
+            SnapshotId=public_snapshot_id,
+        )
+        # EC2 client for this test class
+        audit_info = self.set_mocked_audit_info()
+        with patch(
+            "botocore.client.BaseClient._make_api_call",
+            new=mock_make_api_call_restorable_by_error,
+        ):
+            ec2 = EC2(audit_info)
+
+        snapshots = {snapshot.id: snapshot for snapshot in ec2.snapshots}
+        assert snapshots[public_snapshot_id].public
+        assert not snapshots[private_snapshot_id].public
+
     # Test EC2 Instance User Data
     @mock_ec2
     def test__get_instance_user_data__(self):
@@ -327,6 +381,45 @@ class Test_EC2_Service:
         ec2 = EC2(audit_info)
         assert user_data == b64decode(ec2.instances[0].user_data).decode("utf-8")
 
+    # Test EC2 only gathers the attributes read by the checks to execute
+    @mock_ec2
+    def test__audited_attributes__(self):
+        ec2_resource = resource("ec2", region_name=AWS_REGION)
+        ec2_resource.create_instances(
+            ImageId=EXAMPLE_AMI_ID,
+            MinCount=1,
+            MaxCount=1,
+            UserData="This is some user_data",
+        )
+        volume_id = ec2_resource.create_volume(
+            AvailabilityZone="us-east-1a",
+            Size=80,
+            VolumeType="gp2",
+        ).id
+        ec2_client = client("ec2", region_name=AWS_REGION)
+        snapshot_id = ec2_client.create_snapshot(
+            VolumeId=volume_id,
+        )["SnapshotId"]
+        ec2_client.modify_snapshot_attribute(
+            Attribute="createVolumePermission",
+            GroupNames=[
+                "all",
+            ],
+            OperationType="add",
+            SnapshotId=snapshot_id,
+        )
+        # EC2 client for this test class
+        audit_info = self.set_mocked_audit_info()
+        audit_info.audit_metadata.expected_checks = ["ec2_ami_public"]
+        ec2 = EC2(audit_info)
+
+        assert ec2.audited_attributes == set()
+        assert len(ec2.instances) == 1
+        assert not ec2.instances[0].user_data
+        assert snapshot_id in str(ec2.snapshots)
+        for snapshot in ec2.snapshots:
+            assert not snapshot.public
+
     # Test EC2 Get EBS Encryption by default
     @mock_ec2
     def test__get_ebs_encryption_by_default__(self):
@@ -1,6 +1,11 @@
 import pytest
 
-from prowler.providers.aws.services.ec2.lib.security_groups import _is_cidr_public
+from prowler.providers.aws.services.ec2.lib.security_groups import (
+    _is_cidr_public,
+    check_security_group,
+    check_security_group_exposure,
+    get_security_group_exposure,
+)
 
 
 class Test_security_groups:
@@ -19,3 +24,80 @@ class Test_security_groups:
 
         assert ex.type == ValueError
         assert ex.match(f"{cidr} has host bits set")
+
+    def test__is_cidr_public_memoized(self):
+        _is_cidr_public.cache_clear()
+        cidr = "10.0.0.0/8"
+        assert not _is_cidr_public(cidr)
+        assert not _is_cidr_public(cidr)
+        assert _is_cidr_public.cache_info().hits == 1
+
+    def test_check_security_group_port_range(self):
+        ingress_rule = {
+            "IpProtocol": "tcp",
+            "FromPort": 20,
+            "ToPort": 3389,
+            "IpRanges": [{"CidrIp": "0.0.0.0/0"}],
+            "Ipv6Ranges": [],
+        }
+        assert check_security_group(ingress_rule, "tcp", [22], any_address=True)
+        assert check_security_group(ingress_rule, "tcp", [3389], any_address=True)
+        assert not check_security_group(ingress_rule, "tcp", [5432], any_address=True)
+        assert not check_security_group(ingress_rule, "udp", [22], any_address=True)
+
+    def test_check_security_group_all_ports(self):
+        ingress_rule = {
+            "IpProtocol": "udp",
+            "FromPort": 0,
+            "ToPort": 65535,
+            "IpRanges": [],
+            "Ipv6Ranges": [{"CidrIpv6": "::/0"}],
+        }
+        # All the ports open are public regardless of the protocol
+        assert check_security_group(ingress_rule, "tcp", [22], any_address=True)
+        assert check_security_group(ingress_rule, "-1", any_address=True)
+
+    def test_check_security_group_not_public(self):
+        ingress_rule = {
+            "IpProtocol": "tcp",
+            "FromPort": 22,
+            "ToPort": 22,
+            "IpRanges": [{"CidrIp": "10.0.0.0/8"}],
+            "Ipv6Ranges": [],
+        }
+        assert not check_security_group(ingress_rule, "tcp", [22])
+
+    def test_check_security_group_exposure(self):
+        ingress_rules = [
+            {
+                "IpProtocol": "tcp",
+                "FromPort": 22,
+                "ToPort": 22,
+                "IpRanges": [{"CidrIp": "10.0.0.0/8"}],
+                "Ipv6Ranges": [],
+            },
+            {
+                "IpProtocol": "tcp",
+                "FromPort": 3306,
+                "ToPort": 3306,
+                "IpRanges": [{"CidrIp": "0.0.0.0/0"}],
+                "Ipv6Ranges": [],
+            },
+        ]
+        exposure = get_security_group_exposure(ingress_rules, any_address=True)
+        assert exposure == [("tcp", 3306, 3306)]
+        assert check_security_group_exposure(exposure, "tcp", [3306])
+        assert not check_security_group_exposure(exposure, "tcp", [22])
+
+        all_traffic_exposure = get_security_group_exposure(
+            [
+                {
+                    "IpProtocol": "-1",
+                    "IpRanges": [{"CidrIp": "0.0.0.0/0"}],
+                    "Ipv6Ranges": [],
+                }
+            ],
+            any_address=True,
+        )
+        assert all_traffic_exposure == [("-1", None, None)]
+        assert check_security_group_exposure(all_traffic_exposure, "tcp", [22])
@@ -225,6 +225,10 @@ class Test_ECR_Service:
 
     # Test get image details
     @mock_ecr
+    @patch(
+        "prowler.providers.aws.services.ecr.ecr_service.get_config_var",
+        new=lambda config_var: 0,
+    )
     def test__get_image_details__(self):
         ecr_client = client("ecr", region_name=AWS_REGION)
         ecr_client.create_repository(
@@ -321,6 +325,30 @@ class Test_ECR_Service:
             == 3
         )
 
+    # Test get only the latest image details
+    @mock_ecr
+    @patch(
+        "prowler.providers.aws.services.ecr.ecr_service.get_config_var",
+        new=lambda config_var: None,
+    )
+    def test__get_image_details__latest_image(self):
+        ecr_client = client("ecr", region_name=AWS_REGION)
+        ecr_client.create_repository(
+            repositoryName=repo_name,
+            imageScanningConfiguration={"scanOnPush": True},
+        )
+        audit_info = self.set_mocked_audit_info()
+        ecr = ECR(audit_info)
+        assert ecr.max_images_per_repository == 1
+        assert len(ecr.registries[AWS_REGION].repositories[0].images_details) == 1
+        assert ecr.registries[AWS_REGION].repositories[0].images_details[
+            0
+        ].image_pushed_at == datetime(2023, 1, 2)
+        assert (
+            ecr.registries[AWS_REGION].repositories[0].images_details[0].latest_tag
+            == "test-tag2"
+        )
+
     # Test get ECR Registries Scanning Configuration
     @mock_ecr
     def test__get_registry_scanning_configuration__(self):
@@ -118,6 +118,50 @@ class Test_iam_no_custom_policy_permissive_role_assumption:
                 assert result[0].resource_arn == arn
                 assert result[0].resource_id == policy_name
 
+    @mock_iam
+    def test_policy_allows_permissive_role_assumption_wildcard_role_arn(self):
+        iam_client = client("iam")
+        policy_name = "policy1"
+        policy_document = {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Effect": "Allow",
+                    "Action": "sts:AssumeRole",
+                    "Resource": "arn:aws:iam::*:role/*",
+                },
+            ],
+        }
+        arn = iam_client.create_policy(
+            PolicyName=policy_name, PolicyDocument=dumps(policy_document)
+        )["Policy"]["Arn"]
+
+        from prowler.providers.aws.services.iam.iam_service import IAM
+
+        audit_info = self.set_mocked_audit_info()
+
+        with mock.patch(
+            "prowler.providers.aws.lib.audit_info.audit_info.current_audit_info",
+            new=audit_info,
+        ):
+            with mock.patch(
+                "prowler.providers.aws.services.iam.iam_no_custom_policy_permissive_role_assumption.iam_no_custom_policy_permissive_role_assumption.iam_client",
+                new=IAM(audit_info),
+            ):
+                from prowler.providers.aws.services.iam.iam_no_custom_policy_permissive_role_assumption.iam_no_custom_policy_permissive_role_assumption import (
+                    iam_no_custom_policy_permissive_role_assumption,
+                )
+
+                check = iam_no_custom_policy_permissive_role_assumption()
+                result = check.execute()
+                assert result[0].status == "FAIL"
+                assert search(
+                    f"Custom Policy {policy_name} allows permissive STS Role assumption",
+                    result[0].status_extended,
+                )
+                assert result[0].resource_arn == arn
+                assert result[0].resource_id == policy_name
+
     @mock_iam
     def test_policy_assume_role_not_allow_permissive_role_assumption(self):
         iam_client = client("iam")
@@ -2,6 +2,7 @@ from json import dumps
 
 from boto3 import client, session
 from freezegun import freeze_time
+from mock import patch
 from moto import mock_iam
 
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
@@ -703,6 +704,79 @@ class Test_IAM_Service:
                 assert policy.document["Statement"][0]["Resource"] == "*"
         assert custom_policies == 1
 
+    # Test IAM Get Account Authorization Details
+    @mock_iam
+    def test__get_account_authorization_details__(self):
+        iam_client = client("iam")
+        username = "user1"
+        iam_client.create_user(
+            UserName=username, Tags=[{"Key": "test", "Value": "test"}]
+        )
+        iam_client.put_user_policy(
+            UserName=username,
+            PolicyName="inline-policy",
+            PolicyDocument=dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {"Effect": "Allow", "Action": "s3:*", "Resource": "*"}
+                    ],
+                }
+            ),
+        )
+        group = "test-group"
+        iam_client.create_group(GroupName=group)
+        iam_client.add_user_to_group(GroupName=group, UserName=username)
+        role_name = "test"
+        iam_client.create_role(
+            RoleName=role_name,
+            AssumeRolePolicyDocument=dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": {
+                        "Effect": "Allow",
+                        "Principal": {"AWS": "*"},
+                        "Action": "sts:AssumeRole",
+                    },
+                }
+            ),
+        )
+        policy_document = {
+            "Version": "2012-10-17",
+            "Statement": [
+                {"Effect": "Allow", "Action": "*", "Resource": "*"},
+            ],
+        }
+        policy = iam_client.create_policy(
+            PolicyName="policy1", PolicyDocument=dumps(policy_document)
+        )
+        iam_client.attach_role_policy(
+            RoleName=role_name, PolicyArn=policy["Policy"]["Arn"]
+        )
+        iam_client.attach_group_policy(
+            GroupName=group, PolicyArn=policy["Policy"]["Arn"]
+        )
+
+        audit_info = self.set_mocked_audit_info()
+        with patch(
+            "prowler.providers.aws.services.iam.iam_service.get_config_var",
+            side_effect=lambda variable: variable
+            == "iam_use_account_authorization_details",
+        ):
+            iam = IAM(audit_info)
+
+        assert len(iam.users) == 1
+        assert iam.users[0].inline_policies == ["inline-policy"]
+        assert iam.users[0].tags == [{"Key": "test", "Value": "test"}]
+        assert len(iam.groups) == 1
+        assert [user.name for user in iam.groups[0].users] == [username]
+        assert iam.groups[0].attached_policies[0]["PolicyName"] == "policy1"
+        assert len(iam.roles) == 1
+        assert iam.roles[0].attached_policies[0]["PolicyName"] == "policy1"
+        custom_policies = [policy for policy in iam.policies if policy.type == "Custom"]
+        assert len(custom_policies) == 1
+        assert custom_policies[0].document == policy_document
+
     # Test IAM List SAML Providers
     @mock_iam
     def test__list_saml_providers__(self):
@@ -0,0 +1,191 @@
+from prowler.providers.aws.services.iam.iam_service import Policy
+from prowler.providers.aws.services.iam.lib.policy import (
+    Policy_Analysis,
+    action_covers,
+    actions_overlap,
+    get_policy_analysis,
+)
+
+
+class Test_policy:
+    def test_action_covers(self):
+        assert action_covers("*", "iam:PutUserPolicy")
+        assert action_covers("iam:Put*", "iam:PutUserPolicy")
+        assert action_covers("IAM:put*", "iam:PutUserPolicy")
+        assert action_covers("iam:*", "iam:Put*")
+        assert action_covers("iam:?utUserPolicy", "iam:PutUserPolicy")
+        assert not action_covers("iam:Put*", "iam:*")
+        assert not action_covers("iam:Get*", "iam:PutUserPolicy")
+        # The wildcards of the action are only covered by wildcards
+        assert not action_covers("kms:?", "kms:*")
+        assert not action_covers("kms:?*", "kms:*")
+        assert action_covers("kms:*", "kms:?")
+        assert action_covers("kms:*?", "kms:?*")
+
+    def test_actions_overlap(self):
+        assert actions_overlap("iam:Put*", "iam:*")
+        assert actions_overlap("iam:*", "iam:PutUserPolicy")
+        assert not actions_overlap("iam:Get*", "kms:*")
+
+    def test_policy_analysis_wildcards(self):
+        policy_analysis = Policy_Analysis(
+            {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {"Effect": "Allow", "Action": "iam:Put*", "Resource": "*"},
+                    {
+                        "Effect": "Allow",
+                        "Action": ["kms:*", "s3:GetObject"],
+                        "Resource": "arn:aws:kms:eu-west-1:123456789012:key/test",
+                    },
+                ],
+            }
+        )
+        assert policy_analysis.is_action_allowed("iam:PutUserPolicy")
+        assert policy_analysis.is_action_allowed("iam:PutRolePolicy")
+        assert not policy_analysis.is_action_allowed("iam:*")
+        # Every statement is considered, not only the last one
+        assert policy_analysis.is_action_allowed("kms:*")
+        assert not policy_analysis.is_action_allowed("kms:*", all_resources=True)
+        assert policy_analysis.is_action_allowed(
+            "iam:PutUserPolicy", all_resources=True
+        )
+        assert not policy_analysis.is_action_allowed("*")
+
+    def test_policy_analysis_deny(self):
+        policy_analysis = Policy_Analysis(
+            {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {"Effect": "Allow", "Action": "*", "Resource": "*"},
+                    {"Effect": "Deny", "Action": "iam:Put*", "Resource": "*"},
+                    {"Effect": "Deny", "NotAction": ["iam:*", "s3:*"], "Resource": "*"},
+                ],
+            }
+        )
+        assert not policy_analysis.is_action_allowed("iam:PutUserPolicy")
+        assert not policy_analysis.is_action_allowed("iam:*")
+        assert policy_analysis.is_action_allowed("iam:CreateAccessKey")
+        assert policy_analysis.is_action_allowed("s3:*")
+        assert not policy_analysis.is_action_allowed("kms:*")
+        assert not policy_analysis.is_action_allowed("*")
+
+    def test_policy_analysis_deny_not_all_resources(self):
+        policy_analysis = Policy_Analysis(
+            {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {"Effect": "Allow", "Action": "*", "Resource": "*"},
+                    {
+                        "Effect": "Deny",
+                        "Action": "s3:DeleteBucket",
+                        "Resource": "arn:aws:s3:::prod",
+                    },
+                ],
+            }
+        )
+        assert policy_analysis.is_action_allowed("*", all_resources=True)
+        assert policy_analysis.is_action_allowed("s3:DeleteBucket")
+
+    def test_policy_analysis_deny_with_condition(self):
+        # Force MFA policy
+        policy_analysis = Policy_Analysis(
+            {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {"Effect": "Allow", "Action": "*", "Resource": "*"},
+                    {
+                        "Effect": "Deny",
+                        "NotAction": "iam:ChangePassword",
+                        "Resource": "*",
+                        "Condition": {
+                            "BoolIfExists": {"aws:MultiFactorAuthPresent": "false"}
+                        },
+                    },
+                ],
+            }
+        )
+        assert policy_analysis.is_action_allowed("*", all_resources=True)
+        assert policy_analysis.is_action_allowed("kms:*", all_resources=True)
+
+    def test_policy_analysis_wildcard_resources(self):
+        policy_analysis = Policy_Analysis(
+            {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {
+                        "Effect": "Allow",
+                        "Action": "sts:AssumeRole",
+                        "Resource": "arn:aws:iam::*:role/*",
+                    },
+                    {
+                        "Effect": "Allow",
+                        "Action": "kms:*",
+                        "Resource": ["arn:aws:kms:eu-west-1:123456789012:key/test"],
+                    },
+                ],
+            }
+        )
+        assert policy_analysis.is_action_allowed(
+            "sts:AssumeRole", wildcard_resources=True
+        )
+        assert not policy_analysis.is_action_allowed(
+            "sts:AssumeRole", all_resources=True
+        )
+        assert not policy_analysis.is_action_allowed("kms:*", wildcard_resources=True)
+
+    def test_policy_analysis_allow_not_action(self):
+        policy_analysis = Policy_Analysis(
+            {
+                "Version": "2012-10-17",
+                "Statement": {
+                    "Effect": "Allow",
+                    "NotAction": "iam:*",
+                    "Resource": "*",
+                },
+            }
+        )
+        assert policy_analysis.is_action_allowed("kms:*")
+        assert policy_analysis.is_action_allowed("sts:AssumeRole")
+        assert not policy_analysis.is_action_allowed("iam:PassRole")
+        assert not policy_analysis.is_action_allowed("*")
+
+    def test_policy_analysis_get_allowed_actions(self):
+        policy_analysis = Policy_Analysis(
+            {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {"Effect": "Allow", "Action": "sts:*", "Resource": "*"},
+                    {"Effect": "Allow", "Action": "iam:PassRole", "Resource": "*"},
+                ],
+            }
+        )
+        assert policy_analysis.get_allowed_actions(
+            {"sts:AssumeRole", "sts:*", "iam:PassRole", "iam:*", "ec2:RunInstances"}
+        ) == {"sts:*", "iam:PassRole"}
+
+    def test_policy_analysis_no_document(self):
+        policy_analysis = Policy_Analysis(None)
+        assert not policy_analysis.is_action_allowed("*")
+
+    def test_get_policy_analysis_cache(self):
+        policy = Policy(
+            name="test",
+            arn="arn:aws:iam::123456789012:policy/test",
+            version_id="v1",
+            type="Custom",
+            attached=True,
+            document={
+                "Version": "2012-10-17",
+                "Statement": [{"Effect": "Allow", "Action": "*", "Resource": "*"}],
+            },
+        )
+        policy_analysis = get_policy_analysis(policy)
+        assert get_policy_analysis(policy) is policy_analysis
+        # A new document of the same policy version is analyzed again
+        policy.document = {
+            "Version": "2012-10-17",
+            "Statement": [{"Effect": "Deny", "Action": "*", "Resource": "*"}],
+        }
+        assert get_policy_analysis(policy) is not policy_analysis
+        assert not get_policy_analysis(policy).is_action_allowed("*")
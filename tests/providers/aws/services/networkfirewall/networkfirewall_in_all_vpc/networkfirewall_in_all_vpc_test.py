@@ -2,6 +2,7 @@ from unittest import mock
 
 from boto3 import session
 
+from prowler.providers.aws.aws_provider import build_resource_index
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.aws.services.networkfirewall.networkfirewall_service import (
     Firewall,
@@ -48,6 +49,9 @@ class Test_networkfirewall_in_all_vpc:
         networkfirewall_client = mock.MagicMock
         networkfirewall_client.region = AWS_REGION
         networkfirewall_client.network_firewalls = []
+        networkfirewall_client.network_firewalls_by_vpc_id = build_resource_index(
+            networkfirewall_client.network_firewalls, "vpc_id", grouped=True
+        )
         vpc_client = mock.MagicMock
         vpc_client.region = AWS_REGION
         vpc_client.vpcs = {}
@@ -90,6 +94,9 @@ class Test_networkfirewall_in_all_vpc:
                 encryption_type="CUSTOMER_KMS",
             )
         ]
+        networkfirewall_client.network_firewalls_by_vpc_id = build_resource_index(
+            networkfirewall_client.network_firewalls, "vpc_id", grouped=True
+        )
         vpc_client = mock.MagicMock
         vpc_client.region = AWS_REGION
         vpc_client.vpcs = {
@@ -156,6 +163,9 @@ class Test_networkfirewall_in_all_vpc:
         networkfirewall_client = mock.MagicMock
         networkfirewall_client.region = AWS_REGION
         networkfirewall_client.network_firewalls = []
+        networkfirewall_client.network_firewalls_by_vpc_id = build_resource_index(
+            networkfirewall_client.network_firewalls, "vpc_id", grouped=True
+        )
         vpc_client = mock.MagicMock
         vpc_client.region = AWS_REGION
         vpc_client.vpcs = {
@@ -232,6 +242,9 @@ class Test_networkfirewall_in_all_vpc:
                 encryption_type="CUSTOMER_KMS",
             )
         ]
+        networkfirewall_client.network_firewalls_by_vpc_id = build_resource_index(
+            networkfirewall_client.network_firewalls, "vpc_id", grouped=True
+        )
         vpc_client = mock.MagicMock
         vpc_client.region = AWS_REGION
         vpc_client.vpcs = {
@@ -1,4 +1,5 @@
 import json
+from unittest import mock
 
 from boto3 import client, session
 from moto import mock_s3, mock_s3control
@@ -90,6 +91,46 @@ class Test_S3_Service:
         )
         assert not s3.buckets[0].object_lock
 
+    # Test S3 Get Regional Client
+    @mock_s3
+    def test__get_regional_client__(self):
+        # S3 client for this test class
+        audit_info = self.set_mocked_audit_info()
+        audit_info.audited_regions = [AWS_REGION]
+        s3 = S3(audit_info)
+        assert list(s3.regional_clients) == [AWS_REGION]
+        # The client of a region without it is created once and cached
+        regional_client = s3.__get_regional_client__("eu-west-1")
+        assert regional_client.region == "eu-west-1"
+        assert s3.regional_clients["eu-west-1"] is regional_client
+        assert s3.__get_regional_client__("eu-west-1") is regional_client
+
+    # Test S3 Get Bucket Attributes with a bounded number of workers
+    @mock_s3
+    def test__get_bucket_attributes__(self):
+        # Generate S3 Client
+        s3_client = client("s3")
+        # Create S3 Buckets
+        for index in range(5):
+            s3_client.create_bucket(Bucket=f"test-bucket-{index}")
+            s3_client.put_bucket_versioning(
+                Bucket=f"test-bucket-{index}",
+                VersioningConfiguration={"Status": "Enabled"},
+            )
+        # S3 client for this test class
+        audit_info = self.set_mocked_audit_info()
+        with mock.patch(
+            "prowler.providers.aws.services.s3.s3_service.get_config_var",
+            return_value=2,
+        ):
+            s3 = S3(audit_info)
+        assert s3.max_workers == 2
+        assert len(s3.buckets) == 5
+        for bucket in s3.buckets:
+            assert bucket.versioning is True
+            assert bucket.policy == {}
+            assert bucket.tags == []
+
     # Test S3 Get Bucket Versioning
     @mock_s3
     def test__get_bucket_versioning__(self):
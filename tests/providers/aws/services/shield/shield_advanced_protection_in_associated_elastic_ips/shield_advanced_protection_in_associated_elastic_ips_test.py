@@ -5,6 +5,7 @@ from mock import patch
 from moto import mock_ec2
 from moto.core import DEFAULT_ACCOUNT_ID
 
+from prowler.providers.aws.aws_provider import build_resource_index
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.aws.services.shield.shield_service import Protection
 from prowler.providers.common.models import Audit_Metadata
@@ -106,6 +107,9 @@ class Test_shield_advanced_protection_in_associated_elastic_ips:
                 region=AWS_REGION,
             )
         }
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         from prowler.providers.aws.services.ec2.ec2_service import EC2
 
@@ -150,6 +154,9 @@ class Test_shield_advanced_protection_in_associated_elastic_ips:
         shield_client.enabled = True
         shield_client.region = AWS_REGION
         shield_client.protections = {}
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         from prowler.providers.aws.services.ec2.ec2_service import EC2
 
@@ -194,6 +201,9 @@ class Test_shield_advanced_protection_in_associated_elastic_ips:
         shield_client.enabled = False
         shield_client.region = AWS_REGION
         shield_client.protections = {}
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         from prowler.providers.aws.services.ec2.ec2_service import EC2
 
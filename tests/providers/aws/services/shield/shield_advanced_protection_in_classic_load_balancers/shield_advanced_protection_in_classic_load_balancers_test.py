@@ -4,6 +4,7 @@ from boto3 import client, resource, session
 from moto import mock_ec2, mock_elb
 from moto.core import DEFAULT_ACCOUNT_ID
 
+from prowler.providers.aws.aws_provider import build_resource_index
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.aws.services.shield.shield_service import Protection
 
@@ -102,6 +103,9 @@ class Test_shield_advanced_protection_in_classic_load_balancers:
                 region=AWS_REGION,
             )
         }
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         from prowler.providers.aws.services.elb.elb_service import ELB
 
@@ -161,6 +165,9 @@ class Test_shield_advanced_protection_in_classic_load_balancers:
         shield_client.enabled = True
         shield_client.region = AWS_REGION
         shield_client.protections = {}
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         from prowler.providers.aws.services.elb.elb_service import ELB
 
@@ -220,6 +227,9 @@ class Test_shield_advanced_protection_in_classic_load_balancers:
         shield_client.enabled = False
         shield_client.region = AWS_REGION
         shield_client.protections = {}
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         from prowler.providers.aws.services.elb.elb_service import ELB
 
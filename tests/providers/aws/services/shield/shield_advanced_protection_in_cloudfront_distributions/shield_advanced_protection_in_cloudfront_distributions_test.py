@@ -2,6 +2,7 @@ from unittest import mock
 
 from moto.core import DEFAULT_ACCOUNT_ID
 
+from prowler.providers.aws.aws_provider import build_resource_index
 from prowler.providers.aws.services.cloudfront.cloudfront_service import Distribution
 from prowler.providers.aws.services.shield.shield_service import Protection
 
@@ -59,6 +60,9 @@ class Test_shield_advanced_protection_in_cloudfront_distributions:
                 region=AWS_REGION,
             )
         }
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         with mock.patch(
             "prowler.providers.aws.services.shield.shield_service.Shield",
@@ -103,6 +107,9 @@ class Test_shield_advanced_protection_in_cloudfront_distributions:
         shield_client.enabled = True
         shield_client.region = AWS_REGION
         shield_client.protections = {}
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         with mock.patch(
             "prowler.providers.aws.services.shield.shield_service.Shield",
@@ -147,6 +154,9 @@ class Test_shield_advanced_protection_in_cloudfront_distributions:
         shield_client.enabled = False
         shield_client.region = AWS_REGION
         shield_client.protections = {}
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         with mock.patch(
             "prowler.providers.aws.services.shield.shield_service.Shield",
@@ -2,6 +2,7 @@ from unittest import mock
 
 from moto.core import DEFAULT_ACCOUNT_ID
 
+from prowler.providers.aws.aws_provider import build_resource_index
 from prowler.providers.aws.services.globalaccelerator.globalaccelerator_service import (
     Accelerator,
 )
@@ -63,6 +64,9 @@ class Test_shield_advanced_protection_in_global_accelerators:
                 region=AWS_REGION,
             )
         }
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         with mock.patch(
             "prowler.providers.aws.services.shield.shield_service.Shield",
@@ -109,6 +113,9 @@ class Test_shield_advanced_protection_in_global_accelerators:
         shield_client.enabled = True
         shield_client.region = AWS_REGION
         shield_client.protections = {}
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         with mock.patch(
             "prowler.providers.aws.services.shield.shield_service.Shield",
@@ -155,6 +162,9 @@ class Test_shield_advanced_protection_in_global_accelerators:
         shield_client.enabled = False
         shield_client.region = AWS_REGION
         shield_client.protections = {}
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         with mock.patch(
             "prowler.providers.aws.services.shield.shield_service.Shield",
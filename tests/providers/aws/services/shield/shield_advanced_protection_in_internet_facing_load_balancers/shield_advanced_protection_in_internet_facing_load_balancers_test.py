@@ -5,6 +5,7 @@ from mock import patch
 from moto import mock_ec2, mock_elbv2
 from moto.core import DEFAULT_ACCOUNT_ID as AWS_ACCOUNT_NUMBER
 
+from prowler.providers.aws.aws_provider import build_resource_index
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.aws.services.shield.shield_service import Protection
 
@@ -123,6 +124,9 @@ class Test_shield_advanced_protection_in_internet_facing_load_balancers:
                 region=AWS_REGION,
             )
         }
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         from prowler.providers.aws.services.elbv2.elbv2_service import ELBv2
 
@@ -199,6 +203,9 @@ class Test_shield_advanced_protection_in_internet_facing_load_balancers:
                 region=AWS_REGION,
             )
         }
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         from prowler.providers.aws.services.elbv2.elbv2_service import ELBv2
 
@@ -254,6 +261,9 @@ class Test_shield_advanced_protection_in_internet_facing_load_balancers:
         shield_client.enabled = True
         shield_client.region = AWS_REGION
         shield_client.protections = {}
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         from prowler.providers.aws.services.elbv2.elbv2_service import ELBv2
 
@@ -317,6 +327,9 @@ class Test_shield_advanced_protection_in_internet_facing_load_balancers:
         shield_client.enabled = False
         shield_client.region = AWS_REGION
         shield_client.protections = {}
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         from prowler.providers.aws.services.elbv2.elbv2_service import ELBv2
 
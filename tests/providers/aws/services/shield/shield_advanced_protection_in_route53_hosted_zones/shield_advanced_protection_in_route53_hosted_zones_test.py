@@ -1,5 +1,6 @@
 from unittest import mock
 
+from prowler.providers.aws.aws_provider import build_resource_index
 from prowler.providers.aws.services.route53.route53_service import HostedZone
 from prowler.providers.aws.services.shield.shield_service import Protection
 
@@ -62,6 +63,9 @@ class Test_shield_advanced_protection_in_route53_hosted_zones:
                 region=AWS_REGION,
             )
         }
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         with mock.patch(
             "prowler.providers.aws.services.shield.shield_service.Shield",
@@ -111,6 +115,9 @@ class Test_shield_advanced_protection_in_route53_hosted_zones:
         shield_client.enabled = True
         shield_client.region = AWS_REGION
         shield_client.protections = {}
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         with mock.patch(
             "prowler.providers.aws.services.shield.shield_service.Shield",
@@ -160,6 +167,9 @@ class Test_shield_advanced_protection_in_route53_hosted_zones:
         shield_client.enabled = False
         shield_client.region = AWS_REGION
         shield_client.protections = {}
+        shield_client.protections_by_resource_arn = build_resource_index(
+            shield_client.protections, "resource_arn"
+        )
 
         with mock.patch(
             "prowler.providers.aws.services.shield.shield_service.Shield",
@@ -0,0 +1,55 @@
+from unittest import mock
+
+from azure.core.exceptions import HttpResponseError
+
+from prowler.providers.azure.azure_provider import Azure_Calls_Executor, get_retry_after
+
+
+def throttling_error(retry_after=None):
+    response = mock.MagicMock()
+    response.status_code = 429
+    response.headers = {"Retry-After": retry_after} if retry_after else {}
+    return HttpResponseError(message="Too Many Requests", response=response)
+
+
+class Test_Azure_Provider:
+    def test_get_retry_after(self):
+        assert get_retry_after(Exception("not throttled")) is None
+        assert get_retry_after(throttling_error("3")) == 3
+        assert get_retry_after(throttling_error("300"), max_delay=60) == 60
+        assert 0 <= get_retry_after(throttling_error(), attempt=2) <= 4
+
+    @mock.patch("prowler.providers.azure.azure_provider.time.sleep")
+    def test_azure_calls_executor(self, sleep):
+        executor = Azure_Calls_Executor(max_workers=4)
+        attempts = {}
+
+        def call(subscription):
+            attempts[subscription] = attempts.get(subscription, 0) + 1
+            if subscription == "throttled" and attempts[subscription] < 3:
+                raise throttling_error("2")
+            if subscription == "failed":
+                raise Exception("Forbidden")
+            # Nested calls run inline in the same worker
+            return executor.threading_call(lambda item: item * 2, [subscription])
+
+        results = executor.threading_call(call, ["sub-1", "throttled", "failed"])
+
+        assert list(results) == ["sub-1", "throttled"]
+        assert results["sub-1"] == {"sub-1": "sub-1sub-1"}
+        assert results["throttled"] == {"throttled": "throttledthrottled"}
+        assert attempts == {"sub-1": 1, "throttled": 3, "failed": 1}
+        sleep.assert_has_calls([mock.call(2), mock.call(2)])
+
+    @mock.patch("prowler.providers.azure.azure_provider.time.sleep")
+    def test_azure_calls_executor_max_attempts(self, sleep):
+        executor = Azure_Calls_Executor(max_workers=2, max_attempts=3)
+        attempts = []
+
+        def call(subscription):
+            attempts.append(subscription)
+            raise throttling_error("1")
+
+        assert executor.threading_call(call, ["sub-1"]) == {}
+        assert len(attempts) == 3
+        assert sleep.call_count == 2
@@ -0,0 +1,238 @@
+import os
+import threading
+import time
+from unittest import mock
+
+import requests
+
+from prowler.providers.gcp.gcp_provider import (
+    GCP_Calls_Executor,
+    Thread_Local_Client,
+    get_discovery_document,
+    get_request_batches,
+    googleapiclient_version,
+)
+
+
+class Batch_HTTP_Request:
+    """Mock of the googleapiclient BatchHttpRequest answering the requests in reverse order"""
+
+    def __init__(self, callback, batches):
+        self.callback = callback
+        self.requests = []
+        batches.append(self.requests)
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in reversed(self.requests):
+            if request == "failed":
+                self.callback(request_id, None, Exception("Forbidden"))
+            else:
+                self.callback(request_id, {"name": request}, None)
+
+
+def mock_batch_client(batch_size, batches, batch_requests=True):
+    with mock.patch(
+        "prowler.providers.gcp.gcp_provider.get_discovery_document"
+    ), mock.patch(
+        "prowler.providers.gcp.gcp_provider.discovery.build_from_document"
+    ) as build_from_document:
+        build_from_document.return_value.new_batch_http_request.side_effect = (
+            lambda callback: Batch_HTTP_Request(callback, batches)
+        )
+        return Thread_Local_Client(
+            "compute",
+            "v1",
+            credentials=None,
+            batch_requests=batch_requests,
+            batch_size=batch_size,
+        )
+
+
+class Test_GCP_Provider:
+    def test_gcp_calls_executor_merges_results_in_order(self):
+        executor = GCP_Calls_Executor(max_workers=4)
+        release_first_call = threading.Event()
+
+        def call(project_id):
+            # The first call ends last
+            if project_id == "project-1":
+                release_first_call.wait(5)
+            elif project_id == "project-3":
+                release_first_call.set()
+            if project_id == "failed":
+                raise Exception("Forbidden")
+            return [f"{project_id}-a", f"{project_id}-b"] if project_id else []
+
+        assert executor.threading_call(
+            call, ["project-1", "failed", "project-2", "", "project-3"]
+        ) == [
+            "project-1-a",
+            "project-1-b",
+            "project-2-a",
+            "project-2-b",
+            "project-3-a",
+            "project-3-b",
+        ]
+
+    def test_gcp_calls_executor_nested_calls_inline(self):
+        # A single worker would wait forever on the nested calls if they were queued
+        executor = GCP_Calls_Executor(max_workers=1)
+        calling_threads = []
+
+        def get_zone_resources(zone):
+            calling_threads.append(threading.current_thread())
+            return [zone]
+
+        def get_project_resources(project_id):
+            worker = threading.current_thread()
+            zones = executor.threading_call(
+                get_zone_resources, [f"{project_id}-zone-a", f"{project_id}-zone-b"]
+            )
+            assert calling_threads[-2:] == [worker, worker]
+            return zones
+
+        assert executor.threading_call(
+            get_project_resources, ["project-1", "project-2"]
+        ) == [
+            "project-1-zone-a",
+            "project-1-zone-b",
+            "project-2-zone-a",
+            "project-2-zone-b",
+        ]
+        assert threading.current_thread() not in calling_threads
+
+    @mock.patch("prowler.providers.gcp.gcp_provider.get_discovery_document")
+    @mock.patch("prowler.providers.gcp.gcp_provider.discovery.build_from_document")
+    def test_thread_local_client(self, build_from_document, _):
+        build_from_document.side_effect = lambda *args, **kwargs: mock.MagicMock()
+        client = Thread_Local_Client("compute", "v1", credentials=None)
+        main_client = client.get_client()
+        assert client.get_client() is main_client
+
+        thread_clients = {}
+
+        def get_thread_client(thread_id):
+            thread_clients[thread_id] = (client.get_client(), client.get_client())
+
+        threads = [
+            threading.Thread(target=get_thread_client, args=(thread_id,))
+            for thread_id in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # One client per thread, reused by the calls of the thread
+        for first_client, second_client in thread_clients.values():
+            assert first_client is second_client
+        clients = {id(main_client)} | {
+            id(thread_client) for thread_client, _ in thread_clients.values()
+        }
+        assert len(clients) == 4
+        assert build_from_document.call_count == 4
+        # The attributes are forwarded to the client of the calling thread
+        assert client.instances is main_client.instances
+
+    def test_execute_requests_batches(self):
+        batches = []
+        client = mock_batch_client(2, batches)
+        responses = client.execute_requests(
+            ["project-1", "failed", "project-2", "project-3", "project-4"]
+        )
+
+        # The requests are chunked at the batch size
+        assert [[request for _, request in batch] for batch in batches] == [
+            ["project-1", "failed"],
+            ["project-2", "project-3"],
+            ["project-4"],
+        ]
+        # The responses are returned in the requests order, with the exception of each failed request
+        assert responses[0] == {"name": "project-1"}
+        assert isinstance(responses[1], Exception)
+        assert responses[2:] == [
+            {"name": "project-2"},
+            {"name": "project-3"},
+            {"name": "project-4"},
+        ]
+
+    def test_execute_requests_without_batches(self):
+        batches = []
+        client = mock_batch_client(2, batches, batch_requests=False)
+        failed_request = mock.MagicMock()
+        failed_request.execute.side_effect = Exception("Forbidden")
+        request = mock.MagicMock()
+        request.execute.return_value = {"name": "project-1"}
+
+        responses = client.execute_requests([failed_request, request])
+
+        assert not batches
+        assert isinstance(responses[0], Exception)
+        assert responses[1] == {"name": "project-1"}
+
+    def test_get_request_batches(self):
+        batches = []
+        client = mock_batch_client(2, batches)
+        assert get_request_batches(client, ["p1", "p2", "p3"]) == [
+            ["p1", "p2"],
+            ["p3"],
+        ]
+        client.batch_requests = False
+        assert get_request_batches(client, ["p1", "p2"]) == [["p1"], ["p2"]]
+        assert get_request_batches(None, ["p1"]) == [["p1"]]
+
+    def test_get_discovery_document(self, tmp_path):
+        def mock_request_get(url, timeout):
+            response = mock.MagicMock()
+            response.status_code = 200
+            response.text = f'{{"downloaded": "{url}"}}'
+            return response
+
+        cache_file = tmp_path / googleapiclient_version / "essentialcontacts.v1.json"
+        with mock.patch(
+            "prowler.providers.gcp.gcp_provider.gcp_discovery_cache_directory",
+            str(tmp_path),
+        ), mock.patch(
+            "prowler.providers.gcp.gcp_provider.get_static_doc",
+            side_effect=lambda service, api_version: '{"bundled": true}'
+            if service == "compute"
+            else None,
+        ), mock.patch(
+            "prowler.providers.gcp.gcp_provider.requests.get",
+            side_effect=mock_request_get,
+        ) as request_get:
+            # The documents bundled with googleapiclient are used first
+            get_discovery_document.cache_clear()
+            assert get_discovery_document("compute", "v1") == '{"bundled": true}'
+            assert not request_get.called
+
+            # Then the discovery service, storing the document in the cache per googleapiclient version
+            document = get_discovery_document("essentialcontacts", "v1")
+            assert "essentialcontacts" in document
+            assert request_get.call_count == 1
+            assert cache_file.read_text() == document
+
+            # Then the cache in the next executions
+            get_discovery_document.cache_clear()
+            cache_file.write_text('{"cached": true}')
+            assert (
+                get_discovery_document("essentialcontacts", "v1") == '{"cached": true}'
+            )
+            assert request_get.call_count == 1
+
+            # Until the cached document expires
+            get_discovery_document.cache_clear()
+            expired = time.time() - 8 * 24 * 60 * 60
+            os.utime(cache_file, (expired, expired))
+            assert get_discovery_document("essentialcontacts", "v1") == document
+            assert request_get.call_count == 2
+
+            # The expired document is used if the discovery service cannot be reached
+            get_discovery_document.cache_clear()
+            os.utime(cache_file, (expired, expired))
+            request_get.side_effect = requests.ConnectionError("No network")
+            assert get_discovery_document("essentialcontacts", "v1") == document
+        get_discovery_document.cache_clear()
@@ -0,0 +1,46 @@
+from unittest import mock
+
+from prowler.providers.gcp.services.cloudresourcemanager.cloudresourcemanager_service import (
+    CloudResourceManager,
+)
+
+GCP_PROJECT_IDS = ["project-1", "project-2", "project-3", "project-4"]
+
+
+def mock_generate_client(service, api_version, audit_info):
+    client = mock.MagicMock()
+    client.batch_requests = True
+    client.batch_size = 100
+    client.execute_requests.side_effect = lambda requests: [
+        # The policy of a project without bindings
+        {"auditConfigs": [{"service": "allServices"}]},
+        Exception("Forbidden"),
+        {"bindings": [{"role": "roles/owner", "members": ["user:test@test.com"]}]},
+        {"bindings": [{"role": "roles/viewer", "members": ["user:test@test.com"]}]},
+    ][: len(requests)]
+    client.organizations().search().execute.return_value = {"organizations": []}
+    return client
+
+
+@mock.patch(
+    "prowler.providers.gcp.services.cloudresourcemanager.cloudresourcemanager_service.generate_client",
+    new=mock_generate_client,
+)
+class Test_CloudResourceManager_Service:
+    def test__get_iam_policy__errors_per_project(self):
+        audit_info = mock.MagicMock()
+        audit_info.project_ids = GCP_PROJECT_IDS
+        cloudresourcemanager = CloudResourceManager(audit_info)
+
+        # The errors of a project do not drop the rest of the batch
+        assert [project.id for project in cloudresourcemanager.projects] == [
+            "project-1",
+            "project-3",
+            "project-4",
+        ]
+        assert cloudresourcemanager.projects[0].audit_logging
+        assert not cloudresourcemanager.projects[1].audit_logging
+        assert [
+            (binding.project_id, binding.role)
+            for binding in cloudresourcemanager.bindings
+        ] == [("project-3", "roles/owner"), ("project-4", "roles/viewer")]